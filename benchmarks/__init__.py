@@ -0,0 +1,11 @@
+"""Performance benchmarks (micro and macro) with JSON reports and baseline comparison.
+
+    python -m benchmarks                       # run everything, print a table
+    python -m benchmarks "scoring.*" --json out.json
+    python -m benchmarks --save-baseline       # record benchmarks/baseline.json on this machine
+    python -m benchmarks --compare             # later: compare with it (exit 1 on regressions)
+
+Baselines are machine specific, so none is committed.
+
+See benchmarks.harness for the registry and the report format.
+"""
@@ -0,0 +1,77 @@
+"""Command line entry point.
+
+    python -m benchmarks [pattern ...] [--json out.json] [--compare baseline.json]
+
+Patterns are globs over benchmark names ("scoring.*", "frame.*") or a group name
+("micro", "macro"). With --compare the exit status is 1 when any benchmark regressed by
+more than --threshold, and 2 when there is no baseline to compare with. No baseline is
+shipped: record one with --save-baseline on the machine that runs the comparison.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+# Frames render without a window; must be set before pygame initialises its display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from benchmarks.harness import STATS, Report, compare, format_time, registered, run_benchmarks  # noqa: E402
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the Farkle performance benchmarks.")
+    parser.add_argument("patterns", nargs="*", help="benchmark name globs or group names (default: all)")
+    parser.add_argument("--list", action="store_true", help="list matching benchmarks and exit")
+    parser.add_argument("--repeat", type=int, default=None, help="samples per benchmark (default: per benchmark)")
+    parser.add_argument("--min-time", type=float, default=None, help="minimum seconds per sample")
+    parser.add_argument("--quick", action="store_true", help="one short sample each (smoke test, not for baselines)")
+    parser.add_argument("--json", metavar="PATH", help="write the report as JSON ('-' for stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", nargs="?", const=str(BASELINE),
+                        help=f"compare with a stored report (default: {BASELINE.name})")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before a regression (fraction)")
+    parser.add_argument("--stat", choices=STATS, default="min", help="statistic to report and compare (min is the least noisy)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"store this run as {BASELINE.name}")
+    args = parser.parse_args(argv)
+    if args.compare and not Path(args.compare).is_file():
+        # Fail before spending minutes on a run that cannot be judged
+        print(f"no baseline at {args.compare}; run with --save-baseline first", file=sys.stderr)
+        return 2
+
+    if args.list:
+        for bench in registered(args.patterns):
+            print(f"{bench.group:6s} {bench.name}")
+        return 0
+    repeat, min_time = args.repeat, args.min_time
+    if args.quick:
+        repeat, min_time = 1, 0.0
+
+    to_stdout = args.json == "-"
+    log = sys.stderr if to_stdout else sys.stdout
+
+    def progress(result) -> None:
+        print(f"{result.name:44s} {format_time(result.stat(args.stat)):>12s}", file=log, flush=True)
+
+    report = run_benchmarks(args.patterns, repeat=repeat, min_time=min_time, on_result=progress)
+    if args.json:
+        if to_stdout:
+            json.dump(report.to_dict(), sys.stdout, indent=2)
+            print()
+        else:
+            report.save(args.json)
+    if args.save_baseline:
+        report.save(BASELINE)
+        print(f"baseline written to {BASELINE}", file=log)
+    if args.compare:
+        comparison = compare(report, Report.load(args.compare), threshold=args.threshold, stat=args.stat)
+        print(file=log)
+        print(comparison.format(), file=log)
+        return 1 if comparison.regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
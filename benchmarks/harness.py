@@ -0,0 +1,284 @@
+"""Benchmark registry, timing loop, JSON reports and baseline comparison.
+
+A benchmark is a factory registered with ``@benchmark(name, ops=...)``: it does its
+setup and returns a zero-argument callable performing ``ops`` operations on fixed,
+seeded inputs. The harness calls the factory once, calibrates how many calls make a
+sample of at least ``min_time`` seconds, then takes ``repeat`` samples with the garbage
+collector paused (like timeit). Times are reported per operation.
+
+Reports are plain JSON (see Report.to_dict) so one can be stored as a baseline and later
+runs checked against it with compare(). Baselines are machine specific and are not
+committed; record one on the machine that will run the comparison.
+
+Usage:
+    report = run_benchmarks(["scoring.*"])
+    compare(report, Report.load("baseline.json")).regressions
+"""
+from __future__ import annotations
+import fnmatch
+import gc
+import json
+import platform
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+Factory = Callable[[], Callable[[], object]]
+
+STATS = ("min", "median", "mean")
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    group: str
+    factory: Factory
+    # Operations performed by one call of the timed callable
+    ops: int = 1
+    repeat: int = 5
+    min_time: float = 0.1
+
+
+_registry: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, *, group: str = "micro", ops: int = 1, repeat: int = 5,
+              min_time: float = 0.1) -> Callable[[Factory], Factory]:
+    """Register a benchmark factory under ``name`` (unique, dotted: area.subject[variant])."""
+    def register(factory: Factory) -> Factory:
+        if name in _registry:
+            raise ValueError(f"duplicate benchmark {name!r}")
+        _registry[name] = Benchmark(name, group, factory, ops, repeat, min_time)
+        return factory
+    return register
+
+
+def registered(patterns: Sequence[str] = ()) -> List[Benchmark]:
+    """Registered benchmarks (micro and macro) matching any glob in ``patterns``, or all."""
+    from benchmarks import micro, macro  # noqa: F401  (registers on import)
+    found = list(_registry.values())
+    if patterns:
+        found = [b for b in found if any(fnmatch.fnmatchcase(b.name, p) or b.group == p for p in patterns)]
+    return found
+
+
+@dataclass
+class BenchResult:
+    name: str
+    group: str
+    ops: int
+    loops: int
+    # Seconds per operation, one entry per sample
+    samples: List[float]
+
+    def stat(self, name: str) -> float:
+        if name == "min":
+            return min(self.samples)
+        if name == "median":
+            return statistics.median(self.samples)
+        if name == "mean":
+            return statistics.fmean(self.samples)
+        raise ValueError(f"unknown statistic {name!r} (use one of {', '.join(STATS)})")
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "group": self.group,
+            "ops": self.ops,
+            "loops": self.loops,
+            "samples": self.samples,
+            **{s: self.stat(s) for s in STATS},
+            "stdev": self.stdev,
+        }
+
+    @classmethod
+    def from_dict(cls, name: str, data: dict) -> "BenchResult":
+        return cls(name, data.get("group", "micro"), int(data.get("ops", 1)), int(data.get("loops", 1)),
+                   [float(s) for s in data["samples"]])
+
+
+def _time(call: Callable[[], object], loops: int) -> float:
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            call()
+        return time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def measure(bench: Benchmark, repeat: Optional[int] = None, min_time: Optional[float] = None) -> BenchResult:
+    """Time ``bench``: calibrate loops per sample, then take ``repeat`` samples."""
+    repeat = bench.repeat if repeat is None else repeat
+    min_time = bench.min_time if min_time is None else min_time
+    call = bench.factory()
+    gc.collect()
+    # Calibration doubles as warm-up (caches, lazily built tables, imports)
+    loops = 1
+    while True:
+        elapsed = _time(call, loops)
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops = loops * 2 if elapsed <= 0 else max(loops * 2, int(loops * min_time / elapsed * 1.1))
+    samples = [_time(call, loops) / (loops * bench.ops) for _ in range(max(1, repeat))]
+    return BenchResult(bench.name, bench.group, bench.ops, loops, samples)
+
+
+def environment() -> dict:
+    try:
+        import pygame
+        pygame_version = pygame.version.ver
+    except Exception:
+        pygame_version = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "pygame": pygame_version,
+    }
+
+
+@dataclass
+class Report:
+    results: Dict[str, BenchResult]
+    env: dict = field(default_factory=environment)
+    created: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        return {
+            "created": self.created,
+            "environment": self.env,
+            "unit": "seconds per operation",
+            "benchmarks": {name: r.to_dict() for name, r in self.results.items()},
+        }
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Report":
+        results = {name: BenchResult.from_dict(name, r) for name, r in data.get("benchmarks", {}).items()}
+        return cls(results, data.get("environment", {}), data.get("created", 0.0))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Report":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def format(self, stat: str = "min") -> str:
+        lines = [f"{'benchmark':44s} {stat:>12s} {'stdev':>10s} {'loops':>7s}"]
+        for r in self.results.values():
+            lines.append(f"{r.name:44s} {format_time(r.stat(stat)):>12s} {format_time(r.stdev):>10s} {r.loops:7d}")
+        return "\n".join(lines)
+
+
+def run_benchmarks(patterns: Sequence[str] = (), *, repeat: Optional[int] = None, min_time: Optional[float] = None,
+                   on_result: Optional[Callable[[BenchResult], None]] = None) -> Report:
+    """Measure every registered benchmark matching ``patterns`` (all when empty)."""
+    results: Dict[str, BenchResult] = {}
+    for bench in registered(patterns):
+        result = measure(bench, repeat, min_time)
+        results[bench.name] = result
+        if on_result is not None:
+            on_result(result)
+    return Report(results)
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+# --- baseline comparison -------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Delta:
+    name: str
+    baseline: Optional[float]
+    current: float
+    # "regressed", "improved", "same" or "new" (not in the baseline)
+    status: str
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline:
+            return None
+        return self.current / self.baseline
+
+
+@dataclass
+class Comparison:
+    stat: str
+    threshold: float
+    deltas: List[Delta]
+    # Baseline and current environments differ (numbers are then only indicative)
+    env_mismatch: List[str]
+
+    @property
+    def regressions(self) -> List[Delta]:
+        return [d for d in self.deltas if d.status == "regressed"]
+
+    def to_dict(self) -> dict:
+        return {
+            "stat": self.stat,
+            "threshold": self.threshold,
+            "env_mismatch": self.env_mismatch,
+            "deltas": [{"name": d.name, "baseline": d.baseline, "current": d.current, "ratio": d.ratio, "status": d.status}
+                       for d in self.deltas],
+        }
+
+    def format(self) -> str:
+        lines = [f"{'benchmark':44s} {'baseline':>12s} {'current':>12s} {'ratio':>7s}  status"]
+        for d in self.deltas:
+            base = format_time(d.baseline) if d.baseline is not None else "-"
+            cur = format_time(d.current)
+            ratio = f"{d.ratio:.2f}x" if d.ratio is not None else "-"
+            lines.append(f"{d.name:44s} {base:>12s} {cur:>12s} {ratio:>7s}  {d.status}")
+        if self.env_mismatch:
+            lines.append(f"note: environment differs from the baseline ({', '.join(self.env_mismatch)})")
+        regressed = len(self.regressions)
+        lines.append(f"{regressed} regression(s) beyond {self.threshold:.0%} (current min vs baseline max)")
+        return "\n".join(lines)
+
+
+def compare(current: Report, baseline: Report, *, threshold: float = 0.10, stat: str = "min") -> Comparison:
+    """Compare ``current`` with ``baseline``, reporting ``stat`` for both.
+
+    The verdict is noise aware: a benchmark regresses only when its fastest current
+    sample is more than ``threshold`` (a fraction) slower than the baseline's slowest
+    sample, and improves only when its slowest current sample beats the baseline's
+    fastest by as much. Overlapping sample ranges count as "same".
+    """
+    deltas = []
+    names = list(baseline.results) + [n for n in current.results if n not in baseline.results]
+    for name in names:
+        base = baseline.results.get(name)
+        cur = current.results.get(name)
+        if base is None:
+            deltas.append(Delta(name, None, cur.stat(stat), "new"))
+            continue
+        if cur is None:
+            # Filtered runs cover part of the baseline; only compare what was run
+            continue
+        b, c = base.stat(stat), cur.stat(stat)
+        if min(cur.samples) > max(base.samples) * (1 + threshold):
+            status = "regressed"
+        elif max(cur.samples) < min(base.samples) * (1 - threshold):
+            status = "improved"
+        else:
+            status = "same"
+        deltas.append(Delta(name, b, c, status))
+    mismatch = [k for k in ("python", "implementation", "machine", "pygame")
+                if baseline.env.get(k) != current.env.get(k)]
+    return Comparison(stat, threshold, deltas, mismatch)
+
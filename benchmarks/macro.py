@@ -0,0 +1,141 @@
+"""Macrobenchmarks: headless turns and runs, and frames rendered by the real UI.
+
+Turns and runs are played by ``farkle.sim.runner.solver_policy`` from fixed seeds.
+Frames go through GameScreen.draw and display.flip like App.run, with the UI and
+persistence phases deferred to the end of the frame; set SDL_VIDEODRIVER=dummy (the
+benchmark CLI does) to render without a window.
+"""
+from __future__ import annotations
+import contextlib
+import io
+
+from benchmarks.harness import benchmark
+
+SEEDS = (11, 12, 13)
+TURNS = 10
+
+
+@benchmark("game.headless", group="macro", ops=len(SEEDS))
+def headless_game():
+    from farkle.game import Game
+
+    def run():
+        for seed in SEEDS:
+            Game.headless(seed)
+    return run
+
+
+class _TurnPlayer:
+    """Plays whole turns (shops included) on one headless game, starting the next
+    seed's game when a run ends."""
+
+    def __init__(self, seed: int = 21):
+        self.seed = seed
+        self.game = None
+        self._new_game()
+
+    def _new_game(self) -> None:
+        from farkle.game import Game
+        from farkle.sim.runner import _share_solver
+        self.game = Game.headless(self.seed, skip_god_selection=False)
+        _share_solver(self.game)
+        self.seed += 1
+
+    def turns_played(self) -> int:
+        return self.game.statistics_tracker.get_statistics().turns_played
+
+    def play(self, turns: int) -> None:
+        from farkle.sim.runner import solver_policy
+        played = 0
+        while played < turns:
+            game = self.game
+            start = self.turns_played()
+            while self.turns_played() == start:
+                if game.level_state.failed or game.state_manager.get_state() == game.state_manager.state.GAME_OVER \
+                        or not solver_policy(game):
+                    self._new_game()
+                    break
+            else:
+                played += 1
+
+
+@benchmark("turn.headless", group="macro", ops=TURNS)
+def headless_turn():
+    player = _TurnPlayer()
+
+    def run():
+        player.play(TURNS)
+    return run
+
+
+@benchmark("run.headless[10 levels]", group="macro", ops=len(SEEDS), repeat=3)
+def headless_run():
+    from farkle.sim.runner import play_run, solver_policy
+
+    def run():
+        for seed in SEEDS:
+            play_run(seed, solver_policy, max_levels=10)
+    return run
+
+
+FRAMES = 30
+
+
+def _ui_game(seed: int = 31):
+    import pygame
+    from farkle.core.event_listener import EventPhase
+    from farkle.game import Game
+    from farkle.ui.screens.game_screen import GameScreen
+    from farkle.ui.settings import HEIGHT, WIDTH
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    font = pygame.font.Font(None, 24)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = Game(screen, font, pygame.time.Clock(), rng_seed=seed, skip_god_selection=True)
+    game.event_listener.set_deferred_phases((EventPhase.UI, EventPhase.PERSISTENCE))
+    return game, GameScreen(game), screen
+
+
+def _frame(game, view, screen) -> None:
+    import pygame
+    game.event_listener.flush_deferred()
+    view.draw(screen)
+    pygame.display.flip()
+
+
+@benchmark("frame.idle", group="macro", ops=FRAMES)
+def frame_idle():
+    """Redraw a rolled board with nothing changing between frames."""
+    from farkle.core.actions import handle_roll
+    game, view, screen = _ui_game()
+    handle_roll(game)
+
+    def run():
+        for _ in range(FRAMES):
+            _frame(game, view, screen)
+    return run
+
+
+@benchmark("frame.play", group="macro", ops=FRAMES)
+def frame_play():
+    """One solver action per frame, so sprites, goals and overlays keep changing."""
+    from farkle.sim.runner import _share_solver, solver_policy
+    state = {}
+
+    def restart():
+        state["game"], state["view"], state["screen"] = _ui_game(state.get("seed", 31))
+        state["seed"] = state.get("seed", 31) + 1
+        _share_solver(state["game"])
+
+    restart()
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(FRAMES):
+                game = state["game"]
+                if game.level_state.failed or not solver_policy(game):
+                    restart()
+                    game = state["game"]
+                _frame(game, state["view"], state["screen"])
+    return run
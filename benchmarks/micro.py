@@ -0,0 +1,268 @@
+"""Microbenchmarks: scoring, previews, the event bus, dice, levels and saves.
+
+Inputs are drawn from fixed seeds so every run times the same work. "warm" variants
+hit the caches the game relies on (histogram table, selection LRU, preview LRU);
+"cold" variants clear them first so the underlying computation is timed as well.
+"""
+from __future__ import annotations
+import os
+import random
+from typing import List, Tuple
+
+from benchmarks.harness import benchmark
+from farkle.core.event_listener import EventListener, EventPhase
+from farkle.core.game_event import GameEvent, GameEventType
+from farkle.level.level import DEFAULT_PROGRESSION, Level
+from farkle.scoring.score_modifiers import FlatRuleBonus, GlobalPartsMultiplier, RuleSpecificMultiplier
+from farkle.scoring.scoring import create_default_rules
+
+ROLLS = 1000
+
+
+def _rolls(seed: int = 1, count: int = ROLLS) -> List[List[int]]:
+    rng = random.Random(seed)
+    return [[rng.randint(1, 6) for _ in range(rng.randint(1, 6))] for _ in range(count)]
+
+
+def _headless(seed: int = 1):
+    from farkle.game import Game
+    return Game.headless(seed)
+
+
+# --- scoring -------------------------------------------------------------------------
+
+@benchmark("scoring.evaluate[warm]", ops=ROLLS)
+def evaluate_warm():
+    rules = create_default_rules()
+    rolls = _rolls()
+    evaluate = rules.evaluate
+
+    def run():
+        for dice in rolls:
+            evaluate(dice)
+    return run
+
+
+@benchmark("scoring.evaluate[cold]", ops=ROLLS)
+def evaluate_cold():
+    rules = create_default_rules()
+    rolls = _rolls()
+
+    def run():
+        # Dropping the histogram table makes every distinct histogram a solver call again
+        rules._invalidate()
+        for dice in rolls:
+            rules.evaluate(dice)
+    return run
+
+
+def _selections(seed: int = 2) -> List[List[int]]:
+    # What players select: the scoring dice of a roll, sometimes plus a stray die
+    rules = create_default_rules()
+    rng = random.Random(seed)
+    out = []
+    for dice in _rolls(seed):
+        _, used, _ = rules.evaluate(dice)
+        selection = [dice[i] for i in used] or dice[:1]
+        if rng.random() < 0.3:
+            selection.append(rng.randint(1, 6))
+        out.append(selection)
+    return out
+
+
+@benchmark("scoring.selection_is_single_combo[warm]", ops=ROLLS)
+def single_combo_warm():
+    rules = create_default_rules()
+    selections = _selections()
+    check = rules.selection_is_single_combo
+
+    def run():
+        for selection in selections:
+            check(selection)
+    return run
+
+
+@benchmark("scoring.selection_is_single_combo[cold]", ops=ROLLS)
+def single_combo_cold():
+    rules = create_default_rules()
+    selections = _selections()
+
+    def run():
+        rules._invalidate()
+        for selection in selections:
+            rules.selection_is_single_combo(selection)
+    return run
+
+
+# --- score previews ------------------------------------------------------------------
+
+_MODIFIER_KEYS = ["SingleValue:1", "SingleValue:5"] + [f"ThreeOfAKind:{v}" for v in range(1, 7)] + ["Straight6"]
+
+
+def _modifiers(count: int) -> list:
+    """``count`` distinct modifiers (the merged chain drops exact duplicates)."""
+    mods = []
+    for i in range(count):
+        key = _MODIFIER_KEYS[i % len(_MODIFIER_KEYS)]
+        kind = i % 3
+        if kind == 0:
+            mods.append(RuleSpecificMultiplier(key, 1.0 + 0.1 * (i + 1)))
+        elif kind == 1:
+            mods.append(FlatRuleBonus(key, 10 * (i + 1)))
+        else:
+            mods.append(GlobalPartsMultiplier(1.0 + 0.01 * (i + 1)))
+    return mods
+
+
+PREVIEWS = 500
+
+
+def _preview_parts(seed: int = 3) -> List[List[Tuple[str, int]]]:
+    """Score breakdowns of the first PREVIEWS scoring rolls (what preview() is fed)."""
+    rules = create_default_rules()
+    rng = random.Random(seed)
+    out = []
+    while len(out) < PREVIEWS:
+        _, _, parts = rules.evaluate([rng.randint(1, 6) for _ in range(rng.randint(1, 6))])
+        if parts:
+            out.append(parts)
+    return out
+
+
+def _preview_bench(count: int, cached: bool):
+    def factory():
+        game = _headless()
+        manager = game.scoring_manager
+        for mod in _modifiers(count):
+            manager.modifier_chain.add(mod)
+        parts = _preview_parts()
+        goal = game.level_state.goals[0]
+        preview = manager.preview
+
+        def run():
+            if not cached:
+                manager._preview_cache.clear()
+            for p in parts:
+                preview(p, goal=goal)
+        return run
+    return factory
+
+
+for _count in (0, 5, 20):
+    benchmark(f"scoring.preview[{_count} modifiers, warm]", ops=PREVIEWS)(_preview_bench(_count, cached=True))
+    benchmark(f"scoring.preview[{_count} modifiers, cold]", ops=PREVIEWS)(_preview_bench(_count, cached=False))
+
+
+# --- event bus -----------------------------------------------------------------------
+
+EVENTS = 1000
+
+
+def _noop(event: GameEvent) -> None:
+    pass
+
+
+@benchmark("events.publish[8 subscribers]", ops=EVENTS)
+def publish_fan_out():
+    listener = EventListener()
+    phases = list(EventPhase)
+    for i in range(8):
+        # Distinct callables, spread over the phases like the game's subscribers
+        listener.subscribe(lambda e: None, phase=phases[i % len(phases)], priority=i)
+    events = [GameEvent(GameEventType.GOAL_PROGRESS, payload={"remaining": i}) for i in range(EVENTS)]
+    publish = listener.publish
+
+    def run():
+        for event in events:
+            publish(event)
+    return run
+
+
+_CASCADE = (GameEventType.BANK, GameEventType.SCORE_APPLY_REQUEST, GameEventType.SCORE_APPLIED,
+            GameEventType.GOAL_PROGRESS, GameEventType.GOAL_FULFILLED, GameEventType.TURN_END)
+
+
+@benchmark("events.publish[cascade depth 6]", ops=EVENTS)
+def publish_cascade():
+    """One root event whose handlers publish the next type of a bank-like chain, with a
+    catch-all, a coalescing and two type-specific subscribers per link."""
+    listener = EventListener()
+    listener.subscribe(_noop)
+    listener.subscribe(lambda e: None, coalesce="latest", phase=EventPhase.PERSISTENCE)
+    for here, after in zip(_CASCADE, _CASCADE[1:]):
+        def forward(event: GameEvent, after=after) -> None:
+            listener.publish(GameEvent(after, payload=event.payload))
+        listener.subscribe(forward, [here])
+        listener.subscribe(lambda e: None, [here], phase=EventPhase.UI)
+    events = [GameEvent(_CASCADE[0], payload={"points": i}) for i in range(EVENTS)]
+
+    def run():
+        for event in events:
+            listener.publish(event)
+    return run
+
+
+@benchmark("events.publish[game bus]", ops=EVENTS)
+def publish_game_bus():
+    from farkle.core.event_payloads import message
+    game = _headless()
+    events = [GameEvent(GameEventType.MESSAGE, payload=message(f"message {i}")) for i in range(EVENTS)]
+    publish = game.event_listener.publish
+
+    def run():
+        for event in events:
+            publish(event)
+    return run
+
+
+# --- dice ----------------------------------------------------------------------------
+
+DICE_ROLLS = 100
+
+
+@benchmark("dice.roll", ops=DICE_ROLLS)
+def dice_roll():
+    game = _headless()
+    container = game.dice_container
+    for d in container.dice:
+        d.held = False
+
+    def run():
+        for _ in range(DICE_ROLLS):
+            container.roll()
+    return run
+
+
+# --- levels and saves ----------------------------------------------------------------
+
+LEVELS = 20
+
+
+@benchmark("level.advance", ops=LEVELS)
+def level_advance():
+    def run():
+        rng = random.Random(4)
+        level = Level.single("", DEFAULT_PROGRESSION.first_target, DEFAULT_PROGRESSION.first_turns, rng=rng)
+        for index in range(2, LEVELS + 2):
+            level = Level.advance(level, index, rng=rng)
+    return run
+
+
+@benchmark("save.serialize_game_state")
+def serialize_game_state():
+    from farkle.meta.save_manager import SaveManager
+    from farkle.relics.relic_manager import offer_pool
+    from farkle.sim.runner import solver_policy
+
+    # A mid-run state: relics owned, goals part-done, a few levels of statistics
+    game = _headless(5)
+    for relic_class in offer_pool()[:3]:
+        game.relic_manager.grant(relic_class())
+    steps = 0
+    while game.level_index < 3 and not game.level_state.failed and steps < 2000:
+        if not solver_policy(game):
+            break
+        steps += 1
+    manager = SaveManager(save_path=os.devnull)
+    manager.game = game
+    return manager._serialize_game_state
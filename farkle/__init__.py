@@ -1,9 +1,20 @@
 """Farkle package public API.
 
-Exports the canonical packaged Game implementation.
+Exports the canonical packaged Game implementation. ``Game`` is imported on first
+access so model subpackages (dice, scoring, level, ...) load without the UI stack.
 """
 from __future__ import annotations
 
-from .game import Game
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .game import Game
 
 __all__ = ["Game"]
+
+
+def __getattr__(name: str):
+    if name == "Game":
+        from .game import Game
+        return Game
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Protocol, Any, Sequence
 from farkle.core.game_event import GameEvent, GameEventType
+from farkle.core.event_payloads import die_rolled, turn_end
 from farkle.core.game_object import GameObject
 
 class AbilityContext(Protocol):
@@ -169,7 +170,7 @@ class RerollAbility(TargetedAbility):
         d.scoring_eligible = False
         self.consume()
         try:
-            game.event_listener.publish(GameEvent(GameEventType.DIE_ROLLED, payload={"index": die_index, "old": old, "new": d.value, "ability": self.id}))
+            game.event_listener.publish(GameEvent(GameEventType.DIE_ROLLED, payload=die_rolled(die_index, old, d.value, self.id)))
             game.event_listener.publish(GameEvent(GameEventType.REROLL, payload={"remaining": self.available(), "ability": self.id}))
             game.event_listener.publish(GameEvent(GameEventType.ABILITY_EXECUTED, payload={"ability": self.id, "target_index": die_index}))
         except Exception:
@@ -196,7 +197,7 @@ class RerollAbility(TargetedAbility):
                         pass
                 if self.available() == 0:
                     try:
-                        game.event_listener.publish(GameEvent(GameEventType.TURN_END, payload={"reason":"farkle"}))
+                        game.event_listener.publish(GameEvent(GameEventType.TURN_END, payload=turn_end("farkle")))
                     except Exception:
                         pass
         elif underlying_state == 'ROLLING' and is_farkle_now:
@@ -218,7 +219,7 @@ class RerollAbility(TargetedAbility):
             game.set_message("Farkle! No scoring dice after reroll.")
             if self.available() == 0:
                 try:
-                    game.event_listener.publish(GameEvent(GameEventType.TURN_END, payload={"reason":"farkle"}))
+                    game.event_listener.publish(GameEvent(GameEventType.TURN_END, payload=turn_end("farkle")))
                 except Exception:
                     pass
         else:
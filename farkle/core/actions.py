@@ -3,6 +3,8 @@
 Each handler receives the game instance and performs logic previously in Game methods.
 """
 from farkle.core.game_event import GameEvent, GameEventType
+from farkle.core.event_payloads import turn_end, turn_score
+from farkle.scoring.turn_solver import TurnSolver
 
 def handle_lock(game) -> bool:
     if game.state_manager.get_state() not in (game.state_manager.state.PRE_ROLL, game.state_manager.state.ROLLING):
@@ -19,7 +21,7 @@ def handle_lock(game) -> bool:
         game.set_message(game.message + " Pending applied on BANK.")
     # Emit lock-added event
     try:
-        game.event_listener.publish(GameEvent(GameEventType.TURN_LOCK_ADDED, payload={"turn_score": game.turn_score}))
+        game.event_listener.publish(GameEvent(GameEventType.TURN_LOCK_ADDED, payload=turn_score(game.turn_score)))
     except Exception:
         pass
     return True
@@ -47,7 +49,7 @@ def handle_roll(game) -> bool:
     # First roll implicitly exits PRE_ROLL; no flag needed
     # Emit a TURN_ROLL event after a successful roll operation
     try:
-        game.event_listener.publish(GameEvent(GameEventType.TURN_ROLL, payload={"turn_score": game.turn_score}))
+        game.event_listener.publish(GameEvent(GameEventType.TURN_ROLL, payload=turn_score(game.turn_score)))
     except Exception:
         pass
     game.mark_scoring_dice()
@@ -70,7 +72,7 @@ def handle_roll(game) -> bool:
                 game.event_listener.publish(GameEvent(GameEventType.FARKLE))
                 game.event_listener.publish(GameEvent(GameEventType.TURN_FARKLE, payload={}))
                 if not reroll or reroll.available() == 0:
-                    game.event_listener.publish(GameEvent(GameEventType.TURN_END, payload={"reason": "farkle"}))
+                    game.event_listener.publish(GameEvent(GameEventType.TURN_END, payload=turn_end("farkle")))
             except Exception:
                 pass
             return True
@@ -115,7 +117,7 @@ def handle_next_turn(game) -> bool:
             reroll = abm.get('reroll') if abm else None
             if reroll and reroll.available() > 0:
                 try:
-                    game.event_listener.publish(GameEvent(GameEventType.TURN_END, payload={"reason": "farkle_forfeit"}))
+                    game.event_listener.publish(GameEvent(GameEventType.TURN_END, payload=turn_end("farkle_forfeit")))
                 except Exception:
                     pass
         
@@ -153,3 +155,102 @@ def handle_next_turn(game) -> bool:
         
         return True
     return False
+
+
+# --- Turn solver hints / autoplay -------------------------------------------
+def _active_goal(game):
+    try:
+        return game.level_state.goals[game.active_goal_index]
+    except Exception:
+        return None
+
+def turn_solver(game) -> TurnSolver:
+    """Return the game's TurnSolver, creating it on first use (or after rules are replaced)."""
+    solver = game.turn_solver
+    if solver is None or solver.rules is not game.rules:
+        solver = TurnSolver(game.rules, dice_count=len(game.dice) or 6)
+        game.turn_solver = solver
+    return solver
+
+def turn_policy(game):
+    """Solved policy for the active goal under the current modifier chain.
+
+    Lock parts are valued through ScoringManager.preview with the active goal, so a
+    changed modifier chain yields new part values and a re-solve; unchanged chains hit
+    the solver's policy cache.
+    """
+    solver = turn_solver(game)
+    goal = _active_goal(game)
+    sm = getattr(game, 'scoring_manager', None)
+    part_value = None
+    if sm is not None:
+        def part_value(rule_key: str, raw: int) -> int:
+            return int(sm.preview([(rule_key, raw)], source="solver", goal=goal).get('adjusted_total', raw))
+    target = int(getattr(goal, 'remaining', 0) or 0) if goal is not None else None
+    return solver.solve(part_value, target=target or None)
+
+def turn_hint(game) -> dict | None:
+    """Recommend the next action: {"action": "roll"|"bank"|"lock"|"next_turn", "values": [...], "expected": float}.
+
+    "values" lists the dice faces to lock for a "lock" hint and "combos" splits them into
+    single-combo locks (the UI locks one combo at a time);
+    "expected" is the expected points the turn still yields for the active goal;
+    "roll" hints add "farkle_risk", the chance the roll scores nothing (TurnSolver.roll_tables).
+    Returns None when no turn action applies (shop, choice windows, game over).
+    """
+    sm_state = game.state_manager.state
+    st = game.state_manager.get_state()
+    if st in (sm_state.FARKLE, sm_state.BANKED):
+        return {"action": "next_turn", "values": [], "expected": 0.0}
+    if st not in (sm_state.PRE_ROLL, sm_state.ROLLING):
+        return None
+    solver = turn_solver(game)
+    policy = turn_policy(game)
+    if st == sm_state.PRE_ROLL:
+        return {"action": "roll", "values": [], "expected": policy.expected_roll(solver.dice_count, 0),
+                "farkle_risk": solver.roll_tables().farkle_probability(solver.dice_count)}
+    goal = _active_goal(game)
+    pending = goal.projected_pending() if goal is not None else game.turn_score
+    unheld = [int(d.value) for d in game.dice if not d.held]
+    if unheld:
+        choice = solver.choose_lock(policy, unheld, pending, must_lock=not game.locked_after_last_roll)
+        if choice is not None:
+            combos = [list(unit[2]) for unit in choice.option.units]
+            return {"action": "lock", "values": choice.values, "combos": combos, "expected": choice.expected}
+        if not game.locked_after_last_roll:
+            return None
+    if policy.should_bank(len(unheld), pending):
+        return {"action": "bank", "values": [], "expected": policy.reward(pending)}
+    # Hot dice: every die is rolled again
+    to_roll = len(unheld) or solver.dice_count
+    return {"action": "roll", "values": [], "expected": policy.expected_roll(len(unheld), pending),
+            "farkle_risk": solver.roll_tables().farkle_probability(to_roll)}
+
+def select_faces(game, faces) -> bool:
+    """Select unheld scoring-eligible dice showing ``faces`` (clearing any other selection)."""
+    for d in game.dice:
+        d.selected = False
+    remaining = list(faces)
+    for d in game.dice:
+        if not d.held and d.scoring_eligible and int(d.value) in remaining:
+            d.selected = True
+            remaining.remove(int(d.value))
+    return not remaining
+
+def autoplay_step(game) -> bool:
+    """Perform the hinted action (one combo per call when locking). Returns True if acted."""
+    hint = turn_hint(game)
+    if hint is None:
+        return False
+    action = hint["action"]
+    if action == "roll":
+        return handle_roll(game)
+    if action == "bank":
+        return handle_bank(game)
+    if action == "next_turn":
+        return handle_next_turn(game)
+    # Lock the first combo of the hinted set; later calls lock the rest if still best.
+    combos = hint.get("combos") or []
+    if not combos or not select_faces(game, combos[0]):
+        return False
+    return handle_lock(game)
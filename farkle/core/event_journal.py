@@ -0,0 +1,477 @@
+"""Deterministic event journal: record a session's GameEvents and replay it headlessly.
+
+The recorder taps an EventListener and appends every published GameEvent (type, source,
+payload and whether it was published from inside another event's dispatch) to a binary
+journal, together with the RandomSource seed and generator states taken when recording
+started. Goal, die, relic and god references are written as stable ids (goal index, die
+index, relic id, god name) so a journal never holds object identities.
+
+Journal layout: ``b"FRKJ"`` + little-endian uint16 format version, then append-only
+records, each a little-endian uint32 length followed by a one-byte kind (``H`` header,
+``E`` event, ``C`` checkpoint) and a compact JSON body. A session cut short (crash,
+killed process) leaves a readable journal up to the last complete record.
+
+Replay constructs a fresh game, restores the recorded generator states and re-drives it
+from the journal's top-level events: player inputs (REQUEST_* events, die selection,
+choice window confirmation) are re-published, direct action calls are re-issued through
+``farkle.core.actions`` and everything the game publishes itself is matched against the
+journal rather than injected. Checkpoints (turn score, dice, goals, gold, ...) taken
+before top-level events are compared along the way.
+
+Usage:
+    recorder = EventJournalRecorder(game, 'session.frkj')
+    ...  # play
+    recorder.close()
+
+    result = EventJournalReplayer('session.frkj').run()
+    result.ok, result.events_per_second, result.mismatches
+"""
+from __future__ import annotations
+import json
+import random
+import struct
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+from itertools import islice
+from pathlib import Path
+from time import perf_counter
+from typing import Any, BinaryIO, Callable, Iterator
+
+from farkle.core.game_event import GameEvent, GameEventType
+
+JOURNAL_MAGIC = b"FRKJ"
+JOURNAL_FORMAT_VERSION = 1
+
+RECORD_HEADER = b"H"
+RECORD_EVENT = b"E"
+RECORD_CHECKPOINT = b"C"
+
+_PREAMBLE = struct.Struct("<4sH")
+_LENGTH = struct.Struct("<I")
+
+# Top-level events identifying a direct action call; replay re-issues the action instead
+_ACTION_EVENTS = frozenset({
+    GameEventType.HOLD_BATCH, GameEventType.PRE_ROLL, GameEventType.TURN_ROLL, GameEventType.BANK,
+    GameEventType.TURN_START, GameEventType.CHOICE_WINDOW_CLOSED,
+})
+# Top-level player input re-published as recorded
+_PUBLISHED_INPUTS = frozenset({
+    GameEventType.DIE_SELECTED, GameEventType.DIE_DESELECTED,
+    GameEventType.REQUEST_ROLL, GameEventType.REQUEST_BANK, GameEventType.REQUEST_NEXT_TURN,
+    GameEventType.REQUEST_BUY_RELIC, GameEventType.REQUEST_SKIP_SHOP, GameEventType.REQUEST_REROLL,
+    GameEventType.REQUEST_ABILITY, GameEventType.REQUEST_CHOICE_CONFIRM, GameEventType.REQUEST_CHOICE_SKIP,
+})
+
+
+class JournalError(ValueError):
+    """Raised when a file is not a readable event journal."""
+
+
+# --- stable references -------------------------------------------------------------
+
+def _index_of(obj: Any, items) -> int | None:
+    for i, item in enumerate(items or ()):
+        if item is obj:
+            return i
+    return None
+
+
+def stable_ref(value: Any, game=None) -> Any:
+    """JSON-compatible form of an event payload value with game objects as stable ids."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return {"$enum": value.name}
+    if isinstance(value, Mapping):
+        return {str(k): stable_ref(v, game) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [stable_ref(v, game) for v in value]
+    if game is not None:
+        level_state = getattr(game, 'level_state', None)
+        idx = _index_of(value, getattr(level_state, 'goals', None))
+        if idx is not None:
+            return {"$goal": idx}
+        idx = _index_of(value, getattr(game, 'dice', None))
+        if idx is not None:
+            return {"$die": idx}
+        gods = getattr(getattr(game, 'gods', None), 'worshipped', None)
+        if _index_of(value, gods) is not None:
+            return {"$god": value.name}
+    ref_id = getattr(value, 'id', None)
+    if isinstance(ref_id, str) and ref_id:
+        return {"$relic" if hasattr(value, 'cost') else "$ref": ref_id, "type": type(value).__name__}
+    return {"$obj": type(value).__name__, "name": str(getattr(value, 'name', ''))}
+
+
+def resolve_ref(value: Any, game) -> Any:
+    """Inverse of stable_ref against `game`; ids that no longer resolve are left as written."""
+    if isinstance(value, list):
+        return [resolve_ref(v, game) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "$goal" in value:
+        goals = getattr(getattr(game, 'level_state', None), 'goals', None) or []
+        return goals[value["$goal"]] if value["$goal"] < len(goals) else value
+    if "$die" in value:
+        dice = getattr(game, 'dice', None) or []
+        return dice[value["$die"]] if value["$die"] < len(dice) else value
+    if "$relic" in value:
+        rm = getattr(game, 'relic_manager', None)
+        for relic in getattr(rm, 'active_relics', None) or []:
+            if relic.id == value["$relic"]:
+                return relic
+        return value
+    if "$god" in value:
+        for god in getattr(getattr(game, 'gods', None), 'worshipped', None) or []:
+            if god.name == value["$god"]:
+                return god
+        return value
+    if "$enum" in value:
+        return GameEventType.__members__.get(value["$enum"], value)
+    if any(k.startswith("$") for k in value):
+        return value
+    return {k: resolve_ref(v, game) for k, v in value.items()}
+
+
+# --- state capture -------------------------------------------------------------------
+
+def _random_state(state) -> list:
+    version, internal, gauss_next = state
+    return [version, list(internal), gauss_next]
+
+
+def _restore_random_state(data) -> tuple:
+    version, internal, gauss_next = data
+    return (version, tuple(internal), gauss_next)
+
+
+def game_checkpoint(game) -> dict[str, Any]:
+    """Snapshot of the state a replay must reproduce exactly."""
+    level_state = getattr(game, 'level_state', None)
+    player = getattr(game, 'player', None)
+    rm = getattr(game, 'relic_manager', None)
+    state = game.state_manager.get_state()
+    manager = getattr(game, 'choice_window_manager', None)
+    window = manager.get_active_window() if manager else None
+    return {
+        'state': getattr(state, 'name', str(state)),
+        'level_index': getattr(game, 'level_index', 0),
+        'turns_left': getattr(level_state, 'turns_left', 0),
+        'turn_score': getattr(game, 'turn_score', 0),
+        'goals': [g.remaining for g in getattr(level_state, 'goals', None) or []],
+        'dice': [[d.value, bool(d.held), bool(d.selected)] for d in getattr(game, 'dice', None) or []],
+        'gold': getattr(player, 'gold', 0),
+        'faith': getattr(player, 'faith', 0),
+        'relics': [r.id for r in getattr(rm, 'active_relics', None) or []],
+        'gods': [g.name for g in getattr(getattr(game, 'gods', None), 'worshipped', None) or []],
+        # Offers drawn before recording started (e.g. the startup god choice) must match too
+        'choice': [item.id for item in window.items] if window is not None else [],
+    }
+
+
+# --- file format ---------------------------------------------------------------------
+
+def _write_record(f: BinaryIO, kind: bytes, body: Any) -> None:
+    blob = kind + json.dumps(body, separators=(',', ':')).encode('utf-8')
+    f.write(_LENGTH.pack(len(blob)))
+    f.write(blob)
+
+
+def iter_records(path: str | Path) -> Iterator[tuple[bytes, Any]]:
+    """Yield (kind, body) for each complete record; a truncated tail record is ignored."""
+    with open(path, 'rb') as f:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise JournalError(f"{path}: not an event journal")
+        magic, version = _PREAMBLE.unpack(preamble)
+        if magic != JOURNAL_MAGIC:
+            raise JournalError(f"{path}: not an event journal")
+        if version != JOURNAL_FORMAT_VERSION:
+            raise JournalError(f"{path}: unsupported journal format {version}")
+        while True:
+            raw = f.read(_LENGTH.size)
+            if len(raw) < _LENGTH.size:
+                return
+            (length,) = _LENGTH.unpack(raw)
+            blob = f.read(length)
+            if len(blob) < length:
+                return
+            yield blob[:1], json.loads(blob[1:])
+
+
+@dataclass
+class Journal:
+    header: dict[str, Any]
+    # (kind, body) in file order; event bodies are [seq, type, nested, source, payload]
+    records: list[tuple[bytes, Any]]
+
+    @property
+    def event_count(self) -> int:
+        return sum(1 for kind, _ in self.records if kind == RECORD_EVENT)
+
+
+def read_journal(path: str | Path) -> Journal:
+    records = list(iter_records(path))
+    if not records or records[0][0] != RECORD_HEADER:
+        raise JournalError(f"{path}: journal has no header record")
+    return Journal(header=records[0][1], records=records[1:])
+
+
+# --- recording -----------------------------------------------------------------------
+
+class EventJournalRecorder:
+    """Append every event published on `game.event_listener` to a journal file.
+
+    Attach right after constructing the game: replay rebuilds the game from the recorded
+    seed and options, then restores the generator states captured here. Anything drawn
+    from the global ``random`` module during construction (the startup god offer) is not
+    reproduced; the initial checkpoint reports it when it differs.
+
+    Args:
+        game: Game whose event listener is recorded.
+        path: Journal file (created or truncated).
+        checkpoint_every: Write a state checkpoint before every Nth top-level event
+            (0 disables checkpoints other than the final one written by close()).
+    """
+
+    def __init__(self, game, path: str | Path, *, checkpoint_every: int = 1):
+        self.game = game
+        self.path = Path(path)
+        self.checkpoint_every = checkpoint_every
+        self.events = 0
+        self.top_level = 0
+        self._file: BinaryIO | None = open(self.path, 'wb')
+        self._file.write(_PREAMBLE.pack(JOURNAL_MAGIC, JOURNAL_FORMAT_VERSION))
+        rng = getattr(game, 'rng', None)
+        _write_record(self._file, RECORD_HEADER, {
+            'seed': getattr(rng, 'seed', None),
+            'rng_state': _random_state(rng.state()) if rng is not None else None,
+            'global_random_state': _random_state(random.getstate()),
+            'skip_god_selection': bool(getattr(game, '_skip_god_selection', False)),
+            'checkpoint': game_checkpoint(game),
+        })
+        game.event_listener.add_tap(self._on_publish)
+
+    def _on_publish(self, event: GameEvent, nested: bool) -> None:
+        f = self._file
+        if f is None:
+            return
+        if not nested:
+            if self.checkpoint_every and self.top_level % self.checkpoint_every == 0:
+                _write_record(f, RECORD_CHECKPOINT, [self.events, game_checkpoint(self.game)])
+            self.top_level += 1
+        game = self.game
+        _write_record(f, RECORD_EVENT, [
+            self.events,
+            event.type.name,
+            1 if nested else 0,
+            stable_ref(event.source, game),
+            stable_ref(event.payload, game),
+        ])
+        self.events += 1
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Write a final checkpoint, detach from the listener and close the file."""
+        if self._file is None:
+            return
+        self.game.event_listener.remove_tap(self._on_publish)
+        _write_record(self._file, RECORD_CHECKPOINT, [self.events, game_checkpoint(self.game)])
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "EventJournalRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# --- replay --------------------------------------------------------------------------
+
+@dataclass
+class ReplayResult:
+    events_recorded: int = 0
+    events_replayed: int = 0
+    inputs: int = 0
+    checkpoints: int = 0
+    seconds: float = 0.0
+    # (event seq, description) for every divergence found
+    mismatches: list[tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events_replayed / self.seconds if self.seconds > 0 else 0.0
+
+
+def _compare_checkpoint(result: ReplayResult, seq: int, expected: dict | None, actual: dict) -> None:
+    if expected is None:
+        return
+    result.checkpoints += 1
+    for key, want in expected.items():
+        got = actual.get(key)
+        if got != want:
+            result.mismatches.append((seq, f"checkpoint {key}: recorded {want!r}, replay {got!r}"))
+
+
+def _default_game_factory(seed: int | None, skip_god_selection: bool):
+    from farkle.game import Game
+    return Game.headless(seed, skip_god_selection=skip_god_selection)
+
+
+class EventJournalReplayer:
+    """Re-drive a fresh game from a journal and verify its checkpoints.
+
+    Args:
+        path: Journal written by EventJournalRecorder.
+        game_factory: ``(seed, skip_god_selection) -> Game``; defaults to
+            Game.headless().
+        max_mismatches: Stop replaying once this many divergences were found.
+    """
+
+    def __init__(self, path: str | Path, *, game_factory: Callable[[int | None, bool], Any] | None = None, max_mismatches: int = 20):
+        self.journal = read_journal(path)
+        self.game_factory = game_factory or _default_game_factory
+        self.max_mismatches = max_mismatches
+        self.game = None
+
+    def _new_game(self):
+        header = self.journal.header
+        game = self.game_factory(header.get('seed'), bool(header.get('skip_god_selection')))
+        rng = getattr(game, 'rng', None)
+        if rng is not None and header.get('rng_state') is not None:
+            rng.set_state(_restore_random_state(header['rng_state']))
+        random.setstate(_restore_random_state(header['global_random_state']))
+        return game
+
+    def run(self, *, verify: bool = True) -> ReplayResult:
+        journal = self.journal
+        result = ReplayResult(events_recorded=journal.event_count)
+        game = self.game = self._new_game()
+        listener = game.event_listener
+        roots: list[tuple[int, Any]] = []  # (record position, body) of top-level events
+        checkpoints: dict[int, dict] = {}  # event seq -> state recorded just before its publish
+        for pos, (kind, body) in enumerate(journal.records):
+            if kind == RECORD_EVENT and not body[2]:
+                roots.append((pos, body))
+            elif kind == RECORD_CHECKPOINT:
+                checkpoints[body[0]] = body[1]
+        produced = [0]
+        published = [0]
+
+        def tap(event: GameEvent, nested: bool) -> None:
+            published[0] += 1
+            if nested:
+                return
+            k = produced[0]
+            produced[0] += 1
+            if k >= len(roots):
+                result.mismatches.append((-1, f"replay published extra {event.type.name}"))
+                return
+            body = roots[k][1]
+            if body[1] != event.type.name:
+                result.mismatches.append((body[0], f"expected {body[1]}, game published {event.type.name}"))
+            elif verify and body[0] in checkpoints:
+                # Same logical point as the recording: the game is about to publish this event
+                _compare_checkpoint(result, body[0], checkpoints[body[0]], game_checkpoint(game))
+
+        if verify:
+            _compare_checkpoint(result, -1, journal.header.get('checkpoint'), game_checkpoint(game))
+        listener.add_tap(tap)
+        start = perf_counter()
+        try:
+            for k, (pos, body) in enumerate(roots):
+                if len(result.mismatches) >= self.max_mismatches:
+                    break
+                if k < produced[0]:
+                    continue  # already re-published by an earlier input's cascade
+                self._inject(game, pos, body)
+                result.inputs += 1
+                if produced[0] <= k:
+                    result.mismatches.append((body[0], f"replaying {body[1]} did not publish it"))
+                    produced[0] = k + 1
+        finally:
+            listener.remove_tap(tap)
+        result.seconds = perf_counter() - start
+        result.events_replayed = published[0]
+        if len(result.mismatches) < self.max_mismatches:
+            final = checkpoints.get(journal.event_count)
+            if verify and final is not None:
+                _compare_checkpoint(result, journal.event_count, final, game_checkpoint(game))
+            if published[0] != journal.event_count:
+                result.mismatches.append((published[0], f"recorded {journal.event_count} events, replay published {published[0]}"))
+        return result
+
+    def _action_event(self, pos: int, body):
+        """Map a top-level event to the input that caused it.
+
+        Direct action calls publish some events before the one identifying them (a bank
+        changes state first, a forfeit ends the turn, a confirmed choice applies its
+        selection before CHOICE_WINDOW_CLOSED), so look ahead to the next input event.
+        """
+        etype = GameEventType[body[1]]
+        if etype in _ACTION_EVENTS or etype in _PUBLISHED_INPUTS:
+            return pos, body
+        for ahead, (kind, nxt) in enumerate(islice(self.journal.records, pos + 1, None), start=pos + 1):
+            if kind != RECORD_EVENT or nxt[2]:
+                continue
+            ntype = GameEventType[nxt[1]]
+            if ntype in _ACTION_EVENTS:
+                return ahead, nxt
+            if ntype in _PUBLISHED_INPUTS:
+                break
+        return pos, body
+
+    def _inject(self, game, pos: int, body) -> None:
+        from farkle.core import actions
+        pos, body = self._action_event(pos, body)
+        etype = GameEventType[body[1]]
+        payload = resolve_ref(body[4], game)
+        if etype in (GameEventType.DIE_SELECTED, GameEventType.DIE_DESELECTED):
+            idx = (payload or {}).get('index')
+            if idx is not None and 0 <= idx < len(game.dice):
+                game.dice[idx].selected = etype == GameEventType.DIE_SELECTED
+                game.update_current_selection_score()
+        elif etype == GameEventType.HOLD_BATCH:
+            # A direct lock (right-click or actions.handle_lock): reselect exactly the held dice
+            held = set((payload or {}).get('indices') or ())
+            for i, d in enumerate(game.dice):
+                d.selected = i in held
+            game.update_current_selection_score()
+            actions.handle_lock(game)
+            return
+        elif etype in (GameEventType.PRE_ROLL, GameEventType.TURN_ROLL):
+            # TURN_ROLL leads only on hot dice, where the reset rolls without PRE_ROLL
+            actions.handle_roll(game)
+            return
+        elif etype == GameEventType.BANK:
+            actions.handle_bank(game)
+            return
+        elif etype == GameEventType.TURN_START:
+            actions.handle_next_turn(game)
+            return
+        elif etype == GameEventType.CHOICE_WINDOW_CLOSED:
+            self._close_choice_window(game, payload or {})
+            return
+        game.event_listener.publish(GameEvent(etype, source=resolve_ref(body[3], game), payload=payload))
+
+    def _close_choice_window(self, game, payload: dict) -> None:
+        manager = getattr(game, 'choice_window_manager', None)
+        window = manager.get_active_window() if manager else None
+        if window is None:
+            return
+        if payload.get('skipped'):
+            manager.skip_window(payload.get('window_type'))
+            return
+        wanted = list(payload.get('selected_ids') or [])
+        window.selected_indices = [i for i, item in enumerate(window.items) if item.id in wanted]
+        manager.close_window(payload.get('window_type'))
+
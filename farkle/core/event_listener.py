@@ -1,59 +1,397 @@
 from __future__ import annotations
-from collections import defaultdict
-from typing import Callable, Iterable, Optional
+from collections import defaultdict, deque
+from dataclasses import replace
+from enum import IntEnum
+from time import perf_counter
+from typing import Callable, Hashable, Iterable, Optional
+from farkle.core.event_payloads import FAN_OUT
+from farkle.core.event_profiler import EventBusProfiler
+from farkle.core.event_sink import AsyncEventSink
 from farkle.core.game_event import GameEvent, GameEventType
 
+Callback = Callable[[GameEvent], None]
+# Publish taps receive (event, nested) where nested is True for events published during dispatch
+Tap = Callable[[GameEvent, bool], None]
+# Coalescing merge: (held event, newer event of the same type) -> combined event, or None
+# to deliver the held event right away and hold the newer one instead
+Merge = Callable[[GameEvent, GameEvent], Optional[GameEvent]]
+# Coalescing policy delivering only the most recent event (of any type) per burst
+COALESCE_LATEST = "latest"
+
+
+class EventPhase(IntEnum):
+    """Dispatch phases, delivered in this order for every event."""
+    MODEL = 0
+    SCORING = 1
+    META = 2
+    UI = 3
+    PERSISTENCE = 4
+
+
+# (immediate, deferred, coalescing as (callback, deferred?), everything in dispatch order)
+_Plan = tuple[tuple[Callback, ...], tuple[Callback, ...], tuple[tuple[Callback, bool], ...], tuple[Callback, ...]]
+
+
+def merge_count(held: GameEvent, new: GameEvent) -> GameEvent:
+    """Coalescing merge keeping the newest event and counting how many it replaces."""
+    return replace(new, coalesced=held.coalesced + new.coalesced)
+
+
+def _callback_key(callback: Callback) -> Hashable:
+    # Bound methods of unhashable objects (e.g. dataclasses) cannot be dict keys themselves;
+    # they compare equal when bound to the same object and function, so key on exactly that.
+    owner = getattr(callback, '__self__', None)
+    func = getattr(callback, '__func__', None)
+    if owner is not None and func is not None:
+        return (id(owner), func)
+    try:
+        hash(callback)
+        return callback
+    except TypeError:
+        return id(callback)
+
+
 class EventListener:
     """Central hub for publishing GameEvents to subscribed GameObjects or callbacks.
 
     Subscribers can optionally specify a set of GameEventType filters; if omitted they
-    receive all events.
+    receive all events. Each event type dispatches from immutable tuples, presorted
+    (see phases below) and rebuilt lazily after subscribe/unsubscribe, so publishing
+    never copies or sorts subscriber lists.
+
+    Catch-all subscribers may exclude event types they never handle, either with
+    ``ignore=`` or by declaring an ``ignored_events`` attribute on the object owning the
+    bound method. Excluded types are not delivered, and when no subscriber remains for a
+    type has_subscribers() is False so emitters can skip building the event at all.
+
+    Batched events (ROLL_BATCH, HOLD_BATCH) fan out into their per-die events
+    (DIE_ROLLED, DIE_HELD) right after their own dispatch, ahead of anything queued
+    later, but only while someone subscribes to the per-die type.
+
+    Every subscription has an EventPhase (model -> scoring -> meta -> UI -> persistence)
+    and an integer priority, given with ``phase=``/``priority=`` or declared as
+    ``event_phase``/``event_priority`` on the owning object; the defaults are MODEL and
+    0. Dispatch order is phase, then higher priority first, then catch-all before
+    type-specific, then subscription order. Phases passed to set_deferred_phases() are
+    not called during publish: their deliveries wait for flush_deferred(), which the
+    frame loop calls once per frame.
+
+    Coalescing subscribers (``coalesce=`` or an ``event_coalesce`` owner attribute)
+    receive at most one delivery per burst: the end of the publish drain, or
+    flush_deferred() for deferred phases. With COALESCE_LATEST that delivery is the
+    burst's last event; with a Merge function events are combined per type
+    (merge_count keeps the newest and counts the rest in ``event.coalesced``).
     """
 
     def __init__(self):
         # Map event type -> list[callable]
-        self._subs_all: list[Callable[[GameEvent], None]] = []
-        self._subs_specific: dict[GameEventType, list[Callable[[GameEvent], None]]] = defaultdict(list)
+        self._subs_all: list[Callback] = []
+        self._subs_specific: dict[GameEventType, list[Callback]] = defaultdict(list)
+        # Reverse index: callback key -> event types it is subscribed to (None = catch-all)
+        self._subscriptions: dict[Hashable, set[GameEventType | None]] = {}
+        # Catch-all callback key -> event types it opted out of
+        self._ignored: dict[Hashable, frozenset[GameEventType]] = {}
+        # Callback key -> (phase, priority, subscription sequence)
+        self._order: dict[Hashable, tuple[int, int, int]] = {}
+        self._next_seq = 0
+        # Per-type dispatch plans (see _plan), invalidated on any subscription change
+        self._dispatch: dict[GameEventType, _Plan] = {}
+        self._deferred_phases: frozenset[EventPhase] = frozenset()
+        # (callback, event) deliveries waiting for flush_deferred()
+        self._deferred: deque[tuple[Callback, GameEvent]] = deque()
         # Simple reentrancy-safe queue so events published during a callback are processed afterward
-        self._queue: list[GameEvent] = []
+        self._queue: deque[GameEvent] = deque()
         self._dispatching: bool = False
+        # Opt-in instrumentation (see enable_profiling); None keeps dispatch on the fast path
+        self.profiler: EventBusProfiler | None = None
+        # Observers of the publish order itself (e.g. the event journal), called before queueing
+        self._taps: tuple[Tap, ...] = ()
+        # Batch event type -> (per-item event type, expansion)
+        self._fan_out = dict(FAN_OUT)
+        # Off-thread subscribers created by subscribe_async
+        self._sinks: list[AsyncEventSink] = []
+        # Callback key -> coalescing policy (COALESCE_LATEST or a Merge)
+        self._coalesce: dict[Hashable, str | Merge] = {}
+        # Held coalesced deliveries, keyed per subscriber (latest) or subscriber and type (merge):
+        # until the end of the drain, and until flush_deferred for deferred phases
+        self._held: dict[Hashable, tuple[Callback, GameEvent]] = {}
+        self._held_deferred: dict[Hashable, tuple[Callback, GameEvent]] = {}
 
-    def subscribe(self, callback: Callable[[GameEvent], None], types: Optional[Iterable[GameEventType]] = None):
+    def subscribe(self, callback: Callback, types: Optional[Iterable[GameEventType]] = None, *,
+                  ignore: Optional[Iterable[GameEventType]] = None,
+                  phase: Optional[EventPhase] = None, priority: Optional[int] = None,
+                  coalesce: str | Merge | None = None):
+        key = _callback_key(callback)
+        registered = self._subscriptions.setdefault(key, set())
+        owner = getattr(callback, '__self__', None)
+        if coalesce is None and key not in self._coalesce:
+            coalesce = getattr(owner, 'event_coalesce', None)
+        if coalesce is not None:
+            self._coalesce[key] = coalesce
+        previous = self._order.get(key)
+        if phase is None:
+            phase = previous[0] if previous else getattr(owner, 'event_phase', EventPhase.MODEL)
+        if priority is None:
+            priority = previous[1] if previous else getattr(owner, 'event_priority', 0)
+        if previous:
+            seq = previous[2]
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+        self._order[key] = (int(phase), int(priority), seq)
         if types is None:
-            if callback not in self._subs_all:
+            if None not in registered:
                 self._subs_all.append(callback)
+                registered.add(None)
+                if ignore is None:
+                    ignore = getattr(owner, 'ignored_events', None)
+                if ignore:
+                    self._ignored[key] = frozenset(ignore)
         else:
             for t in types:
-                lst = self._subs_specific[t]
-                if callback not in lst:
-                    lst.append(callback)
-
-    def unsubscribe(self, callback: Callable[[GameEvent], None]):
-        if callback in self._subs_all:
-            self._subs_all.remove(callback)
-        for lst in self._subs_specific.values():
-            if callback in lst:
+                if t not in registered:
+                    self._subs_specific[t].append(callback)
+                    registered.add(t)
+        self._dispatch.clear()
+
+    def unsubscribe(self, callback: Callback):
+        key = _callback_key(callback)
+        registered = self._subscriptions.pop(key, None)
+        self._ignored.pop(key, None)
+        self._order.pop(key, None)
+        self._coalesce.pop(key, None)
+        if not registered:
+            return
+        for t in registered:
+            lst = self._subs_all if t is None else self._subs_specific.get(t)
+            if lst is not None and callback in lst:
                 lst.remove(callback)
+        self._dispatch.clear()
+
+    def subscribe_async(self, handler: Callable, types: Optional[Iterable[GameEventType]] = None, *,
+                        snapshot: Optional[Callable[[GameEvent], object]] = None, maxsize: int = 64,
+                        phase: EventPhase = EventPhase.PERSISTENCE, priority: int = 0,
+                        coalesce: str | Merge | None = None) -> AsyncEventSink:
+        """Subscribe `handler` to run on a worker thread with snapshots of the events.
+
+        `snapshot` runs during dispatch and captures what the handler needs (default: an
+        immutable EventSnapshot); see farkle.core.event_sink.
+        """
+        sink = AsyncEventSink(handler, snapshot=snapshot, maxsize=maxsize)
+        self._sinks.append(sink)
+        self.subscribe(sink, types, phase=phase, priority=priority, coalesce=coalesce)
+        return sink
+
+    def unsubscribe_async(self, sink: AsyncEventSink, timeout: float | None = None) -> bool:
+        """Unsubscribe a sink and stop its worker after it drains."""
+        self.unsubscribe(sink)
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+        return sink.close(timeout)
+
+    def flush_sinks(self, timeout: float | None = None) -> bool:
+        """Barrier: wait until every async sink has handled what was submitted so far."""
+        return all([sink.flush(timeout) for sink in self._sinks])
+
+    def _plan(self, event_type: GameEventType) -> _Plan:
+        """Sorted callbacks for `event_type`, split by how they are delivered."""
+        plan = self._dispatch.get(event_type)
+        if plan is None:
+            ignored = self._ignored
+            order = self._order
+            ranked = []
+            for cb in self._subs_all:
+                key = _callback_key(cb)
+                if not ignored or event_type not in ignored.get(key, ()):
+                    phase, priority, seq = order[key]
+                    ranked.append(((phase, -priority, 0, seq), phase, cb))
+            for cb in self._subs_specific.get(event_type, ()):
+                phase, priority, seq = order[_callback_key(cb)]
+                ranked.append(((phase, -priority, 1, seq), phase, cb))
+            ranked.sort(key=lambda r: r[0])
+            deferred = self._deferred_phases
+            coalesce = self._coalesce
+            plain = [(phase, cb) for _, phase, cb in ranked if _callback_key(cb) not in coalesce]
+            plan = (tuple(cb for phase, cb in plain if phase not in deferred),
+                    tuple(cb for phase, cb in plain if phase in deferred),
+                    tuple((cb, phase in deferred) for _, phase, cb in ranked if _callback_key(cb) in coalesce),
+                    tuple(cb for _, _, cb in ranked))
+            self._dispatch[event_type] = plan
+        return plan
+
+    def dispatch_tuple(self, event_type: GameEventType) -> tuple[Callback, ...]:
+        """Callbacks receiving `event_type`, in dispatch order."""
+        return self._plan(event_type)[3]
+
+    # --- coalescing --------------------------------------------------------------
+    def _hold(self, held: tuple[tuple[Callback, bool], ...], ev: GameEvent):
+        for cb, deferred in held:
+            key = _callback_key(cb)
+            policy = self._coalesce[key]
+            pending = self._held_deferred if deferred else self._held
+            slot = key if policy == COALESCE_LATEST else (key, ev.type)
+            previous = pending.get(slot)
+            if previous is None:
+                pending[slot] = (cb, ev)
+                continue
+            if policy == COALESCE_LATEST:
+                merged = merge_count(previous[1], ev)
+            else:
+                merged = policy(previous[1], ev)
+            if merged is None:
+                # Not mergeable: the held event goes out now (or to the frame queue)
+                if deferred:
+                    self._deferred.append(previous)
+                else:
+                    self._invoke(previous[0], previous[1])
+                merged = ev
+            pending[slot] = (cb, merged)
+
+    def _release(self, pending: dict[Hashable, tuple[Callback, GameEvent]]) -> int:
+        """Deliver held coalesced events in dispatch order; returns how many ran."""
+        order = self._order
+        items = []
+        for cb, ev in pending.values():
+            rank = order.get(_callback_key(cb))
+            if rank is not None:  # skip subscribers gone since the event was held
+                items.append(((rank[0], -rank[1], rank[2]), cb, ev))
+        pending.clear()
+        items.sort(key=lambda item: item[0])
+        for _, cb, ev in items:
+            self._invoke(cb, ev)
+        return len(items)
+
+    def _invoke(self, cb: Callback, ev: GameEvent):
+        profiler = self.profiler
+        if profiler is not None:
+            self._dispatch_profiled((cb,), ev, profiler)
+        else:
+            try:
+                cb(ev)
+            except Exception:
+                pass
+
+    # --- deferred phases ---------------------------------------------------------
+    @property
+    def deferred_phases(self) -> frozenset[EventPhase]:
+        return self._deferred_phases
+
+    def set_deferred_phases(self, phases: Iterable[EventPhase]):
+        """Deliver events to subscribers in `phases` only from flush_deferred()."""
+        self._deferred_phases = frozenset(EventPhase(p) for p in phases)
+        self._dispatch.clear()
+
+    def pending_deferred(self) -> int:
+        return len(self._deferred) + len(self._held_deferred)
+
+    def flush_deferred(self) -> int:
+        """Run deliveries held back for deferred phases, in publish order; returns how many ran.
+
+        Coalesced deferred subscribers get their one delivery for the frame after the
+        others. Events those subscribers publish are dispatched normally (and any
+        deferred deliveries they cause run in this same flush).
+        """
+        deferred = self._deferred
+        ran = 0
+        while deferred or self._held_deferred:
+            while deferred:
+                cb, ev = deferred.popleft()
+                ran += 1
+                self._invoke(cb, ev)
+            ran += self._release(self._held_deferred)
+        return ran
+
+    def has_subscribers(self, event_type: GameEventType) -> bool:
+        """True if publishing `event_type` would reach anyone (taps such as the journal count)."""
+        if self._taps or self.dispatch_tuple(event_type):
+            return True
+        fan_out = self._fan_out.get(event_type)
+        return fan_out is not None and bool(self.dispatch_tuple(fan_out[0]))
+
+    def _expand(self, event: GameEvent) -> list[GameEvent]:
+        detail_type, expand = self._fan_out[event.type]
+        if not (self._taps or self.dispatch_tuple(detail_type)):
+            return []
+        details = expand(event)
+        for detail in details:
+            for tap in self._taps:
+                tap(detail, True)
+        return details
+
+    def add_tap(self, tap: Tap):
+        """Observe every publish in publish order, before any subscriber sees the event."""
+        if tap not in self._taps:
+            self._taps = self._taps + (tap,)
+
+    def remove_tap(self, tap: Tap):
+        self._taps = tuple(t for t in self._taps if t != tap)
+
+    # --- profiling ---------------------------------------------------------------
+    def enable_profiling(self, sample_size: int = 1024) -> EventBusProfiler:
+        """Start recording publish counts, subscriber timings and swallowed exceptions."""
+        if self.profiler is None:
+            self.profiler = EventBusProfiler(sample_size)
+        return self.profiler
+
+    def disable_profiling(self) -> EventBusProfiler | None:
+        """Stop recording; returns the profiler so its data can still be inspected."""
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    def _dispatch_profiled(self, subs: tuple[Callback, ...], ev: GameEvent, profiler: EventBusProfiler):
+        for cb in subs:
+            start = perf_counter()
+            try:
+                cb(ev)
+            except Exception:
+                profiler.record_exception(cb)
+            profiler.record_call(ev.type, cb, perf_counter() - start)
 
     def publish(self, event: GameEvent):
+        if self._taps:
+            for tap in self._taps:
+                tap(event, self._dispatching)
         self._queue.append(event)
+        if self.profiler is not None:
+            self.profiler.record_publish(event.type, len(self._queue))
         if self._dispatching:
             return
+        self._drain()
+
+    def _drain(self):
         self._dispatching = True
+        queue = self._queue
+        deferred = self._deferred
+        fan_out = self._fan_out
         try:
-            while self._queue:
-                ev = self._queue.pop(0)
-                # Dispatch to all-subscribers then type-specific
-                for cb in list(self._subs_all):
-                    try:
-                        cb(ev)
-                    except Exception:
-                        pass
-                for cb in list(self._subs_specific.get(ev.type, [])):
-                    try:
-                        cb(ev)
-                    except Exception:
-                        pass
+            while True:
+                while queue:
+                    ev = queue.popleft()
+                    now, later, held, _ = self._plan(ev.type)
+                    profiler = self.profiler
+                    if profiler is not None:
+                        self._dispatch_profiled(now, ev, profiler)
+                    else:
+                        for cb in now:
+                            try:
+                                cb(ev)
+                            except Exception:
+                                pass
+                    if later:
+                        deferred.extend([(cb, ev) for cb in later])
+                    if held:
+                        self._hold(held, ev)
+                    if ev.type in fan_out:
+                        details = self._expand(ev)
+                        queue.extendleft(reversed(details))
+                        if profiler is not None:
+                            for detail in details:
+                                profiler.record_publish(detail.type, len(queue))
+                # End of the drain: coalesced subscribers get their one delivery, which
+                # may publish more events for another round
+                if not self._held:
+                    break
+                self._release(self._held)
         finally:
             self._dispatching = False
 
@@ -64,14 +402,29 @@ class EventListener:
         next queued event dispatch (e.g., ability charge adjustments).
         """
         # Directly invoke without queuing to guarantee ordering
-        for cb in list(self._subs_all):
-            try:
-                cb(event)
-            except Exception:
-                pass
-        for cb in list(self._subs_specific.get(event.type, [])):
-            try:
-                cb(event)
-            except Exception:
-                pass
-        # Debug logging removed after stabilization.
+        for tap in self._taps:
+            tap(event, True)
+        self._deliver_now(event)
+        if not self._dispatching and self._held:
+            # No drain in progress whose end would release the coalesced deliveries
+            self._drain()
+
+    def _deliver_now(self, event: GameEvent):
+        now, later, held, _ = self._plan(event.type)
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.record_publish(event.type, len(self._queue))
+            self._dispatch_profiled(now, event, profiler)
+        else:
+            for cb in now:
+                try:
+                    cb(event)
+                except Exception:
+                    pass
+        if later:
+            self._deferred.extend([(cb, event) for cb in later])
+        if held:
+            self._hold(held, event)
+        if event.type in self._fan_out:
+            for detail in self._expand(event):
+                self._deliver_now(detail)
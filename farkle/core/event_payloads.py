@@ -0,0 +1,236 @@
+"""Payload shapes and constructors for the most frequently published GameEvents.
+
+Payloads stay plain dicts, so ``event.get('index')``, ``dict(event.payload)`` and
+dict comparison run at C speed on the publish hot path. Each shape is a ``TypedDict``
+for static checking and has a constructor function building the dict literal, e.g.
+``die_rolled(index, old, new)`` returns a ``DieRolled``. Optional keys that were not
+supplied are left out, exactly as with the hand-written dicts they replace.
+
+Events without a shape here still carry ad-hoc dicts; ``PAYLOAD_TYPES`` maps each typed
+GameEventType to its TypedDict. ``FAN_OUT`` maps the batched dice events to the
+per-die event type they stand for and the function expanding them (used by
+EventListener when someone still subscribes to the per-die type).
+"""
+from typing import Callable, NotRequired, TypedDict
+
+from farkle.core.game_event import GameEvent, GameEventType
+
+
+# --- dice ----------------------------------------------------------------------------
+
+class DieRolled(TypedDict):
+    index: int
+    old: int
+    new: int
+    ability: NotRequired[str]
+
+
+def die_rolled(index: int, old: int, new: int, ability: str | None = None) -> DieRolled:
+    if ability is not None:
+        return {"index": index, "old": old, "new": new, "ability": ability}
+    return {"index": index, "old": old, "new": new}
+
+
+class DieIndex(TypedDict):
+    """DIE_SELECTED / DIE_DESELECTED."""
+    index: int
+
+
+def die_index(index: int) -> DieIndex:
+    return {"index": index}
+
+
+class DieHeld(TypedDict):
+    index: int
+    value: int
+
+
+def die_held(index: int, value: int) -> DieHeld:
+    return {"index": index, "value": value}
+
+
+class RollValues(TypedDict):
+    """POST_ROLL."""
+    values: list[int]
+
+
+def roll_values(values: list[int]) -> RollValues:
+    return {"values": values}
+
+
+class RollBatch(TypedDict):
+    """ROLL_BATCH: the dice rolled by one roll as parallel arrays, plus the held mask of all dice."""
+    indices: list[int]
+    old: list[int]
+    new: list[int]
+    held: list[bool]
+
+
+def roll_batch(indices: list[int], old: list[int], new: list[int], held: list[bool]) -> RollBatch:
+    return {"indices": indices, "old": old, "new": new, "held": held}
+
+
+class HoldBatch(TypedDict):
+    """HOLD_BATCH: the dice held by one lock."""
+    indices: list[int]
+    values: list[int]
+
+
+def hold_batch(indices: list[int], values: list[int]) -> HoldBatch:
+    return {"indices": indices, "values": values}
+
+
+class Empty(TypedDict):
+    """Events that carry no data (PRE_ROLL, BANK, ...)."""
+
+
+def empty() -> Empty:
+    return {}
+
+
+# --- turn flow -----------------------------------------------------------------------
+
+class TurnScore(TypedDict):
+    """TURN_ROLL / TURN_LOCK_ADDED."""
+    turn_score: int
+
+
+def turn_score(score: int) -> TurnScore:
+    return {"turn_score": score}
+
+
+class TurnEnd(TypedDict):
+    reason: str
+
+
+def turn_end(reason: str) -> TurnEnd:
+    return {"reason": reason}
+
+
+class StateChanged(TypedDict):
+    old: str
+    new: str
+
+
+def state_changed(old: str, new: str) -> StateChanged:
+    return {"old": old, "new": new}
+
+
+class Lock(TypedDict):
+    goal_index: int
+    points: int
+    rule_key: NotRequired[str]
+
+
+def lock(goal_index: int, points: int, rule_key: str | None = None) -> Lock:
+    if rule_key:
+        return {"goal_index": goal_index, "points": points, "rule_key": rule_key}
+    return {"goal_index": goal_index, "points": points}
+
+
+class GoalProgress(TypedDict):
+    goal_name: str
+    delta: int
+    remaining: int
+
+
+def goal_progress(goal_name: str, delta: int, remaining: int) -> GoalProgress:
+    return {"goal_name": goal_name, "delta": delta, "remaining": remaining}
+
+
+class Message(TypedDict):
+    text: str
+
+
+def message(text: str) -> Message:
+    return {"text": text}
+
+
+# --- rewards -------------------------------------------------------------------------
+
+class Reward(TypedDict):
+    """GOLD/INCOME/FAITH _REWARDED and _GAINED."""
+    amount: int
+    source: str
+    goal_name: NotRequired[str]
+    goal_category: NotRequired[str]
+    god_name: NotRequired[str]
+    new_total: NotRequired[int]
+
+
+def reward(amount: int, source: str, goal_name: str | None = None, goal_category: str | None = None,
+           god_name: str | None = None, new_total: int | None = None) -> Reward:
+    payload: Reward = {"amount": amount, "source": source}
+    if goal_name is not None:
+        payload["goal_name"] = goal_name
+    if goal_category is not None:
+        payload["goal_category"] = goal_category
+    if god_name is not None:
+        payload["god_name"] = god_name
+    if new_total is not None:
+        payload["new_total"] = new_total
+    return payload
+
+
+class Blessing(TypedDict):
+    """BLESSING_REWARDED / BLESSING_GAINED."""
+    blessing_type: str
+    source: str
+    goal_name: NotRequired[str]
+    goal_category: NotRequired[str]
+    god_name: NotRequired[str]
+
+
+def blessing(blessing_type: str, source: str, goal_name: str | None = None,
+             goal_category: str | None = None, god_name: str | None = None) -> Blessing:
+    payload: Blessing = {"blessing_type": blessing_type, "source": source}
+    if goal_name is not None:
+        payload["goal_name"] = goal_name
+    if goal_category is not None:
+        payload["goal_category"] = goal_category
+    if god_name is not None:
+        payload["god_name"] = god_name
+    return payload
+
+
+PAYLOAD_TYPES: dict[GameEventType, type] = {
+    GameEventType.ROLL_BATCH: RollBatch,
+    GameEventType.HOLD_BATCH: HoldBatch,
+    GameEventType.DIE_ROLLED: DieRolled,
+    GameEventType.DIE_SELECTED: DieIndex,
+    GameEventType.DIE_DESELECTED: DieIndex,
+    GameEventType.DIE_HELD: DieHeld,
+    GameEventType.POST_ROLL: RollValues,
+    GameEventType.PRE_ROLL: Empty,
+    GameEventType.TURN_ROLL: TurnScore,
+    GameEventType.TURN_LOCK_ADDED: TurnScore,
+    GameEventType.TURN_END: TurnEnd,
+    GameEventType.STATE_CHANGED: StateChanged,
+    GameEventType.LOCK: Lock,
+    GameEventType.GOAL_PROGRESS: GoalProgress,
+    GameEventType.MESSAGE: Message,
+    GameEventType.GOLD_REWARDED: Reward,
+    GameEventType.GOLD_GAINED: Reward,
+    GameEventType.INCOME_REWARDED: Reward,
+    GameEventType.INCOME_GAINED: Reward,
+    GameEventType.FAITH_REWARDED: Reward,
+    GameEventType.FAITH_GAINED: Reward,
+    GameEventType.BLESSING_REWARDED: Blessing,
+    GameEventType.BLESSING_GAINED: Blessing,
+}
+
+
+def _roll_batch_events(event: GameEvent) -> list[GameEvent]:
+    return [GameEvent(GameEventType.DIE_ROLLED, source=event.source, payload=die_rolled(i, old, new))
+            for i, old, new in zip(event.get('indices', ()), event.get('old', ()), event.get('new', ()))]
+
+
+def _hold_batch_events(event: GameEvent) -> list[GameEvent]:
+    return [GameEvent(GameEventType.DIE_HELD, source=event.source, payload=die_held(i, value))
+            for i, value in zip(event.get('indices', ()), event.get('values', ()))]
+
+
+FAN_OUT: dict[GameEventType, tuple[GameEventType, Callable[[GameEvent], list[GameEvent]]]] = {
+    GameEventType.ROLL_BATCH: (GameEventType.DIE_ROLLED, _roll_batch_events),
+    GameEventType.HOLD_BATCH: (GameEventType.DIE_HELD, _hold_batch_events),
+}
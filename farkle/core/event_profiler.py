@@ -0,0 +1,130 @@
+"""Opt-in instrumentation for EventListener dispatch.
+
+Enable with ``game.event_listener.enable_profiling()``; while enabled the listener
+records per-event-type publish counts, per-subscriber dispatch times (cumulative and
+percentiles over a rolling sample window), the queue depth high-water mark and every
+exception a subscriber raised (which dispatch otherwise swallows), with the last
+traceback per subscriber.
+
+Subscribers are reported by name, e.g. ``Game.on_event`` or ``SaveManager.on_event``;
+instances of the same class are aggregated.
+
+Usage:
+    profiler = game.event_listener.enable_profiling()
+    ...  # play a few turns
+    profiler.snapshot()['subscribers']['SaveManager.on_event']['p95_ms']
+    profiler.dump_json('event_profile.json')
+"""
+from __future__ import annotations
+import json
+import traceback
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Callable
+
+
+def subscriber_name(callback: Callable) -> str:
+    """Readable name for a subscriber callback (Class.method for bound methods)."""
+    owner = getattr(callback, '__self__', None)
+    func = getattr(callback, '__func__', callback)
+    name = getattr(func, '__name__', None) or type(callback).__name__
+    if owner is not None:
+        return f"{type(owner).__name__}.{name}"
+    return getattr(func, '__qualname__', name)
+
+
+class _SubscriberStats:
+    __slots__ = ("calls", "total", "max", "samples", "exceptions", "last_traceback")
+
+    def __init__(self, sample_size: int):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque[float] = deque(maxlen=sample_size)
+        self.exceptions = 0
+        self.last_traceback: str | None = None
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+class EventBusProfiler:
+    """Counters and timings collected by an EventListener with profiling enabled."""
+
+    def __init__(self, sample_size: int = 1024):
+        self.sample_size = sample_size
+        self.publish_counts: dict[str, int] = defaultdict(int)
+        self.dispatch_time_by_type: dict[str, float] = defaultdict(float)
+        self.queue_high_water = 0
+        self.exceptions = 0
+        self._subscribers: dict[str, _SubscriberStats] = {}
+        # (event type, subscriber) -> cumulative seconds, to attribute hitches to a cascade
+        self._by_type_subscriber: dict[tuple[str, str], float] = defaultdict(float)
+
+    # --- recording (called by EventListener) ----------------------------------
+    def record_publish(self, event_type, queue_depth: int) -> None:
+        self.publish_counts[event_type.name] += 1
+        if queue_depth > self.queue_high_water:
+            self.queue_high_water = queue_depth
+
+    def record_call(self, event_type, callback: Callable, seconds: float) -> None:
+        name = subscriber_name(callback)
+        stats = self._subscribers.get(name)
+        if stats is None:
+            stats = self._subscribers[name] = _SubscriberStats(self.sample_size)
+        stats.calls += 1
+        stats.total += seconds
+        if seconds > stats.max:
+            stats.max = seconds
+        stats.samples.append(seconds)
+        self.dispatch_time_by_type[event_type.name] += seconds
+        self._by_type_subscriber[(event_type.name, name)] += seconds
+
+    def record_exception(self, callback: Callable) -> None:
+        name = subscriber_name(callback)
+        stats = self._subscribers.get(name)
+        if stats is None:
+            stats = self._subscribers[name] = _SubscriberStats(self.sample_size)
+        stats.exceptions += 1
+        stats.last_traceback = traceback.format_exc()
+        self.exceptions += 1
+
+    # --- reporting -------------------------------------------------------------
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-compatible summary; times are in milliseconds."""
+        subscribers: dict[str, Any] = {}
+        for name, st in sorted(self._subscribers.items(), key=lambda kv: kv[1].total, reverse=True):
+            ordered = sorted(st.samples)
+            subscribers[name] = {
+                'calls': st.calls,
+                'total_ms': st.total * 1000.0,
+                'mean_ms': (st.total / st.calls * 1000.0) if st.calls else 0.0,
+                'p50_ms': _percentile(ordered, 0.50) * 1000.0,
+                'p95_ms': _percentile(ordered, 0.95) * 1000.0,
+                'p99_ms': _percentile(ordered, 0.99) * 1000.0,
+                'max_ms': st.max * 1000.0,
+                'exceptions': st.exceptions,
+                'last_traceback': st.last_traceback,
+            }
+        by_type: dict[str, dict[str, float]] = defaultdict(dict)
+        for (etype, name), seconds in self._by_type_subscriber.items():
+            by_type[etype][name] = seconds * 1000.0
+        return {
+            'publish_counts': dict(self.publish_counts),
+            'dispatch_ms_by_type': {k: v * 1000.0 for k, v in self.dispatch_time_by_type.items()},
+            'dispatch_ms_by_type_and_subscriber': dict(by_type),
+            'queue_high_water': self.queue_high_water,
+            'exceptions': self.exceptions,
+            'subscribers': subscribers,
+        }
+
+    def dump_json(self, path: str | Path) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+    def reset(self) -> None:
+        self.__init__(self.sample_size)
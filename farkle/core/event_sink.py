@@ -0,0 +1,125 @@
+"""Off-thread event sinks for I/O-bound subscribers.
+
+An AsyncEventSink is subscribed like any callback, but dispatch only takes a snapshot
+of the event (on the game thread, where game state is consistent) and appends it to a
+bounded queue; a daemon worker thread passes snapshots to the handler in order. Disk
+or network work in the handler therefore never runs inside the 30 FPS frame.
+
+The default snapshot is an EventSnapshot (event type plus a read-only copy of the
+payload). Subscribers that need game state pass ``snapshot=`` to capture it at publish
+time, e.g. SaveManager serialises the game into a fresh dict that only the worker
+touches afterwards.
+
+When the queue is full the oldest snapshot is dropped (counted in ``dropped``): sinks
+are meant for work where the newest state supersedes older ones. ``flush()`` is the
+barrier for shutdown and tests; it waits until every snapshot queued so far has been
+handled.
+
+Usage:
+    sink = game.event_listener.subscribe_async(write, {GameEventType.TURN_END})
+    ...
+    sink.flush()          # or game.event_listener.flush_sinks()
+"""
+from __future__ import annotations
+import threading
+from collections import deque
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
+
+from farkle.core.game_event import GameEvent, GameEventType
+
+
+@dataclass(frozen=True)
+class EventSnapshot:
+    """Immutable copy of a GameEvent, safe to read from another thread."""
+    type: GameEventType
+    payload: Mapping[str, Any]
+
+    @classmethod
+    def of(cls, event: GameEvent) -> "EventSnapshot":
+        return cls(event.type, MappingProxyType(dict(event.payload or {})))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.payload.get(key, default)
+
+
+class AsyncEventSink:
+    """Callable subscriber handing event snapshots to a worker thread."""
+
+    def __init__(self, handler: Callable[[Any], None], *,
+                 snapshot: Optional[Callable[[GameEvent], Any]] = None,
+                 maxsize: int = 64, name: str | None = None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.handler = handler
+        self.snapshot = snapshot or EventSnapshot.of
+        self.maxsize = maxsize
+        self.name = name or f"event-sink-{getattr(handler, '__qualname__', type(handler).__name__)}"
+        self._items: deque[Any] = deque()
+        self._cond = threading.Condition()
+        self._submitted = 0
+        self._done = 0
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.dropped = 0
+        self.errors = 0
+        self.last_error: BaseException | None = None
+
+    # --- game thread -------------------------------------------------------------
+    def __call__(self, event: GameEvent) -> None:
+        self.submit(self.snapshot(event))
+
+    def submit(self, item: Any) -> None:
+        """Queue an already-captured snapshot for the worker."""
+        with self._cond:
+            if self._closed:
+                return
+            if len(self._items) >= self.maxsize:
+                self._items.popleft()
+                self.dropped += 1
+                self._done += 1
+            self._items.append(item)
+            self._submitted += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def pending(self) -> int:
+        with self._cond:
+            return self._submitted - self._done
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until everything submitted so far has been handled; False on timeout."""
+        with self._cond:
+            target = self._submitted
+            return self._cond.wait_for(lambda: self._done >= target, timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Flush, then stop the worker; later events are ignored."""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        return flushed
+
+    # --- worker thread -----------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._items or self._closed)
+                if not self._items:
+                    return
+                item = self._items.popleft()
+            try:
+                self.handler(item)
+            except Exception as exc:
+                self.errors += 1
+                self.last_error = exc
+            with self._cond:
+                self._done += 1
+                self._cond.notify_all()
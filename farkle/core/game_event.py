@@ -1,6 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum, auto
+from collections.abc import Mapping
 from typing import Any, Optional
 
 class GameEventType(Enum):
@@ -52,6 +53,9 @@ class GameEventType(Enum):
     DIE_SELECTED = auto()
     DIE_DESELECTED = auto()
     DIE_HELD = auto()
+    # Batched dice events (parallel arrays); fanned out to DIE_ROLLED / DIE_HELD on demand
+    ROLL_BATCH = auto()
+    HOLD_BATCH = auto()
     # Shop / relic acquisition lifecycle
     SHOP_OPENED = auto()
     SHOP_CLOSED = auto()
@@ -83,14 +87,33 @@ class GameEventType(Enum):
     REQUEST_CHOICE_CONFIRM = auto()
     REQUEST_CHOICE_SKIP = auto()
 
+# Fine-grained per-die events; most catch-all subscribers declare them in `ignored_events`
+# so emitters can skip them entirely (see EventListener.has_subscribers).
+DICE_DETAIL_EVENTS = frozenset({
+    GameEventType.PRE_ROLL,
+    GameEventType.DIE_ROLLED,
+    GameEventType.POST_ROLL,
+    GameEventType.DIE_SELECTED,
+    GameEventType.DIE_DESELECTED,
+    GameEventType.DIE_HELD,
+    GameEventType.ROLL_BATCH,
+    GameEventType.HOLD_BATCH,
+})
+
+
 @dataclass(slots=True)
 class GameEvent:
     type: GameEventType
     source: Any | None = None
-    payload: Optional[dict[str, Any]] = None
+    # Plain dict (shapes for frequent events: farkle.core.event_payloads); any Mapping is accepted
+    payload: Optional[Mapping[str, Any]] = None
+    # Number of published events this delivery stands for. Only coalescing subscribers can
+    # see more than 1; everyone else gets each event as published, with coalesced == 1.
+    coalesced: int = 1
 
     def get(self, key: str, default: Any = None) -> Any:
-        return self.payload.get(key, default) if self.payload else default
+        payload = self.payload
+        return payload.get(key, default) if payload is not None else default
 
     def __repr__(self) -> str:  # Helpful for debugging
         return f"GameEvent(type={self.type}, payload={self.payload})"
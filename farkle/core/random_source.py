@@ -55,6 +55,14 @@ class RandomSource:
     def randrange(self, *args, **kwargs) -> int:  # type: ignore[override]
         return self._rng.randrange(*args, **kwargs)
 
+    def derive_seeds(self, count: int) -> list[int]:
+        """Draw ``count`` independent 63-bit seeds (e.g. one per simulated run).
+
+        The list depends only on this source's seed, so sharding it across any number
+        of workers plays the same runs.
+        """
+        return [self._rng.getrandbits(63) for _ in range(count)]
+
     def state(self) -> Any:
         """Return internal state (for advanced test assertions)."""
         return self._rng.getstate()
@@ -2,7 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from farkle.core.game_object import GameObject
 from farkle.core.effect_type import EffectType
-from farkle.core.game_event import GameEvent, GameEventType
+from farkle.core.game_event import DICE_DETAIL_EVENTS, GameEvent, GameEventType
 
 
 @dataclass
@@ -20,6 +20,8 @@ class TemporaryEffect(GameObject):
     It does NOT decrement on: TURN_ROLL, BANK, TURN_BANKED, GOAL_FULFILLED, or other
     intermediate events; those are intra-turn actions.
     """
+    ignored_events = DICE_DETAIL_EVENTS
+
     effect_type: EffectType
     duration: int  # in completed turns remaining
     
@@ -1,22 +1,34 @@
-from typing import List
+from typing import Any, Callable, List
 from farkle.dice.die import Die
 from farkle.core.game_event import GameEvent, GameEventType
+from farkle.core.event_payloads import empty, hold_batch, roll_batch, roll_values
 from farkle.ui.settings import WIDTH, HEIGHT, DICE_SIZE, MARGIN
-from farkle.ui.sprites.die_sprite import DieSprite  # new sprite bridge
 
 
 class DiceContainer:
-    """Encapsulates dice lifecycle & selection logic."""
+    """Encapsulates dice lifecycle & selection logic.
+
+    Scoring queries (unheld evaluation, selection score / combo / rule key) are cached
+    per dice state: roll counter, held mask, selection mask, face values and rules
+    version. A state is scored once no matter how many frames or hovers ask for it;
+    the cache is cleared on roll(), reset_all() and hold_selected_publish(), and a
+    selection toggle simply moves to a new key.
+    """
 
     def __init__(self, game, count: int = 6):
         self.game = game
         self.dice: List[Die] = []
         self.count = count
+        self.roll_counter = 0
+        self._score_cache: dict[tuple, Any] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.reset_all()
 
     # --- lifecycle -------------------------------------------------
     def reset_all(self):
         self.dice = []
+        self.invalidate_scoring_cache()
         # Clear out existing die sprites from groups (if any) by killing them
         renderer = getattr(self.game, 'renderer', None)
         if renderer and hasattr(renderer, 'sprite_groups'):
@@ -36,9 +48,10 @@ class DiceContainer:
                 self.game
             )
             self.dice.append(d)
-            # Attach sprite
+            # Attach sprite (sprite module only loaded when there is a renderer)
             if renderer:
                 try:
+                    from farkle.ui.sprites.die_sprite import DieSprite
                     ds = DieSprite(d, renderer.sprite_groups['dice'], renderer.layered)
                     # Ensure logical linkage for tests
                     d.sprite = ds
@@ -47,20 +60,30 @@ class DiceContainer:
 
     def roll(self):
         el = self.game.event_listener
-        el.publish(GameEvent(GameEventType.PRE_ROLL, payload={}))
+        # Per-die events are skipped outright when nobody listens (see EventListener.has_subscribers)
+        if el.has_subscribers(GameEventType.PRE_ROLL):
+            el.publish(GameEvent(GameEventType.PRE_ROLL, payload=empty()))
+        rng = getattr(self.game, 'rng', None)
         raw_values: list[int] = []
+        indices: list[int] = []
+        olds: list[int] = []
+        news: list[int] = []
         for idx, d in enumerate(self.dice):
             if not d.held:
-                old = d.value
-                rng = getattr(self.game, 'rng', None)
+                olds.append(d.value)
                 d.value = rng.randint(1,6) if rng else __import__('random').randint(1,6)
                 d.selected = False
-                raw_values.append(d.value)
-                el.publish(GameEvent(GameEventType.DIE_ROLLED, payload={"index": idx, "old": old, "new": d.value}))
-            else:
-                raw_values.append(d.value)
+                indices.append(idx)
+                news.append(d.value)
+            raw_values.append(d.value)
+        self.roll_counter += 1
+        self.invalidate_scoring_cache()
         self.game.locked_after_last_roll = False
-        el.publish(GameEvent(GameEventType.POST_ROLL, payload={"values": list(raw_values)}))
+        # One batch for the whole roll; per-die DIE_ROLLED subscribers get it fanned out
+        if el.has_subscribers(GameEventType.ROLL_BATCH):
+            el.publish(GameEvent(GameEventType.ROLL_BATCH, payload=roll_batch(indices, olds, news, [d.held for d in self.dice])))
+        if el.has_subscribers(GameEventType.POST_ROLL):
+            el.publish(GameEvent(GameEventType.POST_ROLL, payload=roll_values(raw_values)))
 
     def mark_scoring(self):
         for d in self.dice:
@@ -68,11 +91,66 @@ class DiceContainer:
         unheld = [d for d in self.dice if not d.held]
         if not unheld:
             return
-        values = [int(d.value) for d in unheld]
-        _, contributing, _ = self.game.rules.evaluate(values)
+        _, contributing, _ = self.unheld_evaluation()
         for i in contributing:
             unheld[i].scoring_eligible = True
 
+    # --- per-state scoring cache ------------------------------------
+    def invalidate_scoring_cache(self):
+        self._score_cache.clear()
+
+    def cache_stats(self) -> dict:
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "entries": len(self._score_cache)}
+
+    def _state_key(self, with_selection: bool) -> tuple:
+        # Face values are part of the key: abilities and the first-roll rescue rewrite
+        # die values without rolling.
+        held = 0
+        selected = 0
+        for i, d in enumerate(self.dice):
+            if d.held:
+                held |= 1 << i
+            if with_selection and d.selected:
+                selected |= 1 << i
+        values = tuple(int(d.value) for d in self.dice)
+        rules = self.game.rules
+        return (self.roll_counter, held, selected if with_selection else -1, values, id(rules), getattr(rules, 'version', 0))
+
+    def _cached(self, kind: str, with_selection: bool, compute: Callable[[], Any]) -> Any:
+        key = (kind,) + self._state_key(with_selection)
+        try:
+            result = self._score_cache[key]
+        except KeyError:
+            self.cache_misses += 1
+            result = compute()
+            self._score_cache[key] = result
+            return result
+        self.cache_hits += 1
+        return result
+
+    def unheld_evaluation(self) -> tuple:
+        """rules.evaluate of the unheld values (used indices refer to unheld order)."""
+        return self._cached('unheld', False, lambda: self._freeze(self.game.rules.evaluate(self.unheld_values())))
+
+    def selection_evaluation(self) -> tuple:
+        """rules.evaluate of the selected values."""
+        return self._cached('selection', True, lambda: self._freeze(self.game.rules.evaluate(self.selection_values())))
+
+    def selection_classification(self) -> tuple:
+        """(is_single_combo, rule_key, raw_score) of the current selection."""
+        return self._cached('classify', True, lambda: self.game.rules.classify_selection(self.selection_values()))
+
+    def selection_is_single_combo(self) -> bool:
+        return self.selection_classification()[0]
+
+    def selection_rule_key(self) -> str | None:
+        return self.selection_classification()[1]
+
+    @staticmethod
+    def _freeze(result) -> tuple:
+        total, used, breakdown = result
+        return total, tuple(used), tuple(breakdown)
+
     # --- queries ---------------------------------------------------
     def any_scoring_selection(self) -> bool:
         return any(d.selected and d.scoring_eligible for d in self.dice)
@@ -87,11 +165,9 @@ class DiceContainer:
         return [int(d.value) for d in self.dice if not d.held]
 
     def check_farkle(self) -> bool:
-        unheld = [d for d in self.dice if not d.held]
-        if not unheld:
+        if self.all_held():
             return False
-        values = [int(d.value) for d in unheld]
-        score, _, _ = self.game.rules.evaluate(values)
+        score, _, _ = self.unheld_evaluation()
         return score == 0
 
     # --- mutations -------------------------------------------------
@@ -100,24 +176,29 @@ class DiceContainer:
         rule_key = None
         raw_score = 0
         try:
-            selected_values = self.selection_values()
-            if self.game.rules.selection_is_single_combo(selected_values) and self.any_scoring_selection():
-                raw_score, _ = self.calculate_selected_score()
-                rule_key = self.game.rules.selection_rule_key(selected_values)
+            single, key, raw = self.selection_classification()
+            if single and self.any_scoring_selection():
+                raw_score, rule_key = raw, key
         except Exception:
             rule_key = None; raw_score = 0
-        for d in self.dice:
+        indices: list[int] = []
+        values: list[int] = []
+        for idx, d in enumerate(self.dice):
             if d.selected:
                 d.hold()
                 if rule_key and raw_score > 0:
                     d.combo_rule_key = rule_key
                     d.combo_points = raw_score
-                self.game.event_listener.publish(GameEvent(GameEventType.DIE_HELD, payload={"index": self.dice.index(d), "value": d.value}))
+                indices.append(idx)
+                values.append(d.value)
+        self.invalidate_scoring_cache()
+        el = self.game.event_listener
+        if indices and el.has_subscribers(GameEventType.HOLD_BATCH):
+            el.publish(GameEvent(GameEventType.HOLD_BATCH, payload=hold_batch(indices, values)))
 
     # --- scoring helpers -------------------------------------------
     def calculate_selected_score(self):
-        values = self.selection_values()
-        if not values:
+        if not any(d.selected for d in self.dice):
             return 0, []
-        total, indices, _ = self.game.rules.evaluate(values)
-        return total, indices
+        total, indices, _ = self.selection_evaluation()
+        return total, list(indices)
@@ -1,4 +1,5 @@
 import pygame
+from typing import Any, Mapping
 # Explicit sprite module imports to ensure classes load (avoid silent try/except swallowing)
 try:
     import farkle.ui.sprites.die_sprite as die_sprite  # ensures DieSprite definition loaded
@@ -13,11 +14,13 @@ except Exception as _e:
     pass
 from farkle.core.game_state_manager import GameStateManager
 from farkle.scoring.scoring import create_default_rules
+from farkle.scoring.turn_solver import TurnSolver
 from farkle.dice.die import Die
 from farkle.dice.dice_container import DiceContainer
-from farkle.level.level import Level, LevelState
+from farkle.level.level import DEFAULT_PROGRESSION, Level, LevelState
 from farkle.players.player import Player
-from farkle.core.game_event import GameEvent, GameEventType
+from farkle.core.game_event import DICE_DETAIL_EVENTS, GameEvent, GameEventType
+from farkle.core.event_payloads import die_index, lock, state_changed
 from farkle.core.event_listener import EventListener
 from farkle.core.actions import handle_lock as action_handle_lock, handle_roll as action_handle_roll, handle_bank as action_handle_bank, handle_next_turn as action_handle_next_turn
 from farkle.ui.input_controller import InputController
@@ -32,7 +35,10 @@ from farkle.meta.statistics_tracker import StatisticsTracker
 from farkle.ui.choice_window_manager import ChoiceWindowManager
 
 class Game:
-    def __init__(self, screen, font, clock, level: Level | None = None, *, rng_seed: int | None = None, auto_initialize: bool = True, skip_god_selection: bool = False):
+    # on_event never handles per-die events; declaring that lets emitters skip them
+    ignored_events = DICE_DETAIL_EVENTS
+
+    def __init__(self, screen, font, clock, level: Level | None = None, *, rng_seed: int | None = None, auto_initialize: bool = True, skip_god_selection: bool = False, headless: bool = False):
         """Core gameplay model: state, dice, scoring, events.
 
         Manages core game mechanics and state. UI concerns (tooltips, hotkeys, 
@@ -47,6 +53,8 @@ class Game:
             rng_seed: Optional seed for deterministic testing
             auto_initialize: If True, calls initialize() immediately
             skip_god_selection: If True, skips god selection at start
+            headless: Build only the model (no fonts, renderer, buttons or sprites);
+                screen/font/clock may be None. See Game.headless().
         """
         # Store construction parameters
         self.screen = screen
@@ -55,12 +63,16 @@ class Game:
         self._initial_level = level
         self._rng_seed = rng_seed
         self._skip_god_selection = skip_god_selection
+        self.is_headless = headless
         
         # Small font for auxiliary text
-        try:
-            self.small_font = pygame.font.Font(None, 22)
-        except Exception:
-            self.small_font = font
+        if headless:
+            self.small_font = None
+        else:
+            try:
+                self.small_font = pygame.font.Font(None, 22)
+            except Exception:
+                self.small_font = font
         
         # Initialize basic attributes that other code may check before initialize()
         self.rng = None
@@ -68,10 +80,22 @@ class Game:
         self.level_state = None
         self.event_listener = None
         self.state_manager = None
+        # Turn policy solver for hints/autoplay, created on first use (see actions.turn_solver)
+        self.turn_solver: TurnSolver | None = None
         
         # Auto-initialize if requested (default for backward compatibility)
         if auto_initialize:
             self.initialize()
+
+    @classmethod
+    def headless(cls, seed: int | None = None, level: Level | None = None, *, skip_god_selection: bool = True) -> "Game":
+        """Model-only game for simulations and servers: rules, dice, level, goals, scoring,
+        relics, gods, abilities and player, with no display, fonts or sprites.
+
+        Drive it with farkle.core.actions (handle_roll/handle_lock/handle_bank, autoplay_step)
+        or by publishing REQUEST_* events.
+        """
+        return cls(None, None, None, level, rng_seed=seed, skip_god_selection=skip_god_selection, headless=True)
     
     def initialize(self):
         """Initialize all game systems after construction.
@@ -92,8 +116,8 @@ class Game:
         # Use provided level or create a default level with disaster from JSON
         self.level = self._initial_level or Level.single(
             name="",  # Name will be replaced by disaster title from JSON
-            target_goal=300, 
-            max_turns=3,
+            target_goal=DEFAULT_PROGRESSION.first_target,
+            max_turns=DEFAULT_PROGRESSION.first_turns,
             description="",
             rng=self.rng
         )
@@ -124,6 +148,26 @@ class Game:
         self.gods = GodsManager(self)
         # Choice window manager: handles all selection screens (god selection, shop, etc.)
         self.choice_window_manager = ChoiceWindowManager(self)
+        # Choice window sprite (modal) for god selection, shop, etc.
+        self.choice_window_sprite = None
+        # Debug flag for layer printing
+        self._debug_layers_printed = False
+        self.show_help = False
+        if self.is_headless:
+            # Model only: no renderer, UI objects or sprites
+            self.renderer = None
+            # The rendered game re-deals the dice once its renderer exists; do the same so
+            # a seed plays identically with or without a display
+            self.dice_container.reset_all()
+            self.ui_dynamic = list(self.dice_container.dice)
+            self.ui_buttons = []
+            self.ui_misc: list[GameObject] = [self.player, self.gods]
+        else:
+            self._init_ui()
+        self._init_model_systems()
+
+    def _init_ui(self):
+        """Renderer, UI objects and their sprites (skipped for headless games)."""
         # Renderer handles all drawing/UI composition
         self.renderer = GameRenderer(self)
         # Recreate dice now that renderer exists so DieSprites attach to layered groups (initial container may have created dice before renderer ready)
@@ -151,7 +195,6 @@ class Game:
         except Exception:
             pass
         # Misc UI objects (help icon, overlays later)
-        self.show_help = False
     # Shop interaction handled via separate ShopScreen/overlay sprite; legacy inline overlay fully removed.
         self.ui_misc: list[GameObject] = [
             HelpIcon(10, self.screen.get_height() - 50, self, 40),
@@ -175,12 +218,6 @@ class Game:
                     pass
         except Exception:
             pass
-        # Choice window sprite (modal) for god selection, shop, etc.
-        self.choice_window_sprite = None
-        
-        # Debug flag for layer printing
-        self._debug_layers_printed = False
-        
         try:
             from farkle.ui.sprites.choice_window_sprite import ChoiceWindowSprite
             # Create sprite that will show/hide based on choice_window_manager state
@@ -212,6 +249,8 @@ class Game:
             setattr(self.gods, 'has_sprite', True)
         except Exception:
             pass
+
+    def _init_model_systems(self):
         # Event listener hub (create before abilities so filtered subscriptions can attach)
         self.event_listener = EventListener()
         # Statistics tracker for meta progression (achievements, upgrades, etc.)
@@ -224,6 +263,11 @@ class Game:
             pass
         # Internal flag: when True we defer TURN_START emission (e.g., awaiting shop interaction after advancement)
         self._defer_turn_start = False
+        # Set on TURN_END, cleared on TURN_START: a level completed by a GOAL_FULFILLED
+        # arriving after TURN_END advances at once instead of waiting for the next TURN_END
+        self._turn_ended = False
+        # Level whose LEVEL_COMPLETE was already published
+        self._completed_level = None
         # Subscribe player & goals
         self._subscribe_core_objects()
         # Subscribe relic manager
@@ -276,6 +320,8 @@ class Game:
         Safe to call multiple times: existing sprites persist; new goals (after level advance)
         get wrapped. Relic panel sprite re-created idempotently.
         """
+        if self.renderer is None:
+            return
         try:
             from farkle.ui.sprites.goal_sprites import GoalSprite
             from farkle.ui.sprites.relic_panel_sprite import RelicPanelSprite
@@ -299,11 +345,13 @@ class Game:
 
     # --- scoring preview helpers -------------------------------------------------
 
-    def compute_preview(self, parts: list[tuple[str,int]], source: str = "selection") -> dict:
+    def compute_preview(self, parts: list[tuple[str,int]], source: str = "selection") -> Mapping[str, Any]:
         """Delegated preview to `ScoringManager` (legacy compatibility wrapper).
 
         Prefer calling `self.scoring_manager.preview` directly; this helper remains
         for transitional code. If scoring_manager missing, returns trivial structure.
+        The result is read-only: it is the manager's memoized preview (a mappingproxy
+        whose "parts" is a tuple), so copy it before changing anything.
         """
         sm = getattr(self, 'scoring_manager', None)
         if sm:
@@ -344,6 +392,7 @@ class Game:
         self.message = "Click ROLL to start!"
         self.state_manager = GameStateManager(on_change=self._on_state_change)
         self.level_state.reset()
+        self._completed_level = None
         self.active_goal_index = 0
         # Reset per-level ability uses
     # Ability manager reset handles reroll availability now.
@@ -443,7 +492,7 @@ class Game:
 
     def _on_state_change(self, old_state, new_state):
         try:
-            self.event_listener.publish(GameEvent(GameEventType.STATE_CHANGED, payload={"old": old_state.name, "new": new_state.name}))
+            self.event_listener.publish(GameEvent(GameEventType.STATE_CHANGED, payload=state_changed(old_state.name, new_state.name)))
         except Exception:
             pass
 
@@ -455,7 +504,7 @@ class Game:
         return self.dice_container.any_scoring_selection()
 
     def selection_is_single_combo(self) -> bool:
-        return self.rules.selection_is_single_combo(self.dice_container.selection_values())
+        return self.dice_container.selection_is_single_combo()
 
     def update_current_selection_score(self):
         if self.selection_is_single_combo():
@@ -465,16 +514,11 @@ class Game:
 
     # Unified selection preview (migrated from renderer)
     def selection_preview(self, goal=None) -> tuple[int,int,int,float]:
-        if not (self.selection_is_single_combo() and self.any_scoring_selection()):
+        single, rule_key, raw = self.dice_container.selection_classification()
+        if not (single and self.any_scoring_selection()):
             return (0,0,0,1.0)
-        raw, _ = self.calculate_score_from_dice()
         if raw <= 0:
             return (0,0,0,1.0)
-        rule_key = None
-        try:
-            rule_key = self.rules.selection_rule_key(self.dice_container.selection_values())
-        except Exception:
-            rule_key = None
         if not rule_key:
             return (raw, raw, raw, 1.0)
         # Delegate modifier application & preview assembly to ScoringManager so selective bonuses apply.
@@ -502,17 +546,11 @@ class Game:
         verb: prefix for status message (e.g. 'Auto-locked', 'Locked').
         Returns True on success, False if selection invalid or score zero.
         """
-        if not (self.selection_is_single_combo() and self.any_scoring_selection()):
+        single, rule_key, add_score = self.dice_container.selection_classification()
+        if not (single and self.any_scoring_selection()):
             return False
-        add_score, _ = self.calculate_score_from_dice()
         if add_score <= 0:
             return False
-        # Identify rule_key for this selection (if available)
-        rule_key = None
-        try:
-            rule_key = self.rules.selection_rule_key(self.dice_container.selection_values())
-        except Exception:
-            rule_key = None
         # Accumulate turn score locally (used for UI enabling) but per-goal pending kept inside Goal
         self.turn_score += add_score
         self.current_roll_score = 0
@@ -539,13 +577,7 @@ class Game:
         self.locked_after_last_roll = True
         # Emit LOCK event so the target goal can accumulate pending
         try:
-            payload = {
-                "goal_index": self.active_goal_index,
-                "points": add_score
-            }
-            if rule_key:
-                payload["rule_key"] = rule_key
-            self.event_listener.publish(GameEvent(GameEventType.LOCK, payload=payload))
+            self.event_listener.publish(GameEvent(GameEventType.LOCK, payload=lock(self.active_goal_index, add_score, rule_key)))
         except Exception:
             pass
         return True
@@ -737,14 +769,14 @@ class Game:
         if self.state_manager.get_state() == self.state_manager.state.SELECTING_TARGETS and abm and abm.selecting_ability():
             sel = abm.selecting_ability()
             if sel and sel.target_type == 'die':
-                die_index = self.dice.index(target)
+                target_index = self.dice.index(target)
                 if button == 1:  # left click toggle
-                    if abm.attempt_target('die', die_index):
+                    if abm.attempt_target('die', target_index):
                         return True
                 elif button == 3:  # right click finalize
                     # Ensure current die is selected before finalizing (toggle if not)
-                    if die_index not in getattr(sel, 'collected_targets', []):
-                        abm.attempt_target('die', die_index)
+                    if target_index not in getattr(sel, 'collected_targets', []):
+                        abm.attempt_target('die', target_index)
                     if abm.finalize_selection():
                         return True
         if button == 3:
@@ -763,7 +795,7 @@ class Game:
                         return True  # consumed but no change
                     # Emit DIE_SELECTED only if we proceed to lock
                     try:
-                        self.event_listener.publish(GameEvent(GameEventType.DIE_SELECTED, payload={"index": self.dice.index(target)}))
+                        self.event_listener.publish(GameEvent(GameEventType.DIE_SELECTED, payload=die_index(self.dice.index(target))))
                     except Exception:
                         pass
                 else:
@@ -792,7 +824,7 @@ class Game:
                 self.update_current_selection_score()
                 # Emit appropriate event
                 try:
-                    self.event_listener.publish(GameEvent(GameEventType.DIE_SELECTED if not was_selected else GameEventType.DIE_DESELECTED, payload={"index": self.dice.index(target)}))
+                    self.event_listener.publish(GameEvent(GameEventType.DIE_SELECTED if not was_selected else GameEventType.DIE_DESELECTED, payload=die_index(self.dice.index(target))))
                 except Exception:
                     pass
                 return True
@@ -891,9 +923,9 @@ class Game:
             )
         ]
         
-        # Randomly select 3 gods to offer
+        # Randomly select 3 gods to offer (from the game's RNG so seeded games offer the same gods)
         import random
-        items = random.sample(all_items, 3)
+        items = (self.rng or random).sample(all_items, 3)
         
         # Create choice window
         window = ChoiceWindow(
@@ -927,7 +959,11 @@ class Game:
     # Internal: subscribe core objects
     def _subscribe_core_objects(self, reset: bool = False):
         if reset:
+            previous = self.event_listener
             self.event_listener = EventListener()
+            self.event_listener.set_deferred_phases(previous.deferred_phases)
+            # Deliveries still pending on the old hub belong to events already published
+            previous.flush_deferred()
         # Subscribe each object's on_event method
         # (Re)subscribe input controller first so it can mediate requests before goals react if needed.
         if hasattr(self, 'input_controller') and self.input_controller:
@@ -953,7 +989,7 @@ class Game:
         """Rebuild UI buttons to reflect new abilities (e.g., when gods level up)."""
         try:
             # Only rebuild if UI is fully initialized
-            if not hasattr(self, 'ui_buttons') or not hasattr(self, 'renderer'):
+            if not hasattr(self, 'ui_buttons') or getattr(self, 'renderer', None) is None:
                 return
             
             # Remove old button sprites from sprite groups
@@ -1050,7 +1086,7 @@ class Game:
             if self.level_state._all_disasters_fulfilled() and not self.level_state.completed:
                 self.level_state.completed = True
                 # After completion we wait for TURN_END if not already ended; if turn already ended (banked) we advance immediately.
-                if any(e.type == GameEventType.TURN_END for e in getattr(self, '_recent_events', [])):
+                if self._turn_ended:
                     self._advance_level_post_turn()
         elif et == GameEventType.BANK:
             # Initialize tracking of outstanding score applications for this bank.
@@ -1077,6 +1113,7 @@ class Game:
                     self._bank_applications_expected = 0
                     self._bank_applications_seen = 0
         elif et == GameEventType.TURN_END:
+            self._turn_ended = True
             reason = event.get("reason")
             # If the level just completed this turn, advance now
             if self.level_state.completed and reason in ("banked", "farkle", "level_complete"):
@@ -1125,12 +1162,8 @@ class Game:
                             self.begin_turn(fallback=True)
                         except Exception:
                             pass
-        # Track a small rolling window of recent events for ordering decisions
-        if not hasattr(self, '_recent_events'):
-            self._recent_events: list[GameEvent] = []
-        self._recent_events.append(event)
-        if len(self._recent_events) > 50:
-            self._recent_events.pop(0)
+        elif et == GameEventType.TURN_START:
+            self._turn_ended = False
         # Shop lifecycle transitions
         if et == GameEventType.LEVEL_ADVANCE_FINISHED:
             # Enter shop state
@@ -1178,8 +1211,8 @@ class Game:
 
     def _advance_level_post_turn(self):
         # Emit LEVEL_COMPLETE if not already
-        already = any(e.type == GameEventType.LEVEL_COMPLETE for e in getattr(self, '_recent_events', []))
-        if not already:
+        if self._completed_level is not self.level:
+            self._completed_level = self.level
             try:
                 self.event_listener.publish(GameEvent(GameEventType.LEVEL_COMPLETE, payload={
                     "level_name": self.level.name,
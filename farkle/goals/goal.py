@@ -1,12 +1,15 @@
 import pygame
 from farkle.core.game_object import GameObject
-from farkle.core.game_event import GameEvent, GameEventType
+from farkle.core.game_event import DICE_DETAIL_EVENTS, GameEvent, GameEventType
+from farkle.core.event_payloads import blessing, goal_progress, reward
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from farkle.game import Game
 
 class Goal(GameObject):
+    ignored_events = DICE_DETAIL_EVENTS
+
     def __init__(self, target_score: int, game: "Game", name: str = "", is_disaster: bool = True, reward_gold: int = 0, flavor: str = "", category: str = "", persona: str = "", reward_income: int = 0, reward_blessing: str = "", reward_faith: int = 0):
         super().__init__(name or "Goal")
         self.game = game
@@ -52,12 +55,7 @@ class Goal(GameObject):
                 try:
                     self.game.event_listener.publish(GameEvent(
                         GameEventType.GOLD_REWARDED,
-                        payload={
-                            "amount": self.reward_gold,
-                            "source": "goal_reward",
-                            "goal_name": self.name,
-                            "goal_category": self.category
-                        }
+                        payload=reward(self.reward_gold, "goal_reward", self.name, self.category)
                     ))
                 except Exception:
                     pass
@@ -70,13 +68,7 @@ class Goal(GameObject):
                     
                     self.game.event_listener.publish(GameEvent(
                         GameEventType.INCOME_REWARDED,
-                        payload={
-                            "amount": self.reward_income,
-                            "source": "goal_reward",
-                            "goal_name": self.name,
-                            "goal_category": self.category,
-                            "new_total": new_total
-                        }
+                        payload=reward(self.reward_income, "goal_reward", self.name, self.category, new_total=new_total)
                     ))
                 except Exception:
                     pass
@@ -85,12 +77,7 @@ class Goal(GameObject):
                 try:
                     self.game.event_listener.publish(GameEvent(
                         GameEventType.FAITH_REWARDED,
-                        payload={
-                            "amount": self.reward_faith,
-                            "source": "goal_reward",
-                            "goal_name": self.name,
-                            "goal_category": self.category
-                        }
+                        payload=reward(self.reward_faith, "goal_reward", self.name, self.category)
                     ))
                 except Exception:
                     pass
@@ -99,12 +86,7 @@ class Goal(GameObject):
                 try:
                     self.game.event_listener.publish(GameEvent(
                         GameEventType.BLESSING_REWARDED,
-                        payload={
-                            "blessing_type": self.reward_blessing,
-                            "source": "goal_reward",
-                            "goal_name": self.name,
-                            "goal_category": self.category
-                        }
+                        payload=blessing(self.reward_blessing, "goal_reward", self.name, self.category)
                     ))
                 except Exception:
                     pass
@@ -314,11 +296,7 @@ class Goal(GameObject):
                     self.subtract(adjusted)
                     delta = before - self.remaining
                     from farkle.core.game_event import GameEvent as GE, GameEventType as GET
-                    self.game.event_listener.publish(GE(GET.GOAL_PROGRESS, payload={
-                        "goal_name": self.name,
-                        "delta": delta,
-                        "remaining": self.remaining
-                    }))
+                    self.game.event_listener.publish(GE(GET.GOAL_PROGRESS, payload=goal_progress(self.name, delta, self.remaining)))
                     if self.is_fulfilled():
                         # Mark as fulfilled but don't publish event yet
                         # Store that we need to publish after TURN_END
@@ -144,7 +144,8 @@ class CategoryGod(God):
             category_predicate = lambda ctx: getattr(getattr(ctx, 'goal', None), 'category', '') == self.category
             modifier = ConditionalScoreModifier(
                 GlobalPartsMultiplier(1.2, priority=58, description=f"{self.name} Level 1"),
-                predicate=category_predicate
+                predicate=category_predicate,
+                goal_condition=('category', self.category)
             )
             
             # Emit SCORE_MODIFIER_ADDED event
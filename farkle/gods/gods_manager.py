@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 import pygame
 from farkle.core.game_object import GameObject
-from farkle.core.game_event import GameEvent, GameEventType
+from farkle.core.game_event import DICE_DETAIL_EVENTS, GameEvent, GameEventType
 from farkle.ui.settings import (
     TEXT_PRIMARY, TEXT_ACCENT, HEIGHT,
     CARD_BG_NORMAL, CARD_BG_SELECTED, CARD_BORDER_NORMAL, CARD_BORDER_SELECTED,
@@ -14,6 +14,8 @@ GOD_MAX_LEVEL = 3
 
 @dataclass
 class God(GameObject):
+    ignored_events = DICE_DETAIL_EVENTS
+
     name: str = ""
     lore: str = ""  # Lore text for choice window display
     description: str = ""  # Short description
@@ -150,6 +152,8 @@ class GodsManager(GameObject):
     - Each god implementation listens for specific events and levels up independently.
     - Effects are selective modifiers contributed via events (SCORE_MODIFIER_ADDED) and applied centrally by ScoringManager.
     """
+    ignored_events = DICE_DETAIL_EVENTS
+
     def __init__(self, game):
         super().__init__(name="GodsManager")
         self.game = game
@@ -6,6 +6,44 @@ import random
 if TYPE_CHECKING:
     from farkle.core.random_source import RandomSource
 
+@dataclass(frozen=True)
+class Progression:
+    """Level-to-level difficulty constants used by Level.advance.
+
+    Level 1 has one disaster of ``first_target`` points and ``first_turns`` turns; level
+    n raises the disaster target by ``target_step + target_step_per_level * n`` and adds
+    a turn every ``extra_turn_every`` levels. Petitions start at 2 and grow by one every
+    two levels up to ``max_petitions``.
+    """
+    first_target: int = 300
+    first_turns: int = 3
+    target_step: int = 400
+    target_step_per_level: int = 50
+    extra_turn_every: int = 3
+    max_petitions: int = 4
+
+    def disaster_target(self, prev_target: int, next_index: int) -> int:
+        return prev_target + self.target_step + self.target_step_per_level * next_index
+
+    def max_turns(self, prev_turns: int, next_index: int) -> int:
+        return prev_turns + (1 if next_index % self.extra_turn_every == 0 else 0)
+
+    def petition_count(self, next_index: int) -> int:
+        return min(2 + ((next_index - 1) // 2), self.max_petitions)
+
+    def curve(self, levels: int) -> List[Tuple[int, int]]:
+        """(disaster target, max turns) of levels 1..levels."""
+        target, turns = self.first_target, self.first_turns
+        result = [(target, turns)]
+        for index in range(2, levels + 1):
+            target, turns = self.disaster_target(target, index), self.max_turns(turns, index)
+            result.append((target, turns))
+        return result[:levels]
+
+
+DEFAULT_PROGRESSION = Progression()
+
+
 @dataclass(frozen=True)
 class Level:
     """Immutable level definition.
@@ -87,7 +125,8 @@ class Level:
                      goals=tuple(goals_list))
 
     @staticmethod
-    def advance(prev: 'Level', next_index: int, rng: 'RandomSource | random.Random | None' = None) -> 'Level':
+    def advance(prev: 'Level', next_index: int, rng: 'RandomSource | random.Random | None' = None,
+                progression: Progression = DEFAULT_PROGRESSION) -> 'Level':
         """Return the next level using progression rules:
         - Disasters: A new disaster is chosen each level. Target score increases.
         - Petitions: Progressive count - starts at 2, +1 every 2 levels, capped at 4
@@ -97,6 +136,7 @@ class Level:
           Level 6-7: 4 petitions
           Level 8+: 4 petitions
         - Turns: +1 turn every 3 levels
+        The constants come from ``progression`` (DEFAULT_PROGRESSION unless given).
         """
         # Import here to avoid circular dependency
         from farkle.level.lore_loader import load_petitions, load_disasters
@@ -105,7 +145,6 @@ class Level:
         if rng is None:
             rng = random.Random()
         
-        base_increase = 400
         new_goals = []
         level_name = f"Rite {next_index}"  # Default fallback
         
@@ -119,7 +158,7 @@ class Level:
                     old_disaster_target = target
                     break
             
-            new_target = old_disaster_target + base_increase + 50 * next_index
+            new_target = progression.disaster_target(old_disaster_target, next_index)
             
             disaster = rng.choice(disasters)
             # Use the disaster title as the level name
@@ -129,7 +168,7 @@ class Level:
         
         # Calculate how many petitions this level should have
         # Formula: min(2 + ((next_index - 1) // 2), 4)
-        petition_count = min(2 + ((next_index - 1) // 2), 4)
+        petition_count = progression.petition_count(next_index)
         
         # Generate new petitions
         petitions = load_petitions()
@@ -168,8 +207,7 @@ class Level:
                     new_goals.append((opt_name, opt_target, False, opt_reward_gold, opt_reward_income, opt_reward_blessing, opt_flavor, opt_category, opt_persona, opt_reward_faith))
         
         # Add extra turns every 3 levels
-        extra_turns = 1 if (next_index % 3 == 0) else 0
-        max_turns = prev.max_turns + extra_turns
+        max_turns = progression.max_turns(prev.max_turns, next_index)
         
         return Level(
             name=level_name,
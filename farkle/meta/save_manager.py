@@ -1,8 +1,11 @@
 """Autosave system for game state persistence."""
 from __future__ import annotations
 import json
+import os
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
+from farkle.core.event_listener import COALESCE_LATEST, EventPhase
+from farkle.core.event_sink import AsyncEventSink
 from farkle.core.game_event import GameEvent, GameEventType
 from farkle.goals.goal import Goal
 
@@ -10,8 +13,27 @@ if TYPE_CHECKING:
     from farkle.game import Game
 
 
+# Events that trigger an autosave
+AUTOSAVE_EVENTS = frozenset({
+    GameEventType.TURN_END,
+    GameEventType.LEVEL_COMPLETE,
+    GameEventType.GOAL_FULFILLED,
+    GameEventType.RELIC_PURCHASED,
+    GameEventType.SHOP_CLOSED,
+})
+
+
 class SaveManager:
-    """Manages automatic saving and loading of game state."""
+    """Manages automatic saving and loading of game state.
+
+    With ``attach(game, background=True)`` autosaves serialize the game during event
+    dispatch but write the file on a worker thread (see farkle.core.event_sink); call
+    flush() before reading the file and close() on shutdown.
+    """
+    # Saves after every other subscriber has handled the event, once per burst
+    # (a bank can fulfil goals, end the turn and complete the level in one cascade)
+    event_phase = EventPhase.PERSISTENCE
+    event_coalesce = COALESCE_LATEST
     
     def __init__(self, save_path: str | None = None):
         """Initialize the save manager.
@@ -30,23 +52,26 @@ class SaveManager:
         
         self.game: Game | None = None
         self._auto_save_enabled = True
+        # Background writer when attached with background=True
+        self._sink: AsyncEventSink | None = None
     
-    def attach(self, game: Game) -> None:
+    def attach(self, game: Game, background: bool = False) -> None:
         """Attach to a game instance and subscribe to events.
         
         Args:
             game: Game instance to monitor for autosave
+            background: Write autosaves on a worker thread instead of during dispatch
         """
+        self.close()
         self.game = game
         if game.event_listener:
             # Subscribe to events that trigger autosave
-            game.event_listener.subscribe(self.on_event, types={
-                GameEventType.TURN_END,
-                GameEventType.LEVEL_COMPLETE,
-                GameEventType.GOAL_FULFILLED,
-                GameEventType.RELIC_PURCHASED,
-                GameEventType.SHOP_CLOSED,
-            })
+            if background:
+                self._sink = game.event_listener.subscribe_async(
+                    self._write_autosave, AUTOSAVE_EVENTS, snapshot=self._autosave_snapshot, maxsize=4,
+                    coalesce=COALESCE_LATEST)
+            else:
+                game.event_listener.subscribe(self.on_event, types=AUTOSAVE_EVENTS)
     
     def on_event(self, event: GameEvent) -> None:
         """Handle game events for autosave triggers."""
@@ -54,13 +79,7 @@ class SaveManager:
             return
         
         # Save on significant events
-        if event.type in (
-            GameEventType.TURN_END,
-            GameEventType.LEVEL_COMPLETE,
-            GameEventType.GOAL_FULFILLED,
-            GameEventType.SHOP_CLOSED,
-            GameEventType.RELIC_PURCHASED,
-        ):
+        if event.type in AUTOSAVE_EVENTS:
             self.save()
     
     def save(self) -> bool:
@@ -74,13 +93,45 @@ class SaveManager:
         
         try:
             save_data = self._serialize_game_state()
-            
+        except Exception as e:
+            print(f"Warning: Could not save game to {self.save_path}: {e}")
+            return False
+        # A queued background write must not land after (and overwrite) this one
+        self.flush()
+        return self._write(save_data)
+    
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for pending background autosaves; False on timeout."""
+        return self._sink.flush(timeout) if self._sink else True
+    
+    def close(self, timeout: float | None = None) -> bool:
+        """Finish pending background autosaves and stop the writer thread."""
+        sink, self._sink = self._sink, None
+        if sink is None:
+            return True
+        if self.game is not None and self.game.event_listener:
+            return self.game.event_listener.unsubscribe_async(sink, timeout)
+        return sink.close(timeout)
+    
+    def _autosave_snapshot(self, event: GameEvent) -> dict[str, Any] | None:
+        # Runs during dispatch: the returned dict is owned by the writer thread from here on
+        if not self._auto_save_enabled or not self.game:
+            return None
+        return self._serialize_game_state()
+    
+    def _write_autosave(self, save_data: dict[str, Any] | None) -> None:
+        if save_data is not None:
+            self._write(save_data)
+    
+    def _write(self, save_data: dict[str, Any]) -> bool:
+        try:
             # Ensure directory exists
             self.save_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.save_path, 'w', encoding='utf-8') as f:
+            # Write then rename so a concurrent load never sees a partial file
+            tmp_path = self.save_path.with_name(self.save_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(save_data, f, indent=2)
-            
+            os.replace(tmp_path, self.save_path)
             return True
         except Exception as e:
             print(f"Warning: Could not save game to {self.save_path}: {e}")
@@ -92,6 +143,7 @@ class SaveManager:
         Returns:
             Saved game data dict, or None if no save exists or error
         """
+        self.flush()
         if not self.save_path.exists():
             return None
         
@@ -108,6 +160,7 @@ class SaveManager:
         Returns:
             True if save file exists and is readable
         """
+        self.flush()
         return self.save_path.exists()
     
     def delete_save(self) -> bool:
@@ -116,6 +169,7 @@ class SaveManager:
         Returns:
             True if deletion successful, False otherwise
         """
+        self.flush()
         try:
             if self.save_path.exists():
                 self.save_path.unlink()
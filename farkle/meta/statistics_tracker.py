@@ -7,7 +7,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
-from farkle.core.game_event import GameEvent, GameEventType
+from farkle.core.event_listener import EventPhase, merge_count
+from farkle.core.game_event import DICE_DETAIL_EVENTS, GameEvent, GameEventType
 
 if TYPE_CHECKING:
     from farkle.game import Game
@@ -171,6 +172,19 @@ class GameStatistics:
         return stats
 
 
+# Events that only increment a counter; bursts of them are delivered once with event.coalesced
+COUNTED_EVENTS = frozenset({
+    GameEventType.TURN_END,
+    GameEventType.RELIC_PURCHASED,
+    GameEventType.GOAL_FULFILLED,
+    GameEventType.LEVEL_COMPLETE,
+})
+
+
+def _merge_counted(held: GameEvent, new: GameEvent) -> GameEvent | None:
+    return merge_count(held, new) if new.type in COUNTED_EVENTS else None
+
+
 class StatisticsTracker:
     """Tracks game statistics by listening to events.
     
@@ -178,6 +192,11 @@ class StatisticsTracker:
     and records relevant events for later analysis, achievements, and
     meta-progression features.
     """
+    # Counts rolled dice from ROLL_BATCH; subscribing to the per-die events would make
+    # every roll fan out DIE_ROLLED (see EventListener.has_subscribers)
+    ignored_events = DICE_DETAIL_EVENTS - {GameEventType.ROLL_BATCH}
+    event_phase = EventPhase.META
+    event_coalesce = staticmethod(_merge_counted)
     
     def __init__(self, game: Game):
         """Initialize the statistics tracker.
@@ -216,19 +235,19 @@ class StatisticsTracker:
         # Additional event tracking
         # Track TURN_END instead of TURN_START to avoid counting the initial setup turn
         elif event.type == GameEventType.TURN_END:
-            self.current_session.turns_played += 1
+            self.current_session.turns_played += event.coalesced
         
-        elif event.type == GameEventType.DIE_ROLLED:
-            self.current_session.dice_rolled += 1
+        elif event.type == GameEventType.ROLL_BATCH:
+            self.current_session.dice_rolled += len(event.get('indices', ()))
         
         elif event.type == GameEventType.RELIC_PURCHASED:
-            self.current_session.relics_purchased += 1
+            self.current_session.relics_purchased += event.coalesced
         
         elif event.type == GameEventType.GOAL_FULFILLED:
-            self.current_session.goals_completed += 1
+            self.current_session.goals_completed += event.coalesced
         
         elif event.type == GameEventType.LEVEL_COMPLETE:
-            self.current_session.levels_completed += 1
+            self.current_session.levels_completed += event.coalesced
     
     def get_statistics(self) -> GameStatistics:
         """Get the current session statistics.
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from farkle.core.game_object import GameObject
-from farkle.core.game_event import GameEvent, GameEventType
+from farkle.core.game_event import DICE_DETAIL_EVENTS, GameEvent, GameEventType
+from farkle.core.event_payloads import blessing, reward
 from dataclasses import dataclass as _dc
 import pygame
 from typing import Any, TYPE_CHECKING
@@ -12,6 +13,8 @@ if TYPE_CHECKING:
 
 @dataclass
 class Player(GameObject):
+    ignored_events = DICE_DETAIL_EVENTS
+
     gold: int = 0
     faith: int = 0  # Meta currency (persists across games)
     temple_income: int = 0  # Gold awarded at the start of each level
@@ -58,10 +61,7 @@ class Player(GameObject):
             if self.temple_income > 0:
                 self.add_gold(self.temple_income)
                 from farkle.core.game_event import GameEvent as GE, GameEventType as GET
-                self.game.event_listener.publish(GE(GET.GOLD_GAINED, payload={
-                    "amount": self.temple_income, 
-                    "source": "temple_income"
-                }))
+                self.game.event_listener.publish(GE(GET.GOLD_GAINED, payload=reward(self.temple_income, "temple_income")))
         elif event.type == GameEventType.GOAL_FULFILLED:
             # Trigger reward claiming (goal will emit reward events)
             goal = event.get("goal")
@@ -76,13 +76,8 @@ class Player(GameObject):
                 self._apply_blessing(blessing_type)
                 # Emit BLESSING_GAINED to confirm receipt
                 from farkle.core.game_event import GameEvent as GE, GameEventType as GET
-                self.game.event_listener.publish(GE(GET.BLESSING_GAINED, payload={
-                    "blessing_type": blessing_type,
-                    "source": source,
-                    "goal_name": event.get("goal_name"),
-                    "goal_category": event.get("goal_category"),
-                    "god_name": event.get("god_name")
-                }))
+                self.game.event_listener.publish(GE(GET.BLESSING_GAINED, payload=blessing(
+                    blessing_type, source, event.get("goal_name"), event.get("goal_category"), event.get("god_name"))))
         elif event.type == GameEventType.GOLD_REWARDED:
             # Gold reward offered by goal or god - process and emit GOLD_GAINED
             amount = event.get("amount", 0)
@@ -91,13 +86,8 @@ class Player(GameObject):
                 self.add_gold(amount)
                 # Emit GOLD_GAINED to confirm receipt
                 from farkle.core.game_event import GameEvent as GE, GameEventType as GET
-                self.game.event_listener.publish(GE(GET.GOLD_GAINED, payload={
-                    "amount": amount,
-                    "source": source,
-                    "goal_name": event.get("goal_name"),
-                    "goal_category": event.get("goal_category"),
-                    "god_name": event.get("god_name")
-                }))
+                self.game.event_listener.publish(GE(GET.GOLD_GAINED, payload=reward(
+                    amount, source, event.get("goal_name"), event.get("goal_category"), event.get("god_name"))))
         elif event.type == GameEventType.INCOME_REWARDED:
             # Income reward offered by goal or god - process and emit INCOME_GAINED
             amount = event.get("amount", 0)
@@ -106,14 +96,8 @@ class Player(GameObject):
                 self.temple_income += amount
                 # Emit INCOME_GAINED to confirm receipt
                 from farkle.core.game_event import GameEvent as GE, GameEventType as GET
-                self.game.event_listener.publish(GE(GET.INCOME_GAINED, payload={
-                    "amount": amount,
-                    "source": source,
-                    "goal_name": event.get("goal_name"),
-                    "goal_category": event.get("goal_category"),
-                    "god_name": event.get("god_name"),
-                    "new_total": self.temple_income
-                }))
+                self.game.event_listener.publish(GE(GET.INCOME_GAINED, payload=reward(
+                    amount, source, event.get("goal_name"), event.get("goal_category"), event.get("god_name"), self.temple_income)))
         elif event.type == GameEventType.FAITH_REWARDED:
             # Faith reward offered by goal or god - process and emit FAITH_GAINED
             amount = event.get("amount", 0)
@@ -122,23 +106,18 @@ class Player(GameObject):
                 self.add_faith(amount)
                 # Emit FAITH_GAINED to confirm receipt
                 from farkle.core.game_event import GameEvent as GE, GameEventType as GET
-                self.game.event_listener.publish(GE(GET.FAITH_GAINED, payload={
-                    "amount": amount,
-                    "source": source,
-                    "goal_name": event.get("goal_name"),
-                    "goal_category": event.get("goal_category"),
-                    "god_name": event.get("god_name")
-                }))
+                self.game.event_listener.publish(GE(GET.FAITH_GAINED, payload=reward(
+                    amount, source, event.get("goal_name"), event.get("goal_category"), event.get("god_name"))))
 
     def _apply_blessing(self, blessing_type: str) -> None:
         """Apply a blessing to the player based on type."""
         try:
             if blessing_type == "double_score":
                 from farkle.blessings import DoubleScoreBlessing
-                blessing = DoubleScoreBlessing(duration=1)
-                self.active_effects.append(blessing)
-                blessing.player = self
-                blessing.activate(self.game)
+                effect = DoubleScoreBlessing(duration=1)
+                self.active_effects.append(effect)
+                effect.player = self
+                effect.activate(self.game)
         except Exception:
             pass
 
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from farkle.core.game_object import GameObject
 from farkle.scoring.score_modifiers import ScoreModifierChain, ScoreModifier, FlatRuleBonus, RuleSpecificMultiplier, ConditionalScoreModifier, GlobalPartsMultiplier
-from farkle.core.game_event import GameEventType
+from farkle.core.game_event import DICE_DETAIL_EVENTS, GameEventType
 
 @dataclass
 class Relic(GameObject):
@@ -11,6 +11,8 @@ class Relic(GameObject):
     normal GameObjects: activate() wires event subscription and emits
     SCORE_MODIFIER_ADDED events; centralized scoring applies modifiers.
     """
+    ignored_events = DICE_DETAIL_EVENTS
+
     active: bool = False
     modifier_chain: ScoreModifierChain = field(default_factory=ScoreModifierChain)
     # Ability modifications: list of (ability_id, delta) for UI description (non-authoritative; activation events drive logic)
@@ -320,7 +322,8 @@ class DisasterGoalScoreBonusRelic(Relic):
             modifiers=[
                 ConditionalScoreModifier(
                     predicate=_is_disaster_goal,
-                    inner=inner
+                    inner=inner,
+                    goal_condition=('is_disaster', True)
                 )
             ]
         )
@@ -340,7 +343,8 @@ class PetitionGoalScoreBonusRelic(Relic):
             modifiers=[
                 ConditionalScoreModifier(
                     predicate=_is_petition_goal,
-                    inner=inner
+                    inner=inner,
+                    goal_condition=('is_disaster', False)
                 )
             ]
         )
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from typing import List, Optional, Callable
-from farkle.core.game_event import GameEvent, GameEventType
+from farkle.core.game_event import DICE_DETAIL_EVENTS, GameEvent, GameEventType
 from farkle.relics.relic import Relic
 from farkle.shop.offer import ShopOffer
 
@@ -16,6 +16,7 @@ class RelicManager:
     * REQUEST_SKIP_SHOP or purchase -> close shop.
     * Gameplay requests gated externally while shop_open.
     """
+    ignored_events = DICE_DETAIL_EVENTS
 
     def __init__(self, game, *, randomize_offers: bool = True, offer_seed: int | None = None):
         self.game = game
@@ -63,9 +64,12 @@ class RelicManager:
         
         # Create and open choice window for shop
         if choice_items:
-            print(f"DEBUG: Creating shop choice window with {len(choice_items)} items")
-            for idx, item in enumerate(choice_items):
-                print(f"  Item {idx}: {item.name}, payload type={type(item.payload).__name__}")
+            # Diagnostics are for the interactive game; headless runs open thousands of shops
+            verbose = not getattr(self.game, 'is_headless', False)
+            if verbose:
+                print(f"DEBUG: Creating shop choice window with {len(choice_items)} items")
+                for idx, item in enumerate(choice_items):
+                    print(f"  Item {idx}: {item.name}, payload type={type(item.payload).__name__}")
             
             window = ChoiceWindow(
                 window_type="shop",
@@ -77,7 +81,8 @@ class RelicManager:
                 allow_minimize=True
             )
             
-            print(f"DEBUG: Created ChoiceWindow: type={window.window_type}, items={len(window.items)}")
+            if verbose:
+                print(f"DEBUG: Created ChoiceWindow: type={window.window_type}, items={len(window.items)}")
             
             # Set game state to CHOICE_WINDOW to disable normal UI interactions
             from farkle.core.game_state_enum import GameState
@@ -86,23 +91,25 @@ class RelicManager:
             # Open the window
             self.game.choice_window_manager.open_window(window)
             
-            print(f"DEBUG: Opened choice window, active window={self.game.choice_window_manager.active_window}")
+            if verbose:
+                print(f"DEBUG: Opened choice window, active window={self.game.choice_window_manager.active_window}")
             
-            # Update the choice window sprite to show the new window
-            print(f"DEBUG: Checking choice_window_sprite: {self.game.choice_window_sprite}")
-            if self.game.choice_window_sprite:
-                try:
-                    print(f"DEBUG: Assigning window to sprite...")
-                    self.game.choice_window_sprite.choice_window = window
-                    print(f"DEBUG: Calling sync_from_logical...")
-                    self.game.choice_window_sprite.sync_from_logical()
-                    print(f"DEBUG: Updated choice window sprite")
-                except Exception as e:
-                    print(f"ERROR: Failed to update choice window sprite for shop: {e}")
-                    import traceback
-                    traceback.print_exc()
-            else:
-                print(f"ERROR: choice_window_sprite is None!")
+            # Update the choice window sprite to show the new window (headless games have none)
+            if verbose:
+                print(f"DEBUG: Checking choice_window_sprite: {self.game.choice_window_sprite}")
+                if self.game.choice_window_sprite:
+                    try:
+                        print(f"DEBUG: Assigning window to sprite...")
+                        self.game.choice_window_sprite.choice_window = window
+                        print(f"DEBUG: Calling sync_from_logical...")
+                        self.game.choice_window_sprite.sync_from_logical()
+                        print(f"DEBUG: Updated choice window sprite")
+                    except Exception as e:
+                        print(f"ERROR: Failed to update choice window sprite for shop: {e}")
+                        import traceback
+                        traceback.print_exc()
+                else:
+                    print(f"ERROR: choice_window_sprite is None!")
         
         # Emit legacy events for any listeners
         el = self.game.event_listener
@@ -262,6 +269,10 @@ class RelicManager:
         }))
         self._close_shop(skipped=False)
 
+    def grant(self, relic: Relic) -> None:
+        """Activate a relic without a shop purchase (scenario setup, balance simulations)."""
+        self._purchase_relic(self.game, relic)
+
     def _purchase_relic(self, game, relic: Relic):
         self.active_relics.append(relic)
         relic.activate(game)
@@ -333,3 +344,9 @@ def _build_pool_once():
         DisasterGoalScoreBonusRelic,
         PetitionGoalScoreBonusRelic,
     ])
+
+
+def offer_pool() -> List[type[Relic]]:
+    """Relic classes the shop draws its offers from."""
+    _build_pool_once()
+    return RELIC_OFFER_POOL
@@ -0,0 +1,187 @@
+"""Exact per-roll probability tables for a scoring rule set.
+
+For each number of unheld dice (1..max_dice) the tables give the farkle probability,
+the distribution of the best immediate raw score and its expected value. Outcomes are
+enumerated as value multisets weighted by their multinomial probability, so six dice
+need 462 evaluations instead of 6**6.
+
+Tables are keyed by a fingerprint of the rule set (rule keys and point values), cached
+in memory and on disk as JSON (default ``~/.farkle/roll_tables/<fingerprint>_<max_dice>.json``),
+so a relic changing the rules only pays for one recomputation.
+
+Usage:
+    tables = load_roll_tables(game.rules)
+    tables.farkle_probability(3)   # chance that rolling three dice scores nothing
+    tables.expected_score(6)       # mean best raw score of a six-dice roll
+"""
+from __future__ import annotations
+import hashlib
+import json
+from dataclasses import dataclass, field
+from itertools import combinations_with_replacement
+from math import factorial
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from farkle.scoring.scoring import FACES, ScoringRules
+
+TABLES_FORMAT_VERSION = 1
+
+# (fingerprint, max_dice) -> RollTables
+_MEMORY_CACHE: Dict[Tuple[str, int], "RollTables"] = {}
+
+
+@dataclass(frozen=True)
+class RollStats:
+    """Outcome statistics for rolling a fixed number of dice once."""
+    dice: int
+    farkle_probability: float
+    expected_score: float
+    # best immediate raw score -> probability (0 is the farkle outcome)
+    score_distribution: Dict[int, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'dice': self.dice,
+            'farkle_probability': self.farkle_probability,
+            'expected_score': self.expected_score,
+            'score_distribution': {str(k): v for k, v in self.score_distribution.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RollStats":
+        return cls(
+            dice=int(data['dice']),
+            farkle_probability=float(data['farkle_probability']),
+            expected_score=float(data['expected_score']),
+            score_distribution={int(k): float(v) for k, v in data.get('score_distribution', {}).items()},
+        )
+
+
+@dataclass(frozen=True)
+class RollTables:
+    """RollStats for 1..max_dice dice under one rule-set fingerprint."""
+    fingerprint: str
+    stats: Dict[int, RollStats]
+
+    @property
+    def max_dice(self) -> int:
+        return max(self.stats, default=0)
+
+    def __getitem__(self, dice: int) -> RollStats:
+        return self.stats[dice]
+
+    def farkle_probability(self, dice: int) -> float:
+        return self.stats[dice].farkle_probability
+
+    def expected_score(self, dice: int) -> float:
+        return self.stats[dice].expected_score
+
+    def score_distribution(self, dice: int) -> Dict[int, float]:
+        return self.stats[dice].score_distribution
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'format': TABLES_FORMAT_VERSION,
+            'fingerprint': self.fingerprint,
+            'stats': [s.to_dict() for s in self.stats.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RollTables":
+        stats = [RollStats.from_dict(d) for d in data.get('stats', [])]
+        return cls(fingerprint=data['fingerprint'], stats={s.dice: s for s in stats})
+
+
+def rules_fingerprint(rules: ScoringRules) -> str:
+    """Stable hash of the rule set's rule keys and point values (in rule order)."""
+    described = []
+    for rule in rules.rules:
+        pat = rule.pattern()
+        if pat is not None and pat[0] is not None:
+            points: Any = pat[1]
+        else:
+            points = [getattr(rule, attr, None) for attr in ('points', 'three_kind_points')]
+        described.append([rule.rule_key, getattr(rule, 'combo_size', 0), points])
+    blob = json.dumps(described, separators=(',', ':'))
+    return hashlib.sha1(blob.encode('utf-8')).hexdigest()[:16]
+
+
+def compute_roll_tables(rules: ScoringRules, max_dice: int = 6) -> RollTables:
+    """Enumerate every value multiset of 1..max_dice dice and aggregate outcome stats."""
+    stats: Dict[int, RollStats] = {}
+    for n in range(1, max_dice + 1):
+        outcomes = 6 ** n
+        ways_by_score: Dict[int, int] = {}
+        for combo in combinations_with_replacement(FACES, n):
+            score, _, _ = rules.evaluate(list(combo))
+            ways = factorial(n)
+            for face in FACES:
+                ways //= factorial(combo.count(face))
+            ways_by_score[score] = ways_by_score.get(score, 0) + ways
+        distribution = {score: ways / outcomes for score, ways in sorted(ways_by_score.items())}
+        stats[n] = RollStats(
+            dice=n,
+            farkle_probability=ways_by_score.get(0, 0) / outcomes,
+            expected_score=sum(score * ways for score, ways in ways_by_score.items()) / outcomes,
+            score_distribution=distribution,
+        )
+    return RollTables(fingerprint=rules_fingerprint(rules), stats=stats)
+
+
+def default_cache_dir() -> Path:
+    return Path.home() / '.farkle' / 'roll_tables'
+
+
+def load_roll_tables(rules: ScoringRules, max_dice: int = 6, cache_dir: str | Path | None = None, use_disk: bool = True) -> RollTables:
+    """Return tables for `rules`, from memory, then disk, computing and storing on a miss.
+
+    Args:
+        rules: Active ScoringRules.
+        max_dice: Largest number of unheld dice to tabulate.
+        cache_dir: Directory for JSON cache files (defaults to ~/.farkle/roll_tables).
+        use_disk: If False, only the in-memory cache is used.
+    """
+    fingerprint = rules_fingerprint(rules)
+    key = (fingerprint, max_dice)
+    tables = _MEMORY_CACHE.get(key)
+    if tables is not None:
+        return tables
+    path = None
+    if use_disk:
+        path = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        path = path / f"{fingerprint}_{max_dice}.json"
+        tables = _load_file(path, fingerprint)
+    if tables is None:
+        tables = compute_roll_tables(rules, max_dice=max_dice)
+        if path is not None:
+            _save_file(path, tables)
+    _MEMORY_CACHE[key] = tables
+    return tables
+
+
+def clear_memory_cache() -> None:
+    _MEMORY_CACHE.clear()
+
+
+def _load_file(path: Path, fingerprint: str) -> RollTables | None:
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format') != TABLES_FORMAT_VERSION or data.get('fingerprint') != fingerprint:
+            return None
+        return RollTables.from_dict(data)
+    except (json.JSONDecodeError, OSError, KeyError, ValueError) as e:
+        print(f"Warning: Could not load roll tables from {path}: {e}")
+        return None
+
+
+def _save_file(path: Path, tables: RollTables) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(tables.to_dict(), f)
+    except OSError as e:
+        print(f"Warning: Could not save roll tables to {path}: {e}")
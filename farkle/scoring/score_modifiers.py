@@ -33,15 +33,34 @@ class ScoreModifierChain:
     * Support extension sources (Player, Relics, Temporary buffs) by allowing
       additive composition of chains or external views.
     """
-    __slots__ = ("_mods",)
+    __slots__ = ("_mods", "_pipeline", "_version")
 
     def __init__(self, modifiers: Iterable[ScoreModifier] | None = None):
         self._mods: List[ScoreModifier] = list(modifiers) if modifiers else []
+        # Compiled per-rule pipeline: None = stale, False = chain has uncompilable modifiers
+        self._pipeline: CompiledPipeline | bool | None = None
+        self._version = 0
         self._sort()
 
     # --- internal helpers ---
     def _sort(self):
         self._mods.sort(key=lambda m: getattr(m, 'priority', 100))
+        self._touch()
+
+    def _touch(self):
+        self._pipeline = None
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Mutation counter; changes whenever modifiers are added or removed."""
+        return self._version
+
+    def compiled(self) -> CompiledPipeline | None:
+        """Return the compiled pipeline, or None if some modifier cannot be compiled."""
+        if self._pipeline is None:
+            self._pipeline = CompiledPipeline.compile(self._mods) or False
+        return self._pipeline or None
 
     # --- mutation API ---
     def add(self, modifier: ScoreModifier) -> None:
@@ -55,6 +74,7 @@ class ScoreModifierChain:
     def remove(self, modifier: ScoreModifier) -> None:
         if modifier in self._mods:
             self._mods.remove(modifier)
+            self._touch()
 
     def remove_by_identity(self, modifier_type: str, data: dict) -> bool:
         """Remove first modifier matching class name and provided scalar attributes.
@@ -68,6 +88,7 @@ class ScoreModifierChain:
                 # All key/value pairs in data must match getattr(m, key)
                 if all(getattr(m, k, None) == v for k, v in data.items()):
                     self._mods.remove(m)
+                    self._touch()
                     return True
             except Exception:
                 continue
@@ -86,6 +107,10 @@ class ScoreModifierChain:
         then recompute aggregate from part effective values.
         """
         score_obj = getattr(context, 'score_obj', None)
+        if score_obj is not None:
+            pipeline = self.compiled()
+            if pipeline is not None:
+                return pipeline.apply(score_obj, getattr(context, 'goal', None))
         running = base
         # Apply all modifiers (selective CompositePartModifier effects)
         for m in self._mods:
@@ -231,7 +256,7 @@ class ConditionalScoreModifier(ScoreModifier):
     """
     priority: int = 60  # run after part-level adjustments by default
 
-    def __init__(self, inner: ScoreModifier, predicate):
+    def __init__(self, inner: ScoreModifier, predicate, goal_condition: tuple[str, object] | None = None):
         self.inner = inner
         # Inherit inner priority but run slightly after to ensure part adjustments exist
         try:
@@ -239,6 +264,9 @@ class ConditionalScoreModifier(ScoreModifier):
         except Exception:
             self.priority = 60
         self.predicate = predicate
+        # Optional declarative form of the predicate, (goal attribute, expected value):
+        # lets the chain compile this modifier into a goal-flag switch.
+        self.goal_condition = goal_condition
 
     def apply(self, base: int, context: ScoreContext) -> int:  # pragma: no cover (logic simple)
         try:
@@ -252,13 +280,15 @@ class ConditionalScoreModifier(ScoreModifier):
 class MandatoryGoalOnly(ConditionalScoreModifier):
     """Applies inner modifier only when context.goal is present and goal.mandatory is True."""
     def __init__(self, inner: ScoreModifier):
-        super().__init__(inner, predicate=lambda ctx: getattr(getattr(ctx, 'goal', None), 'mandatory', False) is True)
+        super().__init__(inner, predicate=lambda ctx: getattr(getattr(ctx, 'goal', None), 'mandatory', False) is True,
+                         goal_condition=('mandatory', True))
 
 
 class OptionalGoalOnly(ConditionalScoreModifier):
     """Applies inner modifier only when context.goal is present and goal.mandatory is False."""
     def __init__(self, inner: ScoreModifier):
-        super().__init__(inner, predicate=lambda ctx: getattr(getattr(ctx, 'goal', None), 'mandatory', None) is False)
+        super().__init__(inner, predicate=lambda ctx: getattr(getattr(ctx, 'goal', None), 'mandatory', None) is False,
+                         goal_condition=('mandatory', False))
 
 
 #############################################
@@ -294,3 +324,100 @@ class GlobalPartsMultiplier(ScoreModifier):
         # Let chain recompute total from parts later
         return base
 
+
+
+#############################################
+# Compiled pipeline                          #
+#############################################
+
+# Step: (goal_condition or None, rule_key or None for all parts, op, operand)
+_Step = tuple
+# Folded op: ('mul', factor) -> int(v * factor); ('add', amount) -> v + amount
+_Op = tuple
+
+
+class CompiledPipeline:
+    """Per-rule_key transforms equivalent to applying a chain of part modifiers.
+
+    Built from RuleSpecificMultiplier, FlatRuleBonus, GlobalPartsMultiplier and
+    ConditionalScoreModifier wrappers that declare a goal_condition. Each part's value
+    passes through the ops of the modifiers that would touch it, in chain order, so the
+    int truncation after every multiplication is preserved; only adjacent additions and
+    adjacent whole-number multiplications are folded. Conditions are evaluated once per
+    goal into a flag tuple, and programs are cached per (flags, rule_key).
+    """
+    __slots__ = ("steps", "conditions", "_programs")
+
+    def __init__(self, steps: List[_Step]):
+        self.steps = steps
+        self.conditions: tuple = tuple(dict.fromkeys(st[0] for st in steps if st[0] is not None))
+        self._programs: dict[tuple, tuple] = {}
+
+    @classmethod
+    def compile(cls, mods: Sequence[ScoreModifier]) -> "CompiledPipeline | None":
+        steps: List[_Step] = []
+        for m in mods:
+            condition = None
+            if isinstance(m, ConditionalScoreModifier):
+                condition = getattr(m, 'goal_condition', None)
+                if condition is None:
+                    return None
+                m = m.inner
+            step = cls._step(m)
+            if step is None:
+                return None
+            if step[1] is not None:
+                steps.append((condition,) + step)
+        return cls(steps)
+
+    @staticmethod
+    def _step(m: ScoreModifier):
+        """(rule_key, op, operand) for a compilable modifier; op None means no effect."""
+        kind = type(m)
+        if kind is RuleSpecificMultiplier:
+            mult = m.effect.mult
+            return (m.matcher.rule_key, 'mul' if mult != 1.0 else None, mult)
+        if kind is FlatRuleBonus:
+            amount = m.effect.amount
+            return (m.matcher.rule_key, 'add' if amount != 0 else None, amount)
+        if kind is GlobalPartsMultiplier:
+            return (None, 'mul' if m.mult != 1.0 else None, m.mult)
+        return None
+
+    def flags(self, goal) -> tuple:
+        if not self.conditions:
+            return ()
+        return tuple(goal is not None and getattr(goal, attr, None) == value for attr, value in self.conditions)
+
+    def program(self, flags: tuple, rule_key: str) -> tuple:
+        key = (flags, rule_key)
+        prog = self._programs.get(key)
+        if prog is None:
+            active = dict(zip(self.conditions, flags))
+            ops: List[list] = []
+            for condition, rk, op, operand in self.steps:
+                if rk is not None and rk != rule_key:
+                    continue
+                if condition is not None and not active[condition]:
+                    continue
+                if ops and ops[-1][0] == op and (op == 'add' or (float(operand).is_integer() and float(ops[-1][1]).is_integer())):
+                    ops[-1][1] = ops[-1][1] + operand if op == 'add' else ops[-1][1] * operand
+                else:
+                    ops.append([op, operand])
+            prog = tuple((op, operand) for op, operand in ops)
+            self._programs[key] = prog
+        return prog
+
+    def apply(self, score_obj, goal) -> int:
+        """Adjust every part of score_obj in place and return the sum of effective values."""
+        flags = self.flags(goal)
+        total = 0
+        for part in score_obj.parts:
+            current = part.adjusted if part.adjusted is not None else part.raw
+            value = current
+            for op, operand in self.program(flags, part.rule_key):
+                value = int(value * operand) if op == 'mul' else value + operand
+            if value != current:
+                part.adjusted = value
+            total += value
+        return total
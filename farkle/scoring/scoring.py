@@ -1,4 +1,31 @@
-from typing import List, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# Die faces understood by the histogram table (index 0 of a histogram is unused).
+FACES: Tuple[int, ...] = (1, 2, 3, 4, 5, 6)
+
+# Table entry: (total_score, claimed_count_per_face, breakdown)
+_TableEntry = Tuple[int, Tuple[int, ...], Tuple[Tuple[str, int], ...]]
+
+# Solver unit: (rule, face_counts consumed, points awarded, whole_roll)
+_Unit = Tuple['ScoringRule', Tuple[int, ...], int, bool]
+
+# Largest dense histogram-code table evaluate_batch keeps per dice count (7**6 for six dice).
+_DENSE_LUT_LIMIT = 1 << 20
+
+# Distinct selections classify_selection remembers per rule set.
+_SELECTION_LRU_SIZE = 512
+
+
+def _face_counts(faces: Dict[int, int]) -> Optional[Tuple[int, ...]]:
+    """Build a 7-slot face-count tuple (slot 0 unused); None if a face is outside 1..6."""
+    counts = [0] * 7
+    for face, n in faces.items():
+        if face not in FACES:
+            return None
+        counts[face] += n
+    return tuple(counts)
+
 
 class ScoringRule:
     """Base class for a scoring rule.
@@ -12,8 +39,18 @@ class ScoringRule:
 
     New: rule_key property (string) uniquely identifying category for selective modifiers.
     Subclasses should override _build_rule_key for specialized identification.
+
+    order_invariant: True when match() depends only on the multiset of dice values and
+    claims the first occurrences of each face it uses. ScoringRules can then serve the
+    rule from its histogram-keyed table instead of calling match() per roll.
+
+    pattern(): the dice one application consumes and the points it awards. Rules that
+    provide it take part in the exact best-partition solver; whole_roll marks patterns
+    that only count when they cover the entire roll (e.g. straights).
     """
     combo_size: int = 0  # override in subclasses
+    order_invariant: bool = False
+    whole_roll: bool = False
 
     def _build_rule_key(self) -> str:
         return self.__class__.__name__
@@ -26,8 +63,14 @@ class ScoringRule:
         """Return (score, indices_of_contributing_dice)."""
         raise NotImplementedError
 
+    def pattern(self) -> Optional[Tuple[Tuple[int, ...], int]]:
+        """Return (face_counts, points) for one application, or None if not expressible."""
+        return None
+
 
 class SingleValue(ScoringRule):
+    order_invariant = True
+
     def __init__(self, value: int, points: int):
         self.value = value
         self.points = points
@@ -41,8 +84,13 @@ class SingleValue(ScoringRule):
         score = len(indices) * self.points
         return score, indices
 
+    def pattern(self) -> Optional[Tuple[Tuple[int, ...], int]]:
+        return _face_counts({self.value: 1}), self.points
+
 
 class ThreeOfAKind(ScoringRule):
+    order_invariant = True
+
     def __init__(self, value: int, points: int):
         self.value = value
         self.points = points
@@ -58,9 +106,14 @@ class ThreeOfAKind(ScoringRule):
             return score, indices[:3]
         return 0, []
 
+    def pattern(self) -> Optional[Tuple[Tuple[int, ...], int]]:
+        return _face_counts({self.value: 3}), self.points
+
 
 class FourOfAKind(ScoringRule):
     """Four of a kind: double the value of the corresponding three of a kind."""
+    order_invariant = True
+
     def __init__(self, value: int, three_kind_points: int):
         self.value = value
         self.three_kind_points = three_kind_points
@@ -75,9 +128,14 @@ class FourOfAKind(ScoringRule):
             return self.three_kind_points * 2, indices[:4]
         return 0, []
 
+    def pattern(self) -> Optional[Tuple[Tuple[int, ...], int]]:
+        return _face_counts({self.value: 4}), self.three_kind_points * 2
+
 
 class FiveOfAKind(ScoringRule):
     """Five of a kind: triple the value of the corresponding three of a kind."""
+    order_invariant = True
+
     def __init__(self, value: int, three_kind_points: int):
         self.value = value
         self.three_kind_points = three_kind_points
@@ -92,9 +150,14 @@ class FiveOfAKind(ScoringRule):
             return self.three_kind_points * 3, indices[:5]
         return 0, []
 
+    def pattern(self) -> Optional[Tuple[Tuple[int, ...], int]]:
+        return _face_counts({self.value: 5}), self.three_kind_points * 3
+
 
 class SixOfAKind(ScoringRule):
     """Six of a kind: quadruple the value of the corresponding three of a kind."""
+    order_invariant = True
+
     def __init__(self, value: int, three_kind_points: int):
         self.value = value
         self.three_kind_points = three_kind_points
@@ -109,8 +172,14 @@ class SixOfAKind(ScoringRule):
             return self.three_kind_points * 4, indices[:6]
         return 0, []
 
+    def pattern(self) -> Optional[Tuple[Tuple[int, ...], int]]:
+        return _face_counts({self.value: 6}), self.three_kind_points * 4
+
 
 class Straight6(ScoringRule):
+    order_invariant = True
+    whole_roll = True
+
     def __init__(self, points: int):
         self.points = points
         self.combo_size = 6
@@ -123,8 +192,14 @@ class Straight6(ScoringRule):
             return self.points, list(range(6))
         return 0, []
 
+    def pattern(self) -> Optional[Tuple[Tuple[int, ...], int]]:
+        return _face_counts({face: 1 for face in range(1, 7)}), self.points
+
 
 class Straight1to5(ScoringRule):
+    order_invariant = True
+    whole_roll = True
+
     def __init__(self, points: int):
         self.points = points
         self.combo_size = 5
@@ -137,8 +212,14 @@ class Straight1to5(ScoringRule):
             return self.points, list(range(5))
         return 0, []
 
+    def pattern(self) -> Optional[Tuple[Tuple[int, ...], int]]:
+        return _face_counts({face: 1 for face in range(1, 6)}), self.points
+
 
 class Straight2to6(ScoringRule):
+    order_invariant = True
+    whole_roll = True
+
     def __init__(self, points: int):
         self.points = points
         self.combo_size = 5
@@ -151,30 +232,203 @@ class Straight2to6(ScoringRule):
             return self.points, list(range(5))
         return 0, []
 
+    def pattern(self) -> Optional[Tuple[Tuple[int, ...], int]]:
+        return _face_counts({face: 1 for face in range(2, 7)}), self.points
+
 
 class ScoringRules:
-    """Container for all active scoring rules."""
+    """Container for all active scoring rules.
+
+    Evaluation of order-invariant rules only depends on how many dice show each face,
+    so results are memoized in a table keyed by the face-count histogram (six dice have
+    only 462 distinct histograms). The table is dropped whenever add_rule/remove_rule
+    change the rule set and refilled lazily as histograms are seen. Mutate the rule set
+    through those methods rather than editing `rules` in place.
+
+    When every rule exposes a pattern(), table entries come from an exact best-partition
+    solver (a DP over sub-histograms) instead of the greedy combo_size ordering, so e.g.
+    nine 1s in a larger dice pool score six-of-a-kind plus three-of-a-kind.
+    """
     def __init__(self):
         self.rules: List[ScoringRule] = []
+        # Bumped on every rule-set change; lets callers key their own caches on it.
+        self.version: int = 0
+        self._ordered: Optional[List[ScoringRule]] = None
+        self._table: Dict[Tuple[int, ...], _TableEntry] = {}
+        # Best-partition solver state: units in claim order (None until built) and sub-histogram memo
+        self._units: Optional[List[_Unit]] = None
+        self._units_ok: bool = False
+        self._partition_memo: Dict[Tuple[int, ...], Tuple[int, int, Tuple[int, ...]]] = {}
+        # evaluate_batch lookup arrays per dice count (numpy, built on demand)
+        self._batch_luts: Dict[int, tuple] = {}
+        # classify_selection results by sorted selection values
+        self._selection_lru: "OrderedDict[Tuple[int, ...], Tuple[bool, Optional[str], int]]" = OrderedDict()
 
     def add_rule(self, rule: ScoringRule):
         self.rules.append(rule)
+        self._invalidate()
 
     def remove_rule(self, rule_type: type):
         self.rules = [r for r in self.rules if not isinstance(r, rule_type)]
+        self._invalidate()
+
+    def _invalidate(self):
+        self.version += 1
+        self._ordered = None
+        self._table = {}
+        self._units = None
+        self._partition_memo = {}
+        self._batch_luts = {}
+        self._selection_lru = OrderedDict()
+
+    def _ordered_rules(self) -> List[ScoringRule]:
+        # Rules ordered by descending combo size so larger combos claim dice first (stable on insertion order)
+        if self._ordered is None:
+            self._ordered = sorted(self.rules, key=lambda r: getattr(r, 'combo_size', 0), reverse=True)
+        return self._ordered
 
     def evaluate(self, dice: List[int]) -> Tuple[int, List[int], List[Tuple[str, int]]]:
         """Return (total_score, used_indices, breakdown)
 
-        breakdown: list of (rule_key, raw_points) for each contributing rule application.
-        (Currently each rule fires at most once; if future stacking occurs, duplicates may appear.)
+        breakdown: list of (rule_key, raw_points) for each contributing rule application,
+        largest combos first. Single-die rules are aggregated into one entry per rule; a
+        multi-die rule applied twice (larger dice pools) appears twice.
+        used_indices are ascending positions into `dice`.
+        """
+        entry = self._table_entry(dice)
+        if entry is None:
+            return self._evaluate_greedy(dice)
+        total, claimed, breakdown = entry
+        if total <= 0:
+            return 0, [], []
+        # Claimed dice are the first `claimed[face]` occurrences of each face
+        used: List[int] = []
+        seen = [0] * 7
+        for i, v in enumerate(dice):
+            if seen[v] < claimed[v]:
+                used.append(i)
+            seen[v] += 1
+        return total, used, list(breakdown)
+
+    # --- histogram table ----------------------------------------------------
+    @staticmethod
+    def histogram(dice: List[int]) -> Optional[Tuple[int, ...]]:
+        """Return face counts as a 7-tuple indexed by face (slot 0 unused).
+
+        Returns None if any value is not an int face in 1..6.
+        """
+        counts = [0] * 7
+        for v in dice:
+            if not (isinstance(v, int) and 1 <= v <= 6):
+                return None
+            counts[v] += 1
+        return tuple(counts)
+
+    def _table_entry(self, dice: List[int]) -> Optional[_TableEntry]:
+        key = self.histogram(dice)
+        if key is None:
+            return None
+        entry = self._table.get(key)
+        if entry is None:
+            if not all(getattr(r, 'order_invariant', False) for r in self.rules):
+                return None
+            entry = self._compile_entry(key)
+            self._table[key] = entry
+        return entry
+
+    def _compile_entry(self, key: Tuple[int, ...]) -> _TableEntry:
+        """Score a histogram and record how many dice of each face the result claims."""
+        units = self._partition_units()
+        if units is None:
+            # Rules without patterns: score the canonical (sorted) roll greedily
+            canonical = [face for face in FACES for _ in range(key[face])]
+            total, used, breakdown = self._evaluate_greedy(canonical)
+            claimed = [0] * 7
+            for i in used:
+                claimed[canonical[i]] += 1
+            return total, tuple(claimed), tuple(breakdown)
+        total, _, applied = self.best_partition(key)
+        claimed = [0] * 7
+        breakdown: List[Tuple[str, int]] = []
+        single_pos: Dict[int, int] = {}
+        for idx in sorted(applied):
+            rule, counts, points, _ = units[idx]
+            for face in FACES:
+                claimed[face] += counts[face]
+            if rule.combo_size <= 1 and idx in single_pos:
+                pos = single_pos[idx]
+                breakdown[pos] = (breakdown[pos][0], breakdown[pos][1] + points)
+                continue
+            single_pos[idx] = len(breakdown)
+            breakdown.append((rule.rule_key, points))
+        return total, tuple(claimed), tuple(breakdown)
+
+    # --- exact best-partition solver ------------------------------------------
+    def _partition_units(self) -> Optional[List[_Unit]]:
+        """Solver units in claim order, or None if some rule has no usable pattern."""
+        if self._units is None:
+            units: List[_Unit] = []
+            ok = True
+            for rule in self._ordered_rules():
+                pat = rule.pattern()
+                if pat is None or pat[0] is None:
+                    ok = False
+                    break
+                counts, points = pat
+                if points > 0:
+                    units.append((rule, counts, points, bool(getattr(rule, 'whole_roll', False))))
+            self._units = units
+            self._units_ok = ok
+        return self._units if self._units_ok else None
+
+    def best_partition(self, hist: Tuple[int, ...]) -> Tuple[int, int, Tuple[int, ...]]:
+        """Return (score, dice_used, unit_indices) of the maximum-score decomposition of `hist`.
+
+        hist is a 7-slot face-count tuple as produced by histogram(). Ties on score prefer
+        using more dice, then larger combos. Whole-roll units (straights) only count when
+        they cover the entire histogram. Returns (0, 0, ()) if the rule set has no patterns.
         """
+        units = self._partition_units()
+        if units is None:
+            return 0, 0, ()
+        best = self._best_sub_partition(hist, units)
+        n = sum(hist)
+        for idx, (_, counts, points, whole) in enumerate(units):
+            if whole and counts == hist and (points, n) >= best[:2]:
+                best = (points, n, (idx,))
+                break
+        return best
+
+    def _best_sub_partition(self, hist: Tuple[int, ...], units: List[_Unit]) -> Tuple[int, int, Tuple[int, ...]]:
+        # Every die of the lowest present face is either left unused or covered by a unit
+        # containing that face, so only those branches need exploring (memoized per sub-histogram).
+        memo = self._partition_memo
+        best = memo.get(hist)
+        if best is not None:
+            return best
+        face = next((f for f in FACES if hist[f]), 0)
+        if not face:
+            best = (0, 0, ())
+        else:
+            rest = list(hist)
+            rest[face] -= 1
+            best = self._best_sub_partition(tuple(rest), units)
+            for idx, (_, counts, points, whole) in enumerate(units):
+                if whole or not counts[face] or any(counts[f] > hist[f] for f in FACES):
+                    continue
+                score, used, applied = self._best_sub_partition(tuple(h - c for h, c in zip(hist, counts)), units)
+                cand = (score + points, used + sum(counts), (idx,) + applied)
+                if cand[:2] > best[:2] or (cand[:2] == best[:2] and cand[2] < best[2]):
+                    best = cand
+        memo[hist] = best
+        return best
+
+    def _evaluate_greedy(self, dice: List[int]) -> Tuple[int, List[int], List[Tuple[str, int]]]:
+        """Reference evaluation running every rule's match() against `dice`."""
         total_score = 0
         used_indices = set()
         breakdown: List[Tuple[str, int]] = []
-        # Process rules ordered by descending combo size so larger combos claim dice first
-        ordered = sorted(self.rules, key=lambda r: getattr(r, 'combo_size', 0), reverse=True)
-        for rule in ordered:
+        for rule in self._ordered_rules():
             score, indices = rule.match(dice)
             if score <= 0 or not indices:
                 continue
@@ -190,7 +444,113 @@ class ScoringRules:
             total_score += score
             used_indices.update(filtered)
             breakdown.append((rule.rule_key, score))
-        return total_score, list(used_indices), breakdown
+        return total_score, sorted(used_indices), breakdown
+
+    # --- batch scoring ------------------------------------------------------
+    def evaluate_batch(self, rolls):
+        """Score every row of an (N, k) array of dice faces in one call (requires numpy).
+
+        Returns (totals, used_mask, rule_ids):
+            totals:    int64[N] total score per row.
+            used_mask: bool[N, k] True where evaluate() reports the die as used.
+            rule_ids:  int16[N, P] index into `self.rules` for each breakdown entry,
+                       in breakdown order, padded with -1.
+
+        Rows are reduced to face-count histograms and looked up in per-histogram
+        arrays compiled from the same table evaluate() uses, so results are identical.
+        """
+        import numpy as np
+        rolls = np.asarray(rolls, dtype=np.int64)
+        if rolls.ndim != 2:
+            raise ValueError(f"rolls must be a 2-D array, got shape {rolls.shape}")
+        n, k = rolls.shape
+        if n and ((rolls < 1) | (rolls > 6)).any():
+            raise ValueError("dice faces must be in 1..6")
+        if not all(getattr(r, 'order_invariant', False) for r in self.rules):
+            return self._evaluate_batch_rows(rolls)
+        # Histogram code: each die adds radix**(face-1), so codes never need the counts themselves
+        radix = k + 1
+        weights = np.zeros(7, dtype=np.int64)
+        weights[1:] = radix ** np.arange(6, dtype=np.int64)
+        codes = weights[rolls].sum(axis=1)
+        if radix ** 6 <= _DENSE_LUT_LIMIT:
+            lut_total, lut_claimed, lut_ids = self._batch_lut(k)
+        else:
+            # Large pools: compile only the histograms present instead of a dense table
+            _, first, codes = np.unique(codes, return_index=True, return_inverse=True)
+            hists = np.stack([(rolls[first] == face).sum(axis=1) for face in range(7)], axis=1)
+            lut_total, lut_claimed, lut_ids = self._compile_lut(hists)
+        totals = lut_total[codes]
+        rule_ids = lut_ids[codes]
+        # Claims are prefixes: a die is used while fewer earlier dice of its face were seen than claimed
+        claimed = np.take_along_axis(lut_claimed[codes], rolls, axis=1)
+        cols = np.ascontiguousarray(rolls.T, dtype=np.int8)
+        rank = np.zeros(n, dtype=np.int8)
+        used = np.empty((n, k), dtype=bool)
+        for j in range(k):
+            rank[:] = 0
+            for i in range(j):
+                rank += cols[i] == cols[j]
+            used[:, j] = rank < claimed[:, j]
+        return totals, used, rule_ids
+
+    def _batch_lut(self, k: int) -> tuple:
+        """Dense lookup arrays indexed by mixed-radix histogram code for k dice."""
+        lut = self._batch_luts.get(k)
+        if lut is None:
+            import numpy as np
+            from itertools import combinations_with_replacement
+            radix = k + 1
+            weights = radix ** np.arange(6, dtype=np.int64)
+            hists = np.array([self.histogram(list(c)) for c in combinations_with_replacement(FACES, k)], dtype=np.int64)
+            lut = self._compile_lut(hists, codes=hists[:, 1:] @ weights, size=radix ** 6)
+            self._batch_luts[k] = lut
+        return lut
+
+    def _compile_lut(self, hists, codes=None, size: int | None = None) -> tuple:
+        """Build (totals, claimed, rule_ids) arrays for histogram rows placed at `codes`.
+
+        Without `codes` the arrays are compact and row i holds hists[i].
+        """
+        import numpy as np
+        entries = [self._table_entry([face for face in FACES for _ in range(int(h[face]))]) for h in hists]
+        rule_index = self._rule_index()
+        width = max((len(e[2]) for e in entries), default=0)
+        if codes is None:
+            size = len(entries)
+            codes = range(size)
+        lut_total = np.zeros(size, dtype=np.int64)
+        lut_claimed = np.zeros((size, 7), dtype=np.int8)
+        lut_ids = np.full((size, width), -1, dtype=np.int16)
+        for code, (total, claimed, breakdown) in zip(codes, entries):
+            lut_total[code] = total
+            lut_claimed[code] = claimed
+            for j, (rule_key, _) in enumerate(breakdown):
+                lut_ids[code, j] = rule_index[rule_key]
+        return lut_total, lut_claimed, lut_ids
+
+    def _rule_index(self) -> Dict[str, int]:
+        index: Dict[str, int] = {}
+        for i, rule in enumerate(self.rules):
+            index.setdefault(rule.rule_key, i)
+        return index
+
+    def _evaluate_batch_rows(self, rolls) -> tuple:
+        """Row-by-row fallback for rule sets that cannot use the histogram table."""
+        import numpy as np
+        n, k = rolls.shape
+        rule_index = self._rule_index()
+        results = [self.evaluate([int(v) for v in row]) for row in rolls]
+        width = max((len(r[2]) for r in results), default=0)
+        totals = np.zeros(n, dtype=np.int64)
+        used = np.zeros((n, k), dtype=bool)
+        rule_ids = np.full((n, width), -1, dtype=np.int16)
+        for i, (total, indices, breakdown) in enumerate(results):
+            totals[i] = total
+            used[i, indices] = True
+            for j, (rule_key, _) in enumerate(breakdown):
+                rule_ids[i, j] = rule_index[rule_key]
+        return totals, used, rule_ids
 
     def evaluate_matches(self, dice: List[int]) -> List[Tuple[ScoringRule, int, List[int]]]:
         """Return granular matches without aggregating indices; each rule attempted independently.
@@ -202,22 +562,34 @@ class ScoringRules:
                 matches.append((rule, score, indices))
         return matches
 
-    def selection_is_single_combo(self, dice: List[int]) -> bool:
-        if not dice:
-            return False
-        matches = self.evaluate_matches(dice)
-        if not matches:
-            return False
-        full_cover = [m for m in matches if len(m[2]) == len(dice)]
-        if not full_cover:
-            return False
-        max_size = max(m[0].combo_size for m in full_cover if hasattr(m[0], "combo_size"))
-        best = [m for m in full_cover if getattr(m[0], "combo_size", 0) == max_size]
-        return len(best) == 1 and best[0][0].combo_size == len(dice)
+    def classify_selection(self, dice: List[int]) -> Tuple[bool, Optional[str], int]:
+        """Return (is_single_combo, rule_key, raw_score) for a selection of dice values.
 
-    def selection_rule_key(self, dice: List[int]) -> str | None:
+        A selection is a single combo when exactly one largest rule covers every die and
+        its combo size equals the selection size; rule_key is that rule's key and
+        raw_score is evaluate(dice)[0]. Results are kept in a bounded LRU keyed by the
+        sorted values (only when every rule is order-invariant) and dropped on rule changes.
+        """
         if not dice:
-            return None
+            return False, None, 0
+        key: Optional[Tuple[int, ...]] = None
+        if all(getattr(r, 'order_invariant', False) for r in self.rules):
+            key = tuple(sorted(dice))
+            cached = self._selection_lru.get(key)
+            if cached is not None:
+                self._selection_lru.move_to_end(key)
+                return cached
+        rule = self._single_combo_rule(dice)
+        rule_key = getattr(rule, 'rule_key', rule.__class__.__name__) if rule is not None else None
+        result = (rule is not None, rule_key, self.evaluate(dice)[0])
+        if key is not None:
+            self._selection_lru[key] = result
+            if len(self._selection_lru) > _SELECTION_LRU_SIZE:
+                self._selection_lru.popitem(last=False)
+        return result
+
+    def _single_combo_rule(self, dice: List[int]) -> Optional[ScoringRule]:
+        # The unique largest rule covering every selected die, if its combo size equals the selection size
         matches = self.evaluate_matches(dice)
         if not matches:
             return None
@@ -227,10 +599,15 @@ class ScoringRules:
         max_size = max(m[0].combo_size for m in full_cover if hasattr(m[0], "combo_size"))
         best = [m for m in full_cover if getattr(m[0], "combo_size", 0) == max_size]
         if len(best) == 1 and best[0][0].combo_size == len(dice):
-            rule = best[0][0]
-            return getattr(rule, 'rule_key', rule.__class__.__name__)
+            return best[0][0]
         return None
 
+    def selection_is_single_combo(self, dice: List[int]) -> bool:
+        return self.classify_selection(dice)[0]
+
+    def selection_rule_key(self, dice: List[int]) -> str | None:
+        return self.classify_selection(dice)[1]
+
 
 def create_default_rules() -> 'ScoringRules':
     """Factory function to create a ScoringRules instance with standard Farkle rules.
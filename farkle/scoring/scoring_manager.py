@@ -1,12 +1,28 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Iterable, Optional
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Iterable, Mapping, Optional
 
+from farkle.core.event_listener import EventPhase
 from farkle.core.game_object import GameObject
-from farkle.core.game_event import GameEvent, GameEventType
+from farkle.core.game_event import DICE_DETAIL_EVENTS, GameEvent, GameEventType
 from farkle.scoring.score_types import Score, ScorePart
 from farkle.scoring.score_modifiers import ScoreModifierChain, ScoreModifier, ScoreContext
 
+# Distinct (parts, goal flags) previews kept per modifier epoch.
+_PREVIEW_CACHE_SIZE = 256
+
+
+def _freeze(value):
+    """Read-only copy of a preview dict (nested dicts become mappingproxies, lists tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 class _ScoreCtx:
     """Concrete context implementing ScoreContext protocol for modifier application."""
     def __init__(self, score_obj: Score, goal: object | None = None):
@@ -27,6 +43,10 @@ class ScoringManager(GameObject):
     * Track per-turn cumulative score (turn_score) only.
     * Incrementally builds modifier_chain on SCORE_MODIFIER_ADDED.
     """
+    ignored_events = DICE_DETAIL_EVENTS
+    # Sees modifier changes after the model objects that caused them
+    event_phase = EventPhase.SCORING
+
     game: object  # runtime Game reference (no direct type import to avoid circular dependency)
     modifier_chain: ScoreModifierChain = field(default_factory=ScoreModifierChain)
     turn_score: int = 0
@@ -38,10 +58,26 @@ class ScoringManager(GameObject):
         self.modifier_chain = ScoreModifierChain()
         self.turn_score = 0
         # Lean: no preview cache, no modifier_records
+        # Merged (event + relic + god) chain cache; rebuilt when the sources key changes.
+        # modifier_version is bumped by modifier/relic/god events; the sources key also
+        # tracks chain versions and activation flags for direct mutations (tests, loads).
+        self.modifier_version = 0
+        self.modifier_epoch = 0
+        self._merged_chain: ScoreModifierChain | None = None
+        self._merged_key: tuple | None = None
+        # Preview LRU (see preview()) and its instrumentation counters
+        self._preview_cache: OrderedDict[tuple, Mapping] = OrderedDict()
+        self._preview_epoch = -1
+        self.preview_hits = 0
+        self.preview_misses = 0
+        self.preview_uncached = 0
 
     # --- Event handling ----------------------------------------------------
     def on_event(self, event: GameEvent):  # type: ignore[override]
         et = event.type
+        if et in (GameEventType.SCORE_MODIFIER_ADDED, GameEventType.SCORE_MODIFIER_REMOVED,
+                  GameEventType.RELIC_PURCHASED, GameEventType.GOD_LEVEL_UP):
+            self.modifier_version += 1
         if et == GameEventType.SCORE_MODIFIER_ADDED:
             # Construct a lightweight modifier instance if possible from payload; fallback to no-op.
             payload = event.payload or {}
@@ -131,9 +167,51 @@ class ScoringManager(GameObject):
 
 
     # --- Preview / scoring API ---------------------------------------------
-    def preview(self, parts: List[tuple[str,int]], source: str = "selection", goal: object | None = None) -> dict:
-        """Return adjusted preview (no events)."""
-        return self._compute_score_dict(parts, emit_preview_events=False, source=source, goal=goal)
+    def preview(self, parts: List[tuple[str,int]], source: str = "selection", goal: object | None = None) -> Mapping:
+        """Return adjusted preview (no events) as a read-only mapping.
+
+        Results are memoized in a bounded LRU keyed by (parts, goal condition flags,
+        modifier epoch); the goal only matters through the flags the compiled modifier
+        pipeline switches on. Chains with opaque predicates are computed every time.
+        """
+        key = self._preview_key(parts, goal)
+        if key is None:
+            self.preview_uncached += 1
+            return _freeze(self._compute_score_dict(parts, emit_preview_events=False, source=source, goal=goal))
+        cached = self._preview_cache.get(key)
+        if cached is not None:
+            self._preview_cache.move_to_end(key)
+            self.preview_hits += 1
+            return cached
+        self.preview_misses += 1
+        result = _freeze(self._compute_score_dict(parts, emit_preview_events=False, source=source, goal=goal))
+        self._preview_cache[key] = result
+        if len(self._preview_cache) > _PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        return result
+
+    def _preview_key(self, parts: List[tuple[str,int]], goal: object | None) -> tuple | None:
+        try:
+            pipeline = self.merged_modifier_chain().compiled()
+            if pipeline is None:
+                return None
+            if self.modifier_epoch != self._preview_epoch:
+                self._preview_cache.clear()
+                self._preview_epoch = self.modifier_epoch
+            return (tuple((str(rk), int(raw)) for rk, raw in parts), pipeline.flags(goal), self.modifier_epoch)
+        except Exception:
+            return None
+
+    def preview_stats(self) -> dict:
+        """Preview cache counters (for profiling overlays)."""
+        lookups = self.preview_hits + self.preview_misses
+        return {
+            "hits": self.preview_hits,
+            "misses": self.preview_misses,
+            "uncached": self.preview_uncached,
+            "entries": len(self._preview_cache),
+            "hit_rate": (self.preview_hits / lookups) if lookups else 0.0,
+        }
 
     # Convenience wrapper for a single rule part
     # preview_single removed; call preview with single-part list if needed
@@ -146,8 +224,11 @@ class ScoringManager(GameObject):
     # finalize removed; use preview directly
 
     # --- Direct dice scoring -------------------------------------------------
-    def compute_from_dice(self, dice_values: List[int], source: str = "dice") -> dict:
-        """Evaluate raw parts from dice using game's ScoringRules then apply modifiers."""
+    def compute_from_dice(self, dice_values: List[int], source: str = "dice") -> Mapping:
+        """Evaluate raw parts from dice using game's ScoringRules then apply modifiers.
+
+        Read-only like preview(), including the empty result for non-scoring dice.
+        """
         parts: List[tuple[str,int]] = []
         try:
             total, used, breakdown = self._evaluate_dice(dice_values)
@@ -156,7 +237,7 @@ class ScoringManager(GameObject):
         except Exception:
             parts = []
         if not parts:
-            return {"parts": [], "total_raw": 0, "adjusted_total": 0, "score": None}
+            return _freeze({"parts": [], "total_raw": 0, "adjusted_total": 0, "score": None})
         return self.preview(parts, source=source)
 
     # Internal dice evaluation wrapper (migration path from Game.rules direct use)
@@ -186,55 +267,10 @@ class ScoringManager(GameObject):
             except Exception:
                 pass
         adjusted_total = score_obj.total_effective
-        # Build a dynamic merged modifier list: events-injected chain + live active relic chains.
+        # Merged modifier list: events-injected chain + live active relic and god chains.
         try:
             context = _ScoreCtx(score_obj, goal=goal)
-            from farkle.scoring.score_modifiers import ScoreModifierChain, ScoreModifier
-            merged = ScoreModifierChain()
-            # Deduplicate by (class name, scalar attribute values)
-            seen: set[tuple[str, tuple]] = set()
-            def _add_mod(m: ScoreModifier):
-                try:
-                    # Collect simple scalar identity snapshot for dedupe
-                    attrs = []
-                    for attr in ('rule_key','mult','amount','priority'):
-                        if hasattr(m, attr):
-                            attrs.append(getattr(m, attr))
-                    # For ConditionalScoreModifier, include predicate function to distinguish instances
-                    if hasattr(m, 'predicate'):
-                        attrs.append(id(getattr(m, 'predicate')))
-                    ident = (m.__class__.__name__, tuple(attrs))
-                    if ident in seen:
-                        return
-                    seen.add(ident)
-                    merged.add(m)
-                except Exception:
-                    merged.add(m)
-            # Event-populated modifiers
-            for m in self.modifier_chain.snapshot():
-                _add_mod(m)
-            # Live relic modifiers (tests may append relic directly without activation events)
-            try:
-                relic_mgr = getattr(self.game, 'relic_manager', None)
-                if relic_mgr:
-                    for relic in getattr(relic_mgr, 'active_relics', []):
-                        if not getattr(relic, 'active', True):
-                            continue
-                        for m in relic.modifier_chain.snapshot():
-                            _add_mod(m)
-            except Exception:
-                pass
-            # Live god modifiers
-            try:
-                gods_mgr = getattr(self.game, 'gods', None)
-                if gods_mgr:
-                    for god in getattr(gods_mgr, 'worshipped', []):
-                        if not getattr(god, 'active', True):
-                            continue
-                        for m in god.modifier_chain.snapshot():
-                            _add_mod(m)
-            except Exception:
-                pass
+            merged = self.merged_modifier_chain()
             adjusted_total = merged.apply(score_obj.total_raw, context)
         except Exception:
             adjusted_total = score_obj.total_effective
@@ -245,6 +281,75 @@ class ScoringManager(GameObject):
             "score": score_obj.to_dict(),
         }
 
+    # --- Merged modifier chain ------------------------------------------------
+    def _modifier_sources(self) -> list:
+        sources = []
+        try:
+            relic_mgr = getattr(self.game, 'relic_manager', None)
+            if relic_mgr:
+                sources.extend(getattr(relic_mgr, 'active_relics', []))
+        except Exception:
+            pass
+        try:
+            gods_mgr = getattr(self.game, 'gods', None)
+            if gods_mgr:
+                sources.extend(getattr(gods_mgr, 'worshipped', []))
+        except Exception:
+            pass
+        return sources
+
+    def _modifier_sources_key(self, sources: list) -> tuple:
+        live = []
+        for src in sources:
+            chain = getattr(src, 'modifier_chain', None)
+            live.append((id(src), bool(getattr(src, 'active', True)), id(chain), getattr(chain, 'version', None)))
+        return (self.modifier_version, id(self.modifier_chain), self.modifier_chain.version, tuple(live))
+
+    def merged_modifier_chain(self) -> ScoreModifierChain:
+        """Deduplicated chain of event, relic and god modifiers, rebuilt only on change."""
+        sources = self._modifier_sources()
+        key = self._modifier_sources_key(sources)
+        if self._merged_chain is None or key != self._merged_key:
+            self._merged_chain = self._build_merged_chain(sources)
+            self._merged_key = key
+            self.modifier_epoch += 1
+        return self._merged_chain
+
+    def _build_merged_chain(self, sources: list) -> ScoreModifierChain:
+        mods: list[ScoreModifier] = []
+        # Deduplicate by (class name, scalar attribute values)
+        seen: set[tuple[str, tuple]] = set()
+        def _add_mod(m: ScoreModifier):
+            try:
+                # Collect simple scalar identity snapshot for dedupe
+                attrs = []
+                for attr in ('rule_key','mult','amount','priority'):
+                    if hasattr(m, attr):
+                        attrs.append(getattr(m, attr))
+                # For ConditionalScoreModifier, include predicate function to distinguish instances
+                if hasattr(m, 'predicate'):
+                    attrs.append(id(getattr(m, 'predicate')))
+                ident = (m.__class__.__name__, tuple(attrs))
+                if ident in seen:
+                    return
+                seen.add(ident)
+                mods.append(m)
+            except Exception:
+                mods.append(m)
+        # Event-populated modifiers
+        for m in self.modifier_chain.snapshot():
+            _add_mod(m)
+        # Live relic / god modifiers (tests may append relics directly without activation events)
+        for src in sources:
+            try:
+                if not getattr(src, 'active', True):
+                    continue
+                for m in src.modifier_chain.snapshot():
+                    _add_mod(m)
+            except Exception:
+                pass
+        return ScoreModifierChain(mods)
+
     # --- Goal pending projection (no preview events) ---------------------
     def project_goal_pending(self, goal) -> int:
         """Return adjusted projection for a goal's current pending_raw using selective modifiers.
@@ -259,9 +364,8 @@ class ScoringManager(GameObject):
             score_obj = getattr(goal, '_pending_score', None)
             if score_obj is None:
                 return pending_raw
-            clone = score_obj.clone()
-            parts = [(p.rule_key, p.raw) for p in clone.parts]
-            comp = self._compute_score_dict(parts, emit_preview_events=False, source='goal_pending', goal=goal)
+            parts = [(p.rule_key, p.raw) for p in score_obj.parts]
+            comp = self.preview(parts, source='goal_pending', goal=goal)
             return int(comp.get('adjusted_total', pending_raw))
         except Exception:
             return int(getattr(goal, 'pending_raw', 0) or 0)
@@ -0,0 +1,483 @@
+"""Optimal single-turn strategy: which dice to lock, and when to bank or keep rolling.
+
+A turn state is (dice_to_roll, turn_score). Rolling draws a value multiset; a roll with
+no score farkles and the turn is worth 0. Otherwise the player locks a non-empty set of
+scoring dice (one combo at a time in the UI, possibly several combos per roll) and then
+either banks the turn score or rolls the remaining dice (all of them again after hot
+dice). Every lock strictly increases the turn score, so the state graph is acyclic in
+turn_score and a single backward sweep from the score cap is exact value iteration.
+
+Lock values go through a `part_value(rule_key, raw)` callback so relics, gods and goal
+conditions are reflected (see farkle.core.actions for the ScoringManager-backed one).
+Turn scores are bucketed by the gcd of all lock values (50 with the default rules).
+
+Two caches keep hint queries within a frame:
+  * a transposition table of lock options per face-count histogram, dropped only when
+    the rule set changes (ScoringRules.version);
+  * solved policies keyed by the adjusted value of every possible lock part and the
+    target, so a modifier change only re-runs the sweep and previously seen modifier
+    states are answered from memory.
+
+Usage:
+    solver = TurnSolver(game.rules)
+    policy = solver.solve(target=goal.remaining)
+    policy.should_bank(dice_left=2, turn_score=450)
+    solver.choose_lock(policy, [1, 5, 5, 2, 3, 3], turn_score=0)
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import combinations_with_replacement, product
+from math import factorial, gcd
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from farkle.scoring.roll_tables import RollTables, load_roll_tables
+from farkle.scoring.scoring import FACES, ScoringRules
+
+PartValue = Callable[[str, int], int]
+# One lockable combo: (rule_key, raw points, faces locked)
+LockUnit = Tuple[str, int, Tuple[int, ...]]
+
+
+@dataclass(frozen=True)
+class LockOption:
+    """A set of dice that can be locked from one roll, split into single-combo locks."""
+    hist: Tuple[int, ...]
+    units: Tuple[LockUnit, ...]
+
+    @property
+    def dice_used(self) -> int:
+        return sum(self.hist)
+
+    @property
+    def raw(self) -> int:
+        return sum(u[1] for u in self.units)
+
+
+@dataclass(frozen=True)
+class LockChoice:
+    """Best lock for a concrete roll, with the expected final turn score after it."""
+    option: LockOption
+    adjusted: int
+    expected: float
+
+    @property
+    def values(self) -> List[int]:
+        return [face for face in FACES for _ in range(self.option.hist[face])]
+
+
+@dataclass
+class TurnPolicy:
+    """Solved value tables; picklable so policies can be solved in worker processes.
+
+    value[n][i] is the expected final turn score with n dice to roll and a turn score of
+    i * bucket when the player may still bank; roll_value[n][i] assumes they roll.
+    """
+    dice_count: int
+    bucket: int
+    top: int
+    target: Optional[int]
+    part_values: Dict[Tuple[str, int], int]
+    value: List[List[float]] = field(default_factory=list)
+    roll_value: List[List[float]] = field(default_factory=list)
+
+    def index(self, turn_score: int) -> int:
+        return max(0, int(turn_score)) // self.bucket
+
+    def reward(self, turn_score: int) -> float:
+        return float(min(turn_score, self.target) if self.target is not None else turn_score)
+
+    def _dice(self, dice_left: int) -> int:
+        return dice_left if 0 < dice_left <= self.dice_count else self.dice_count
+
+    def expected(self, dice_left: int, turn_score: int) -> float:
+        """Expected final turn score playing optimally from this state (bank allowed)."""
+        i = self.index(turn_score)
+        if i >= self.top:
+            return self.reward(turn_score)
+        return self.value[self._dice(dice_left)][i]
+
+    def expected_roll(self, dice_left: int, turn_score: int) -> float:
+        """Expected final turn score if the player rolls now and plays optimally after."""
+        i = self.index(turn_score)
+        if i >= self.top:
+            return self.reward(turn_score)
+        return self.roll_value[self._dice(dice_left)][i]
+
+    def should_bank(self, dice_left: int, turn_score: int) -> bool:
+        if turn_score <= 0:
+            return False
+        return self.reward(turn_score) >= self.expected_roll(dice_left, turn_score)
+
+    def lock_value(self, option: LockOption) -> int:
+        return sum(self.part_values.get((u[0], u[1]), u[1]) for u in option.units)
+
+
+# (probability, best (dice_left, buckets gained) per resulting dice count) for one roll
+RollGroup = Tuple[float, Tuple[Tuple[int, int], ...]]
+
+
+@dataclass(frozen=True)
+class Transitions:
+    """Compiled roll outcomes for one lock-value assignment (see TurnSolver.transitions).
+
+    groups[n] lists the scoring outcomes of rolling n dice (farkles are the missing
+    probability mass); first_roll[n] is the same for a turn's first roll, where the
+    first-roll rescue turns some farkles into scoring rolls.
+    """
+    bucket: int
+    groups: Dict[int, List[RollGroup]]
+    first_roll: Dict[int, List[RollGroup]]
+
+
+def turn_distribution(moves: Transitions, top: int, dice_count: int,
+                      choose: Callable[[int, int, Tuple[Tuple[int, int], ...]], Tuple[int, int]],
+                      bank: Callable[[int, int], bool]) -> List[float]:
+    """Forward-propagate one turn's probability mass under a playing rule.
+
+    ``choose(n, i, moves)`` picks the (dice_left, buckets) move after rolling n dice at
+    turn score i buckets; ``bank(n, i)`` says whether to bank instead of rolling n dice.
+    Entry i of the result is the probability of banking i buckets (entry 0 includes
+    farkles); entry ``top`` is the probability of reaching ``top`` buckets or more.
+    """
+    out = [0.0] * (top + 1)
+    mass = [[0.0] * top for _ in range(dice_count + 1)]
+    mass[dice_count][0] = 1.0
+    for i in range(top):
+        for n in range(1, dice_count + 1):
+            m = mass[n][i]
+            if m <= 0.0:
+                continue
+            if i > 0 and bank(n, i):
+                out[i] += m
+                continue
+            scored = 0.0
+            for prob, options in (moves.first_roll[n] if i == 0 else moves.groups[n]):
+                scored += prob
+                nn, st = choose(n, i, options)
+                j = i + st
+                if j >= top:
+                    out[top] += m * prob
+                else:
+                    mass[nn][j] += m * prob
+            out[0] += m * (1.0 - scored)
+    return out
+
+
+class TurnSolver:
+    """Solves and caches optimal turn policies for one ScoringRules instance."""
+
+    def __init__(self, rules: ScoringRules, dice_count: int = 6, score_cap: int = 6000, first_roll_rescue: bool = True, max_policies: int = 64):
+        self.rules = rules
+        self.dice_count = dice_count
+        # Turn score at which banking is forced when no target caps the turn
+        self.score_cap = score_cap
+        # Mirrors actions.handle_roll turning one die into a 1 when a turn's first roll farkles
+        self.first_roll_rescue = first_roll_rescue
+        self.max_policies = max_policies
+        self._rules_version: Optional[int] = None
+        self._options: Dict[Tuple[int, ...], Tuple[LockOption, ...]] = {}
+        self._outcomes: Dict[int, List[Tuple[float, Tuple[int, ...]]]] = {}
+        self._parts: Optional[List[Tuple[str, int]]] = None
+        self._policies: "OrderedDict[tuple, TurnPolicy]" = OrderedDict()
+        self._transitions: Dict[tuple, Transitions] = {}
+        self._roll_tables: Optional[RollTables] = None
+        self.solves = 0
+
+    # --- transposition table ----------------------------------------------
+    def _sync(self) -> None:
+        if self._rules_version != self.rules.version:
+            self._rules_version = self.rules.version
+            self._options = {}
+            self._parts = None
+            self._policies.clear()
+            self._transitions = {}
+            self._roll_tables = None
+
+    def lock_options(self, hist: Tuple[int, ...]) -> Tuple[LockOption, ...]:
+        """All lockable dice sets of a roll histogram (empty tuple when it farkles).
+
+        Only dice the scorer marks eligible can be selected, and a set is lockable when
+        its best partition covers every die in it.
+        """
+        self._sync()
+        options = self._options.get(hist)
+        if options is None:
+            options = self._compile_options(hist)
+            self._options[hist] = options
+        return options
+
+    def _compile_options(self, hist: Tuple[int, ...]) -> Tuple[LockOption, ...]:
+        roll = [face for face in FACES for _ in range(hist[face])]
+        total, used, _ = self.rules.evaluate(roll)
+        if total <= 0:
+            return ()
+        eligible = [0] * 7
+        for i in used:
+            eligible[roll[i]] += 1
+        units = self.rules._partition_units()
+        options: List[LockOption] = []
+        for counts in product(*(range(eligible[face] + 1) for face in FACES)):
+            sub = (0,) + counts
+            n = sum(counts)
+            if n == 0:
+                continue
+            if units is not None:
+                score, covered, applied = self.rules.best_partition(sub)
+                if score <= 0 or covered != n:
+                    continue
+                lock_units = tuple(
+                    (units[idx][0].rule_key, units[idx][2], tuple(f for f in FACES for _ in range(units[idx][1][f])))
+                    for idx in applied
+                )
+            else:
+                # Rules without patterns: only single-combo selections are considered
+                values = [face for face in FACES for _ in range(sub[face])]
+                single, rule_key, score = self.rules.classify_selection(values)
+                if not single or score <= 0 or not rule_key:
+                    continue
+                lock_units = ((rule_key, score, tuple(values)),)
+            options.append(LockOption(sub, lock_units))
+        return tuple(options)
+
+    def roll_tables(self) -> RollTables:
+        """Per-dice-count farkle probability and score distribution of one roll under
+        these rules (in-memory roll_tables cache; recomputed when the rules change)."""
+        self._sync()
+        if self._roll_tables is None:
+            self._roll_tables = load_roll_tables(self.rules, self.dice_count, use_disk=False)
+        return self._roll_tables
+
+    def outcomes(self, dice: int) -> List[Tuple[float, Tuple[int, ...]]]:
+        """(probability, histogram) for every value multiset of `dice` dice."""
+        cached = self._outcomes.get(dice)
+        if cached is None:
+            cached = []
+            for combo in combinations_with_replacement(FACES, dice):
+                hist = tuple([0] + [combo.count(face) for face in FACES])
+                ways = factorial(dice)
+                for face in FACES:
+                    ways //= factorial(hist[face])
+                cached.append((ways / 6 ** dice, hist))
+            self._outcomes[dice] = cached
+        return cached
+
+    def parts(self) -> List[Tuple[str, int]]:
+        """Every (rule_key, raw) lock part reachable with up to dice_count dice."""
+        self._sync()
+        if self._parts is None:
+            seen: Dict[Tuple[str, int], None] = {}
+            for n in range(1, self.dice_count + 1):
+                for _, hist in self.outcomes(n):
+                    for option in self.lock_options(hist):
+                        for rule_key, raw, _ in option.units:
+                            seen[(rule_key, raw)] = None
+            self._parts = list(seen)
+        return self._parts
+
+    # --- solving -------------------------------------------------------------
+    def part_values(self, part_value: Optional[PartValue] = None) -> Dict[Tuple[str, int], int]:
+        """Adjusted value of every lock part (raw points when part_value is None)."""
+        values: Dict[Tuple[str, int], int] = {}
+        for rule_key, raw in self.parts():
+            values[(rule_key, raw)] = int(part_value(rule_key, raw)) if part_value else raw
+        return values
+
+    def solve(self, part_value: Optional[PartValue] = None, target: Optional[int] = None) -> TurnPolicy:
+        """Return the optimal policy, re-solving only for unseen (lock values, target) pairs.
+
+        Args:
+            part_value: Maps a lock part to its adjusted points (modifier chain aware).
+            target: If set, points beyond it are worthless (e.g. a goal's remaining score),
+                so the policy banks as soon as the turn reaches it.
+        """
+        return self.solve_values(self.part_values(part_value), target)
+
+    def solve_values(self, values: Dict[Tuple[str, int], int], target: Optional[int] = None) -> TurnPolicy:
+        self._sync()
+        key = (tuple(sorted(values.items())), _grid_target(values, target))
+        policy = self._policies.get(key)
+        if policy is not None:
+            self._policies.move_to_end(key)
+            return policy
+        policy = self._solve(values, key[1])
+        self._policies[key] = policy
+        if len(self._policies) > self.max_policies:
+            self._policies.popitem(last=False)
+        return policy
+
+    def solve_many(self, targets: Iterable[Optional[int]], part_value: Optional[PartValue] = None, processes: Optional[int] = None) -> Dict[Optional[int], TurnPolicy]:
+        """Solve one policy per target, sharding the sweeps across worker processes.
+
+        With processes None or <= 1 everything runs in this process. Results are added
+        to this solver's policy cache either way.
+        """
+        values = self.part_values(part_value)
+        pending = list(dict.fromkeys(targets))
+        results: Dict[Optional[int], TurnPolicy] = {}
+        if processes and processes > 1 and len(pending) > 1:
+            jobs = [(self.rules, self.dice_count, self.score_cap, self.first_roll_rescue, values, t) for t in pending]
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                for t, policy in zip(pending, pool.map(_solve_worker, jobs)):
+                    key = (tuple(sorted(values.items())), _grid_target(values, t))
+                    self._policies[key] = policy
+                    results[t] = policy
+            while len(self._policies) > self.max_policies:
+                self._policies.popitem(last=False)
+            return results
+        for t in pending:
+            results[t] = self.solve_values(values, t)
+        return results
+
+    def transitions(self, values: Dict[Tuple[str, int], int]) -> "Transitions":
+        """Roll outcomes per dice count, collapsed to their best (dice_left, buckets) moves.
+
+        Cached per lock-value assignment, so solving several targets (or computing their
+        score distributions) under one modifier state compiles the moves once.
+        """
+        self._sync()
+        key = tuple(sorted(values.items()))
+        cached = self._transitions.get(key)
+        if cached is not None:
+            return cached
+        bucket = _bucket(values)
+
+        def steps(option: LockOption) -> int:
+            # Locks always add at least one bucket so the sweep stays acyclic
+            return max(1, sum(values.get((u[0], u[1]), u[1]) for u in option.units) // bucket)
+
+        groups: Dict[int, List[Tuple[float, Tuple[Tuple[int, int], ...]]]] = {}
+        rescue_groups: Dict[int, List[Tuple[float, Tuple[Tuple[int, int], ...]]]] = {}
+        for n in range(1, self.dice_count + 1):
+            merged: Dict[Tuple[Tuple[int, int], ...], float] = {}
+            rescued: Dict[Tuple[Tuple[int, int], ...], float] = {}
+            for prob, hist in self.outcomes(n):
+                options = self.lock_options(hist)
+                if options:
+                    moves = self._moves(n, options, steps)
+                    merged[moves] = merged.get(moves, 0.0) + prob
+                    rescued[moves] = rescued.get(moves, 0.0) + prob
+                elif self.first_roll_rescue:
+                    # The first unheld die (any position equally likely) is turned into a 1
+                    for face in FACES:
+                        if hist[face] and face != 1:
+                            fixed = list(hist)
+                            fixed[face] -= 1
+                            fixed[1] += 1
+                            fixed_options = self.lock_options(tuple(fixed))
+                            if fixed_options:
+                                moves = self._moves(n, fixed_options, steps)
+                                rescued[moves] = rescued.get(moves, 0.0) + prob * hist[face] / n
+            groups[n] = [(p, m) for m, p in merged.items()]
+            rescue_groups[n] = [(p, m) for m, p in rescued.items()]
+        cached = Transitions(bucket, groups, rescue_groups if self.first_roll_rescue else groups)
+        self._transitions[key] = cached
+        if len(self._transitions) > self.max_policies:
+            self._transitions.pop(next(iter(self._transitions)))
+        return cached
+
+    def distribution(self, policy: TurnPolicy) -> List[float]:
+        """Banked-score distribution of one turn played by ``policy`` (see turn_distribution).
+
+        Entry i is the probability of banking i * policy.bucket points; the last entry
+        is reaching the policy's target (or the score cap when it has none).
+        """
+        moves = self.transitions(policy.part_values)
+        top, bucket = policy.top, policy.bucket
+        value, roll_value = policy.value, policy.roll_value
+
+        def cont(n: int, j: int) -> float:
+            return value[n][j] if j < top else policy.reward(j * bucket)
+
+        def choose(n: int, i: int, options: Tuple[Tuple[int, int], ...]) -> Tuple[int, int]:
+            return max(options, key=lambda move: cont(move[0], i + move[1]))
+
+        def bank(n: int, i: int) -> bool:
+            return policy.reward(i * bucket) >= roll_value[n][i]
+
+        return turn_distribution(moves, top, self.dice_count, choose, bank)
+
+    def _solve(self, values: Dict[Tuple[str, int], int], target: Optional[int]) -> TurnPolicy:
+        self.solves += 1
+        moves = self.transitions(values)
+        bucket = moves.bucket
+        cap = target if target is not None else self.score_cap
+        top = max(1, -(-cap // bucket))
+        policy = TurnPolicy(self.dice_count, bucket, top, target, dict(values))
+        groups, rescue_groups = moves.groups, moves.first_roll
+
+        reward = [policy.reward(i * bucket) for i in range(top)]
+        value = [[0.0] * top for _ in range(self.dice_count + 1)]
+        roll_value = [[0.0] * top for _ in range(self.dice_count + 1)]
+
+        def cont(n: int, j: int) -> float:
+            return value[n][j] if j < top else policy.reward(j * bucket)
+
+        for i in range(top - 1, -1, -1):
+            for n in range(1, self.dice_count + 1):
+                table = rescue_groups[n] if i == 0 else groups[n]
+                expected = 0.0
+                for prob, moves in table:
+                    expected += prob * max(cont(nn, i + st) for nn, st in moves)
+                roll_value[n][i] = expected
+                value[n][i] = max(reward[i], expected) if i > 0 else expected
+        policy.value = value
+        policy.roll_value = roll_value
+        return policy
+
+    def _moves(self, n: int, options: Tuple[LockOption, ...], steps: Callable[[LockOption], int]) -> Tuple[Tuple[int, int], ...]:
+        """Collapse lock options to the best score gain per resulting dice count."""
+        best: Dict[int, int] = {}
+        for option in options:
+            left = n - option.dice_used
+            nxt = left if left > 0 else self.dice_count
+            st = steps(option)
+            if st > best.get(nxt, 0):
+                best[nxt] = st
+        return tuple(sorted(best.items()))
+
+    # --- queries ---------------------------------------------------------------
+    def choose_lock(self, policy: TurnPolicy, values: List[int], turn_score: int, must_lock: bool = True) -> Optional[LockChoice]:
+        """Best dice to lock from the unheld `values`, or None.
+
+        With must_lock False (a combo was already locked this roll) None also means
+        locking more is not better than banking/rolling what is left.
+        """
+        hist = self.rules.histogram(values)
+        if hist is None:
+            return None
+        n = len(values)
+        best: Optional[LockChoice] = None
+        for option in self.lock_options(hist):
+            adjusted = policy.lock_value(option)
+            left = n - option.dice_used
+            expected = policy.expected(left if left > 0 else self.dice_count, turn_score + adjusted)
+            if best is None or expected > best.expected or (expected == best.expected and option.dice_used < best.option.dice_used):
+                best = LockChoice(option, adjusted, expected)
+        if best is not None and not must_lock and best.expected <= policy.expected(n, turn_score):
+            return None
+        return best
+
+
+def _bucket(values: Dict[Tuple[str, int], int]) -> int:
+    bucket = 0
+    for v in values.values():
+        if v > 0:
+            bucket = gcd(bucket, v)
+    return bucket or 1
+
+
+def _grid_target(values: Dict[Tuple[str, int], int], target: Optional[int]) -> Optional[int]:
+    # Turn scores move in whole buckets, so a target is reached exactly when its
+    # rounded-up bucket multiple is; rounding keeps odd remainders off a finer grid.
+    if target is None or target <= 0:
+        return None
+    bucket = _bucket(values)
+    return -(-int(target) // bucket) * bucket
+
+
+def _solve_worker(job) -> TurnPolicy:
+    rules, dice_count, score_cap, first_roll_rescue, values, target = job
+    solver = TurnSolver(rules, dice_count=dice_count, score_cap=score_cap, first_roll_rescue=first_roll_rescue)
+    return solver.solve_values(values, target)
@@ -0,0 +1,60 @@
+"""Batch simulation of headless Farkle runs (balance testing, bot evaluation).
+
+The balance and difficulty exports are imported on first access: both modules are also
+command line tools (``python -m farkle.sim.balance``), and importing them with the
+package would load them twice when run that way.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .policy import Action, Observation, Policy, PolicyDriver, SolverPolicy, ThresholdPolicy, apply_action, observe
+from .runner import RunResult, SimSummary, play_run, run_simulation, solver_policy
+from .tournament import TournamentResult, run_tournament, wilson_interval
+
+if TYPE_CHECKING:
+    from .balance import BalanceReport, Loadout, analyze_balance
+    from .difficulty import LevelDifficulty, TurnModel, difficulty_curve
+
+__all__ = [
+    'BalanceReport',
+    'Loadout',
+    'analyze_balance',
+    'LevelDifficulty',
+    'TurnModel',
+    'difficulty_curve',
+    'Action',
+    'Observation',
+    'Policy',
+    'PolicyDriver',
+    'SolverPolicy',
+    'ThresholdPolicy',
+    'apply_action',
+    'observe',
+    'RunResult',
+    'SimSummary',
+    'play_run',
+    'run_simulation',
+    'solver_policy',
+    'TournamentResult',
+    'run_tournament',
+    'wilson_interval',
+]
+
+
+_LAZY = {
+    'BalanceReport': 'balance',
+    'Loadout': 'balance',
+    'analyze_balance': 'balance',
+    'LevelDifficulty': 'difficulty',
+    'TurnModel': 'difficulty',
+    'difficulty_curve': 'difficulty',
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is not None:
+        from importlib import import_module
+        return getattr(import_module(f".{module}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,68 @@
+"""Command line entry point.
+
+    python -m farkle.sim --runs 10000 --seed 1
+    python -m farkle.sim --runs 2000 --seed 1 --policies solver,bank@300,bank@1000
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+import time
+
+from farkle.sim.policy import Policy, SolverPolicy, ThresholdPolicy
+from farkle.sim.runner import run_simulation
+from farkle.sim.tournament import run_tournament
+
+
+def parse_policy(spec: str) -> Policy:
+    """'solver' or 'bank@<points>'."""
+    if spec == "solver":
+        return SolverPolicy()
+    if spec.startswith("bank@"):
+        return ThresholdPolicy(int(spec[5:]))
+    raise argparse.ArgumentTypeError(f"unknown policy {spec!r} (use solver or bank@<points>)")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m farkle.sim", description="Play many headless runs and summarise them.")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--max-levels", type=int, default=50)
+    parser.add_argument("--policies", default=None, help="comma-separated policies to play a tournament, e.g. solver,bank@300")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    if args.policies:
+        try:
+            policies = [parse_policy(spec.strip()) for spec in args.policies.split(",") if spec.strip()]
+        except (argparse.ArgumentTypeError, ValueError) as exc:
+            parser.error(str(exc))
+        result = run_tournament(policies, args.runs, args.seed, args.workers, max_levels=args.max_levels)
+        if args.json:
+            json.dump(result.to_dict(), sys.stdout, indent=2)
+            print()
+        else:
+            print(result.format())
+        return 0
+
+    start = time.perf_counter()
+    summary = run_simulation(args.runs, args.seed, args.workers, max_levels=args.max_levels)
+    elapsed = time.perf_counter() - start
+    data = summary.to_dict()
+    data["seconds"] = round(elapsed, 3)
+    if args.json:
+        json.dump(data, sys.stdout, indent=2)
+        print()
+        return 0
+    print(f"{summary.runs} runs in {elapsed:.1f}s ({summary.runs / max(elapsed, 1e-9):.1f} runs/s)")
+    for name in summary.FIELDS:
+        stat = data[name]
+        print(f"  {name:15s} mean {stat['mean']:9.2f}  sd {stat['stdev']:8.2f}  min {stat['min']}  max {stat['max']}")
+    print(f"  survived        {summary.survived}")
+    print("  levels reached  " + "  ".join(f"{lvl}:{n}" for lvl, n in data["level_histogram"].items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""Relic and god balance analyzer: paired-seed marginal effects of each loadout.
+
+Every seed is played once per loadout: the baseline (no god, no relics), each relic of
+the shop's offer pool granted at the start, each god worshipped from the start and,
+with ``grid=True``, every god + relic pair. All runs skip every shop so the loadout
+stays fixed (turns are played by SolverPolicy), and all loadouts of a seed share its dice stream (common random numbers),
+so a loadout's effect is measured as the per-seed difference to the baseline instead of
+a difference of two noisy means.
+
+A worker plays all loadouts of one seed back to back on the process-wide TurnSolver
+(see runner._share_solver), so its policy cache stays warm between loadouts; seeds are
+sharded across a ProcessPoolExecutor.
+
+Reported per loadout: mean score per turn and levels reached (``max_levels + 1`` for a
+run that cleared them all, so losing on the last level counts), their paired deltas to
+the baseline with 95% intervals, the survival rate (runs that cleared ``max_levels``)
+and, for grid pairs, the interaction (pair - god - relic + baseline).
+
+Usage:
+    report = analyze_balance(runs=200, seed=1, workers=8, max_levels=10)
+    print(report.format())
+
+    python -m farkle.sim.balance --runs 200 --seed 1 --grid
+"""
+from __future__ import annotations
+import argparse
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from farkle.core.random_source import RandomSource
+from farkle.gods import Ares, Demeter, Hades, Hermes
+from farkle.relics.relic_manager import offer_pool
+from farkle.sim.policy import Action, Observation, SolverPolicy
+from farkle.sim.runner import Moments, RunResult, play_run
+
+GODS = (Demeter, Ares, Hades, Hermes)
+
+
+@dataclass(frozen=True)
+class Loadout:
+    """A god and/or relic (by class name) granted before the first turn."""
+    god: Optional[str] = None
+    relic: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        parts = [p for p in (self.god, self.relic) if p]
+        return " + ".join(parts) if parts else "baseline"
+
+    def __call__(self, game) -> None:
+        # Shop offers are shuffled from a fixed seed (with the game RNG's state restored
+        # afterwards) so skipped shops of different sizes don't shift the dice stream.
+        game.relic_manager.offer_seed = 0
+        if self.god:
+            god_class = next(g for g in GODS if g.__name__ == self.god)
+            game.gods.set_worshipped(list(game.gods.worshipped) + [god_class(game=game)])
+        if self.relic:
+            relic_class = next(r for r in offer_pool() if r.__name__ == self.relic)
+            game.relic_manager.grant(relic_class())
+
+
+def loadouts(grid: bool = False) -> List[Loadout]:
+    """Baseline first, then every relic, every god and (grid) every god + relic pair."""
+    relics = [r.__name__ for r in offer_pool()]
+    gods = [g.__name__ for g in GODS]
+    result = [Loadout()] + [Loadout(relic=r) for r in relics] + [Loadout(god=g) for g in gods]
+    if grid:
+        result += [Loadout(god=g, relic=r) for g in gods for r in relics]
+    return result
+
+
+class FixedLoadoutPolicy(SolverPolicy):
+    """SolverPolicy (including farkle rescues) that skips every shop so the loadout under
+    test stays fixed."""
+    name = "fixed-loadout"
+
+    def choose(self, obs: Observation) -> Action:
+        return Action.skip() if obs.window.allow_skip else super().choose(obs)
+
+
+def score_per_turn(result: RunResult) -> float:
+    return result.score / result.turns if result.turns else 0.0
+
+
+# --- workers -------------------------------------------------------------------------
+
+def _play_paired(seeds: List[int], configs: Sequence[Loadout], max_levels: int, max_steps: int) -> List[Tuple[int, List[tuple]]]:
+    policy = FixedLoadoutPolicy()
+    out = []
+    for seed in seeds:
+        runs = [tuple(play_run(seed, policy, max_levels, max_steps, config, skip_god_selection=True))
+                for config in configs]
+        out.append((seed, runs))
+    return out
+
+
+# --- report --------------------------------------------------------------------------
+
+@dataclass
+class LoadoutEffect:
+    loadout: Loadout
+    runs: int
+    score_per_turn: Moments
+    levels: Moments
+    survived: int
+    # Paired differences to the baseline (None for the baseline itself)
+    d_score_per_turn: Optional[Moments] = None
+    d_levels: Optional[Moments] = None
+    interaction: Optional[Moments] = None
+
+    @property
+    def survival(self) -> float:
+        return self.survived / self.runs if self.runs else 0.0
+
+    def to_dict(self) -> dict:
+        def moments(m: Optional[Moments]) -> Optional[dict]:
+            return None if m is None else {"mean": m.mean, "interval": list(m.interval())}
+        return {
+            "loadout": self.loadout.label,
+            "god": self.loadout.god,
+            "relic": self.loadout.relic,
+            "runs": self.runs,
+            "score_per_turn": moments(self.score_per_turn),
+            "levels_reached": moments(self.levels),
+            "survival": self.survival,
+            "delta_score_per_turn": moments(self.d_score_per_turn),
+            "delta_levels": moments(self.d_levels),
+            "interaction_levels": moments(self.interaction),
+        }
+
+
+@dataclass
+class BalanceReport:
+    runs: int
+    seed: Optional[int]
+    max_levels: int
+    baseline: LoadoutEffect
+    effects: List[LoadoutEffect]
+
+    def ranked(self, by: str = "levels") -> List[LoadoutEffect]:
+        """Loadouts sorted by paired delta, best first ("levels" or "score_per_turn")."""
+        attr = "d_levels" if by == "levels" else "d_score_per_turn"
+        return sorted(self.effects, key=lambda e: -getattr(e, attr).mean)
+
+    def to_dict(self, by: str = "levels") -> dict:
+        return {
+            "runs": self.runs,
+            "seed": self.seed,
+            "max_levels": self.max_levels,
+            "baseline": self.baseline.to_dict(),
+            "ranked": [e.to_dict() for e in self.ranked(by)],
+        }
+
+    def format(self, by: str = "levels") -> str:
+        base = self.baseline
+        lines = [
+            f"{self.runs} paired seeds, seed={self.seed}, horizon {self.max_levels} levels",
+            f"    {'baseline':34s} pts/turn {base.score_per_turn.mean:7.1f}  levels {base.levels.mean:5.2f}  survival {base.survival:6.1%}",
+        ]
+        for rank, e in enumerate(self.ranked(by), 1):
+            slo, shi = e.d_score_per_turn.interval()
+            llo, lhi = e.d_levels.interval()
+            line = (f"{rank:2d}. {e.loadout.label:34s} pts/turn {e.d_score_per_turn.mean:+7.1f} [{slo:+.1f}, {shi:+.1f}]"
+                    f"  levels {e.d_levels.mean:+5.2f} [{llo:+.2f}, {lhi:+.2f}]  survival {e.survival - base.survival:+6.1%}")
+            if e.interaction is not None:
+                line += f"  interaction {e.interaction.mean:+.2f}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def _build_report(configs: Sequence[Loadout], by_seed: Dict[int, List[RunResult]], runs: int,
+                  seed: Optional[int], max_levels: int) -> BalanceReport:
+    index = {c: i for i, c in enumerate(configs)}
+    effects = []
+    for i, config in enumerate(configs):
+        effect = LoadoutEffect(config, 0, Moments(), Moments(), 0)
+        if i:
+            effect.d_score_per_turn, effect.d_levels = Moments(), Moments()
+        pair = config.god and config.relic
+        if pair:
+            effect.interaction = Moments()
+        for results in by_seed.values():
+            r, base = results[i], results[0]
+            effect.runs += 1
+            effect.survived += bool(r.survived)
+            effect.score_per_turn.add(score_per_turn(r))
+            effect.levels.add(r.levels_reached)
+            if i:
+                effect.d_score_per_turn.add(score_per_turn(r) - score_per_turn(base))
+                effect.d_levels.add(r.levels_reached - base.levels_reached)
+            if pair:
+                god = results[index[Loadout(god=config.god)]]
+                relic = results[index[Loadout(relic=config.relic)]]
+                effect.interaction.add(r.levels_reached - god.levels_reached - relic.levels_reached + base.levels_reached)
+        effects.append(effect)
+    return BalanceReport(runs, seed, max_levels, effects[0], effects[1:])
+
+
+def analyze_balance(runs: int, seed: Optional[int] = None, workers: Optional[int] = None, *,
+                    grid: bool = False, max_levels: int = 10, max_steps: int = 20000,
+                    shard_size: Optional[int] = None) -> BalanceReport:
+    """Play ``runs`` paired seeds for every loadout and rank the loadouts' effects."""
+    configs = loadouts(grid)
+    seeds = RandomSource(seed).derive_seeds(runs)
+    by_seed: Dict[int, List[RunResult]] = {}
+
+    def collect(chunk) -> None:
+        for s, results in chunk:
+            by_seed[s] = [RunResult(*r) for r in results]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or runs <= 1:
+        collect(_play_paired(seeds, configs, max_levels, max_steps))
+    else:
+        workers = min(workers, runs)
+        size = shard_size or max(1, math.ceil(runs / (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_play_paired, seeds[i:i + size], configs, max_levels, max_steps)
+                       for i in range(0, runs, size)]
+            for future in as_completed(futures):
+                collect(future.result())
+    # Seed order, so reports do not depend on which shard finished first
+    by_seed = {s: by_seed[s] for s in seeds}
+    return _build_report(configs, by_seed, runs, seed, max_levels)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m farkle.sim.balance", description="Rank relics and gods by paired-seed marginal effect.")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--max-levels", type=int, default=10)
+    parser.add_argument("--grid", action="store_true", help="also play every god + relic pair")
+    parser.add_argument("--rank-by", choices=("levels", "score_per_turn"), default="levels")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    report = analyze_balance(args.runs, args.seed, args.workers, grid=args.grid, max_levels=args.max_levels)
+    if args.json:
+        json.dump(report.to_dict(args.rank_by), sys.stdout, indent=2)
+        print()
+    else:
+        print(report.format(args.rank_by))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""Level difficulty curve: per-level clear probability without playing games.
+
+Each level is one disaster of ``target`` points to be scored within ``max_turns`` turns
+(see Progression in farkle.level.level). Instead of simulating games, a turn is
+described by its banked-score distribution (TurnSolver.distribution, exact for the
+given policy), and turns are chained by a backward recursion over the remaining score:
+
+    clear(t, r) = sum_x P_r(x) * clear(t - 1, max(0, r - x)),   clear(t, 0) = 1
+
+where P_r is the distribution of one turn played towards ``r`` remaining points. Every
+level reads the same table, so the whole curve costs one pass over (turns, remaining).
+
+Policies:
+  * "solver": the TurnSolver policy aimed at the remaining score, i.e. what
+    actions.turn_hint / autoplay play. Remaining scores at or above ``horizon`` use the
+    untargeted policy (the turn rarely gets near them anyway).
+  * an int: lock the most points each roll and bank once the turn reaches that many
+    points (or the remaining score).
+
+Rerolls, relics, gods and petitions are not modelled; ``part_value`` can stand in for a
+fixed modifier state (same callback as TurnSolver.solve).
+
+Usage:
+    for level in difficulty_curve(50):
+        print(level.index, level.clear_probability)
+
+    python -m farkle.sim.difficulty --levels 50 --target-step 350
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass
+from operator import mul
+from typing import Dict, List, Optional, Union
+
+from farkle.level.level import DEFAULT_PROGRESSION, Progression
+from farkle.scoring.scoring import create_default_rules
+from farkle.scoring.turn_solver import PartValue, TurnSolver, turn_distribution
+
+TurnPolicySpec = Union[str, int]
+
+
+@dataclass(frozen=True)
+class LevelDifficulty:
+    index: int
+    target: int
+    max_turns: int
+    # P(clearing this level | it is reached)
+    clear_probability: float
+    # P(clearing this level and every level before it)
+    run_probability: float
+
+
+class TurnModel:
+    """Turn-score distributions per remaining score (in buckets), computed on demand."""
+
+    def __init__(self, policy: TurnPolicySpec = "solver", part_value: Optional[PartValue] = None,
+                 horizon: int = 3000, solver: Optional[TurnSolver] = None):
+        if policy != "solver" and not isinstance(policy, int):
+            raise ValueError(f"policy must be 'solver' or a bank threshold, not {policy!r}")
+        self.policy = policy
+        self.solver = solver or TurnSolver(create_default_rules())
+        self.values = self.solver.part_values(part_value)
+        self.moves = self.solver.transitions(self.values)
+        self.bucket = self.moves.bucket
+        self.horizon = max(1, -(-horizon // self.bucket))
+        self._cache: Dict[Optional[int], List[float]] = {}
+
+    def distribution(self, remaining: int) -> List[float]:
+        """P(banking i buckets) for a turn with ``remaining`` buckets to go; the last
+        entry is reaching the remaining score (or, past the horizon, the score cap)."""
+        key = remaining if remaining < self.horizon else None
+        dist = self._cache.get(key)
+        if dist is None:
+            dist = self._compute(key)
+            self._cache[key] = dist
+        return dist
+
+    def _compute(self, remaining: Optional[int]) -> List[float]:
+        solver = self.solver
+        if self.policy == "solver":
+            target = remaining * self.bucket if remaining is not None else None
+            return solver.distribution(solver.solve_values(self.values, target))
+        cap = remaining if remaining is not None else -(-solver.score_cap // self.bucket)
+        stop = min(-(-int(self.policy) // self.bucket), cap)
+
+        def choose(n, i, options):
+            return max(options, key=lambda move: (move[1], move[0]))
+
+        def bank(n, i):
+            return i >= stop
+
+        return turn_distribution(self.moves, cap, solver.dice_count, choose, bank)
+
+
+def clear_table(model: TurnModel, max_remaining: int, max_turns: int) -> List[List[float]]:
+    """table[t][r]: probability of scoring r buckets within t turns."""
+    prev = [1.0] + [0.0] * max_remaining
+    table = [prev]
+    for _ in range(max_turns):
+        cur = [1.0] + [0.0] * max_remaining
+        for r in range(1, max_remaining + 1):
+            dist = model.distribution(r)
+            top = len(dist) - 1
+            # Entries 0..top-1 leave r - i buckets; the last entry leaves max(0, r - top)
+            k = min(top, r + 1)
+            total = sum(map(mul, dist[:k], prev[r:r - k:-1] if r - k >= 0 else prev[r::-1]))
+            total += sum(dist[k:top]) + dist[top] * prev[max(0, r - top)]
+            cur[r] = total
+        prev = cur
+        table.append(cur)
+    return table
+
+
+def difficulty_curve(levels: int = 50, progression: Progression = DEFAULT_PROGRESSION,
+                     policy: TurnPolicySpec = "solver", part_value: Optional[PartValue] = None,
+                     horizon: int = 3000, model: Optional[TurnModel] = None) -> List[LevelDifficulty]:
+    """Clear probability of levels 1..levels under ``progression`` and ``policy``."""
+    model = model or TurnModel(policy, part_value, horizon)
+    bucket = model.bucket
+    curve = progression.curve(levels)
+    steps = [-(-target // bucket) for target, _ in curve]
+    table = clear_table(model, max(steps), max(turns for _, turns in curve))
+    result = []
+    run = 1.0
+    for index, ((target, turns), need) in enumerate(zip(curve, steps), 1):
+        clear = min(1.0, table[turns][need])
+        run *= clear
+        result.append(LevelDifficulty(index, target, turns, clear, run))
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    defaults = DEFAULT_PROGRESSION
+    parser = argparse.ArgumentParser(prog="python -m farkle.sim.difficulty", description="Per-level clear probability of the level progression.")
+    parser.add_argument("--levels", type=int, default=50)
+    parser.add_argument("--policy", default="solver", help="'solver' or a bank threshold in points, e.g. 400")
+    parser.add_argument("--horizon", type=int, default=3000, help="remaining score from which the solver plays untargeted")
+    parser.add_argument("--first-target", type=int, default=defaults.first_target)
+    parser.add_argument("--first-turns", type=int, default=defaults.first_turns)
+    parser.add_argument("--target-step", type=int, default=defaults.target_step)
+    parser.add_argument("--target-step-per-level", type=int, default=defaults.target_step_per_level)
+    parser.add_argument("--extra-turn-every", type=int, default=defaults.extra_turn_every)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    policy: TurnPolicySpec = args.policy if args.policy == "solver" else int(args.policy)
+    progression = Progression(
+        first_target=args.first_target, first_turns=args.first_turns, target_step=args.target_step,
+        target_step_per_level=args.target_step_per_level, extra_turn_every=args.extra_turn_every,
+        max_petitions=defaults.max_petitions,
+    )
+    curve = difficulty_curve(args.levels, progression, policy, horizon=args.horizon)
+    if args.json:
+        json.dump({"progression": asdict(progression), "policy": policy, "levels": [asdict(level) for level in curve]}, sys.stdout, indent=2)
+        print()
+        return 0
+    print(f"{'level':>5s} {'target':>7s} {'turns':>5s} {'clear':>8s} {'run':>8s}")
+    for level in curve:
+        print(f"{level.index:5d} {level.target:7d} {level.max_turns:5d} {level.clear_probability:8.2%} {level.run_probability:8.2%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
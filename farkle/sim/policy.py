@@ -0,0 +1,305 @@
+"""Bot policies: read-only observations in, actions out.
+
+A Policy sees an Observation (a frozen snapshot of what a player can see: dice, held
+mask, turn score, goals, relics, gods, ability charges, turns left and any open choice
+window) and returns an Action. ``PolicyDriver`` turns a Policy into the
+``policy(game) -> bool`` callable the runner expects and executes each Action through
+the same entry points as the UI: REQUEST_* events for roll, bank, next turn, abilities
+and choice windows, and ``farkle.core.actions.handle_lock`` for locks (there is no lock
+request event).
+
+Policies must be picklable (plain classes with simple attributes) so worker processes
+can receive them.
+
+Usage:
+    class Cautious(Policy):
+        def act(self, obs):
+            ...
+            return Action.bank()
+
+    run_simulation(1000, seed=1, policy=Cautious())
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Optional, Tuple
+
+from farkle.core.actions import handle_lock, select_faces, turn_hint
+from farkle.core.game_event import GameEvent, GameEventType
+
+
+@dataclass(frozen=True)
+class GoalView:
+    name: str
+    category: str
+    remaining: int
+    pending: int
+    fulfilled: bool
+    is_disaster: bool
+    reward_gold: int
+
+
+@dataclass(frozen=True)
+class ChoiceView:
+    """An open choice window: its type and (name, cost, enabled) per item."""
+    window_type: str
+    items: Tuple[Tuple[str, int, bool], ...]
+    allow_skip: bool
+
+
+@dataclass(frozen=True)
+class Observation:
+    state: str
+    dice: Tuple[int, ...]
+    held: Tuple[bool, ...]
+    scoring: Tuple[bool, ...]
+    turn_score: int
+    locked_after_last_roll: bool
+    goals: Tuple[GoalView, ...]
+    active_goal: int
+    relics: Tuple[str, ...]
+    gods: Tuple[Tuple[str, int], ...]
+    # ability id -> charges left this level
+    charges: Mapping[str, int]
+    turns_left: int
+    level_index: int
+    gold: int
+    window: Optional[ChoiceView]
+    _game: Any = field(default=None, repr=False, compare=False)
+
+    def hint(self) -> Optional[dict]:
+        """The TurnSolver's recommendation for this position (see actions.turn_hint)."""
+        return turn_hint(self._game) if self._game is not None else None
+
+
+def observe(game) -> Observation:
+    """Snapshot what a player can see of ``game``."""
+    dice = game.dice
+    goals = tuple(
+        GoalView(g.name, g.category, int(g.remaining), int(g.projected_pending()), g.is_fulfilled(),
+                 bool(g.is_disaster), int(g.reward_gold or 0))
+        for g in game.level_state.goals
+    )
+    window = game.choice_window_manager.get_active_window()
+    view = None
+    if window is not None:
+        view = ChoiceView(window.window_type, tuple(
+            (item.name, int(item.cost if item.cost is not None else getattr(item.payload, 'cost', 0) or 0), item.enabled)
+            for item in window.items
+        ), window.allow_skip)
+    abm = getattr(game, 'ability_manager', None)
+    return Observation(
+        state=game.state_manager.get_state().name,
+        dice=tuple(int(d.value) for d in dice),
+        held=tuple(bool(d.held) for d in dice),
+        scoring=tuple(bool(d.scoring_eligible) for d in dice),
+        turn_score=int(game.turn_score),
+        locked_after_last_roll=bool(game.locked_after_last_roll),
+        goals=goals,
+        active_goal=game.active_goal_index,
+        relics=tuple(r.name for r in game.relic_manager.active_relics),
+        gods=tuple((g.name, g.level) for g in game.gods.worshipped),
+        charges={a.id: a.available() for a in abm.abilities} if abm else {},
+        turns_left=game.level_state.turns_left,
+        level_index=game.level_index,
+        gold=game.player.gold,
+        window=view,
+        _game=game,
+    )
+
+
+@dataclass(frozen=True)
+class Action:
+    """What a policy wants done; build with the constructors below."""
+    kind: str
+    values: Tuple[int, ...] = ()
+    index: Optional[int] = None
+    ability: Optional[str] = None
+
+    @classmethod
+    def lock(cls, values) -> "Action":
+        """Select unheld dice showing ``values`` (one combo) and lock them."""
+        return cls("lock", tuple(values))
+
+    @classmethod
+    def roll(cls) -> "Action":
+        return cls("roll")
+
+    @classmethod
+    def bank(cls) -> "Action":
+        return cls("bank")
+
+    @classmethod
+    def next_turn(cls) -> "Action":
+        return cls("next_turn")
+
+    @classmethod
+    def switch_goal(cls, index: int) -> "Action":
+        return cls("switch_goal", index=index)
+
+    @classmethod
+    def use_ability(cls, ability_id: str, targets=()) -> "Action":
+        """Reroll (die indices) or sanctify (goal index) and friends."""
+        return cls("ability", tuple(targets), ability=ability_id)
+
+    @classmethod
+    def choose(cls, index: int) -> "Action":
+        """Pick an item of the open choice window (god, shop relic)."""
+        return cls("choose", index=index)
+
+    @classmethod
+    def skip(cls) -> "Action":
+        """Skip the open choice window (leave the shop)."""
+        return cls("skip")
+
+
+class Policy:
+    """Base bot: override act(); reset() is called at the start of every run."""
+    name = "policy"
+
+    def reset(self, seed: int) -> None:
+        pass
+
+    def act(self, obs: Observation) -> Action:
+        raise NotImplementedError
+
+
+# --- execution -----------------------------------------------------------------------
+
+def _fingerprint(game) -> tuple:
+    abm = getattr(game, 'ability_manager', None)
+    return (
+        game.state_manager.get_state(), game.turn_score, game.level_index, game.level_state.turns_left,
+        game.active_goal_index, id(game.choice_window_manager.get_active_window()),
+        tuple((d.value, d.held) for d in game.dice),
+        tuple((a.charges_used, a.selecting) for a in abm.abilities) if abm else (),
+    )
+
+
+def _request(game, etype: GameEventType, payload: dict | None = None) -> None:
+    game.event_listener.publish(GameEvent(etype, payload=payload or {}))
+
+
+def apply_action(game, action: Action) -> bool:
+    """Execute ``action`` on ``game``; False if it was refused or changed nothing."""
+    before = _fingerprint(game)
+    kind = action.kind
+    if kind == "lock":
+        if not select_faces(game, action.values) or not handle_lock(game):
+            for d in game.dice:
+                d.selected = False
+            return False
+    elif kind == "roll":
+        _request(game, GameEventType.REQUEST_ROLL)
+    elif kind == "bank":
+        _request(game, GameEventType.REQUEST_BANK)
+    elif kind == "next_turn":
+        _request(game, GameEventType.REQUEST_NEXT_TURN)
+    elif kind == "switch_goal":
+        goals = game.level_state.goals
+        if action.index is None or not 0 <= action.index < len(goals) or goals[action.index].is_fulfilled():
+            return False
+        game.active_goal_index = action.index
+    elif kind == "ability":
+        abm = game.ability_manager
+        ability = abm.get(action.ability)
+        if ability is None:
+            return False
+        _request(game, GameEventType.REQUEST_ABILITY, {'ability_id': action.ability})
+        if ability.selecting:
+            for target in action.values:
+                abm.attempt_target(ability.target_type, target)
+            if not abm.finalize_selection() and ability.selecting:
+                # Cancel the selection rather than leave the game waiting for targets
+                _request(game, GameEventType.REQUEST_ABILITY, {'ability_id': action.ability})
+                return False
+    elif kind in ("choose", "skip"):
+        window = game.choice_window_manager.get_active_window()
+        if window is None:
+            return False
+        if kind == "choose":
+            if action.index is None or not window.select_item(action.index):
+                return False
+            _request(game, GameEventType.REQUEST_CHOICE_CONFIRM, {"window_type": window.window_type})
+        else:
+            _request(game, GameEventType.REQUEST_CHOICE_SKIP, {"window_type": window.window_type})
+    else:
+        raise ValueError(f"unknown action kind {kind!r}")
+    return _fingerprint(game) != before
+
+
+class PolicyDriver:
+    """Adapts a Policy to the runner's ``policy(game) -> bool`` step callable."""
+
+    def __init__(self, policy: Policy):
+        self.policy = policy
+        self.name = getattr(policy, 'name', type(policy).__name__)
+
+    def start(self, game) -> None:
+        self.policy.reset(game.rng.seed if game.rng is not None else 0)
+
+    def __call__(self, game) -> bool:
+        return apply_action(game, self.policy.act(observe(game)))
+
+
+# --- built-in policies ---------------------------------------------------------------
+
+def _first_affordable(window: ChoiceView, gold: int) -> Optional[int]:
+    return next((i for i, (_name, cost, enabled) in enumerate(window.items) if enabled and cost <= gold), None)
+
+
+class SolverPolicy(Policy):
+    """TurnSolver play; first god, first affordable relic; rerolls a die to rescue a farkle."""
+    name = "solver"
+
+    def choose(self, obs: Observation) -> Action:
+        window = obs.window
+        if window.window_type == 'shop':
+            pick = _first_affordable(window, obs.gold)
+        else:
+            pick = next((i for i, (_n, _c, enabled) in enumerate(window.items) if enabled), None)
+        return Action.choose(pick) if pick is not None else Action.skip()
+
+    def rescue(self, obs: Observation) -> Optional[Action]:
+        if obs.state == 'FARKLE' and obs.charges.get('reroll', 0) > 0:
+            unheld = [i for i, held in enumerate(obs.held) if not held]
+            if unheld:
+                return Action.use_ability('reroll', unheld[:1])
+        return None
+
+    def turn(self, obs: Observation, hint: dict) -> Action:
+        action = hint["action"]
+        if action == "lock":
+            return Action.lock(hint["combos"][0])
+        return {"roll": Action.roll, "bank": Action.bank, "next_turn": Action.next_turn}[action]()
+
+    def act(self, obs: Observation) -> Action:
+        if obs.window is not None:
+            return self.choose(obs)
+        rescue = self.rescue(obs)
+        if rescue is not None:
+            return rescue
+        hint = obs.hint()
+        if hint is None:
+            return Action.next_turn()
+        return self.turn(obs, hint)
+
+
+class ThresholdPolicy(SolverPolicy):
+    """Locks like the solver but banks once the turn reaches ``bank_at`` points
+    (or the active goal's remaining score, if lower)."""
+
+    def __init__(self, bank_at: int = 300, min_dice: int = 2):
+        self.bank_at = bank_at
+        self.min_dice = min_dice
+        self.name = f"bank@{bank_at}"
+
+    def turn(self, obs: Observation, hint: dict) -> Action:
+        if hint["action"] in ("roll", "bank") and obs.state == 'ROLLING' and obs.locked_after_last_roll:
+            dice_left = sum(1 for held in obs.held if not held) or len(obs.held)
+            goal = obs.goals[obs.active_goal] if 0 <= obs.active_goal < len(obs.goals) else None
+            stop = min(self.bank_at, goal.remaining) if goal is not None and goal.remaining else self.bank_at
+            pending = goal.pending if goal is not None else obs.turn_score
+            if pending > 0 and (pending >= stop or dice_left < self.min_dice):
+                return Action.bank()
+            return Action.roll()
+        return super().turn(obs, hint)
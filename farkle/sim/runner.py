@@ -0,0 +1,294 @@
+"""Monte Carlo run simulator: play many complete headless runs across processes.
+
+A run starts from ``Game.headless(seed, skip_god_selection=False)`` and is driven by a
+policy until the level fails or ``max_levels`` levels are cleared. It goes through the
+startup god offer, every turn (rolls, locks, banks and farkles via the real action
+handlers), level advancement and each shop between levels.
+
+A policy is a picklable callable ``policy(game) -> bool`` that performs one action and
+returns False when it cannot act; if it has a ``start(game)`` method, that is called
+once per run. ``solver_policy`` (the default) takes the first offered god, buys the
+first affordable relic and plays turns with the TurnSolver. Observation-based bots
+(farkle.sim.policy.Policy) are wrapped in a PolicyDriver automatically.
+
+Seeds come from ``RandomSource(seed).derive_seeds(runs)``, so the played runs do not
+depend on the number of workers. The seed list is cut into shards; each worker plays
+its shard and streams one compact RunResult tuple per run through a result queue. The
+parent hands results to ``on_result`` as they arrive and folds them into a SimSummary in
+seed order, so the summary is the same for any number of workers.
+
+Usage:
+    summary = run_simulation(10_000, seed=1, workers=8)
+    summary.to_dict()
+
+    python -m farkle.sim --runs 10000 --seed 1 --workers 8
+"""
+from __future__ import annotations
+import math
+import multiprocessing
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from farkle.core.actions import autoplay_step
+from farkle.core.random_source import RandomSource
+from farkle.scoring.turn_solver import TurnSolver
+from farkle.sim.policy import Policy, PolicyDriver
+
+# One step of play: perform an action on the game, False when none applies
+Step = Callable[[Any], bool]
+
+
+class RunResult(NamedTuple):
+    """Outcome of one simulated run (a plain tuple on the wire)."""
+    seed: int
+    # Level the run ended on; max_levels + 1 when it cleared them all, so a loss on the
+    # last level still ranks below survival
+    levels_reached: int
+    levels_cleared: int
+    score: int
+    gold: int
+    farkles: int
+    relics_bought: int
+    turns: int
+    steps: int
+    survived: bool
+
+
+# --- policy --------------------------------------------------------------------------
+
+def _item_cost(item) -> int:
+    cost = item.cost if item.cost is not None else getattr(item.payload, 'cost', 0)
+    return int(cost or 0)
+
+
+def solver_policy(game) -> bool:
+    """First offered god, first affordable shop relic, TurnSolver turn play."""
+    manager = game.choice_window_manager
+    window = manager.get_active_window()
+    if window is None:
+        return autoplay_step(game)
+    if window.window_type == 'shop':
+        gold = game.player.gold
+        pick = next((i for i, item in enumerate(window.items) if item.enabled and _item_cost(item) <= gold), None)
+    else:
+        pick = next((i for i, item in enumerate(window.items) if item.enabled), None)
+    if pick is not None and window.select_item(pick):
+        manager.close_window()
+    elif window.allow_skip:
+        manager.skip_window()
+    else:
+        return False
+    return True
+
+
+# --- one run -------------------------------------------------------------------------
+
+# One TurnSolver per process: every headless game builds the same default rules, so
+# policies solved in one run answer the same goal targets in the next.
+_solvers: Dict[tuple, TurnSolver] = {}
+
+
+def _rules_signature(rules) -> tuple:
+    return tuple((type(r).__name__, tuple(sorted(vars(r).items()))) for r in rules.rules)
+
+
+def _share_solver(game) -> None:
+    signature = (_rules_signature(game.rules), len(game.dice) or 6)
+    solver = _solvers.get(signature)
+    if solver is None:
+        solver = _solvers[signature] = TurnSolver(game.rules, dice_count=signature[1], max_policies=1024)
+    solver.rules = game.rules
+    game.turn_solver = solver
+
+
+def play_run(seed: int, policy: Step | Policy = solver_policy, max_levels: int = 50, max_steps: int = 20000,
+             setup: Optional[Callable[[Any], None]] = None, *, skip_god_selection: bool = False) -> RunResult:
+    """Play one complete run from ``seed`` and summarise it.
+
+    ``setup(game)`` runs on the fresh game before the first step (e.g. to grant a relic).
+    """
+    from farkle.game import Game
+
+    if isinstance(policy, Policy):
+        policy = PolicyDriver(policy)
+
+    game = Game.headless(seed, skip_god_selection=skip_god_selection)
+    if setup is not None:
+        setup(game)
+    _share_solver(game)
+    start = getattr(policy, 'start', None)
+    if start is not None:
+        start(game)
+    game_over = game.state_manager.state.GAME_OVER
+    steps = 0
+    survived = False
+    while steps < max_steps:
+        if game.level_state.failed or game.state_manager.get_state() == game_over:
+            break
+        if game.level_index > max_levels:
+            survived = True
+            break
+        steps += 1
+        if not policy(game):
+            break
+    stats = game.statistics_tracker.get_statistics()
+    return RunResult(
+        seed=seed,
+        levels_reached=min(game.level_index, max_levels + 1),
+        levels_cleared=stats.levels_completed,
+        score=stats.total_score,
+        gold=game.player.gold,
+        farkles=stats.total_farkles,
+        relics_bought=stats.relics_purchased,
+        turns=stats.turns_played,
+        steps=steps,
+        survived=survived,
+    )
+
+
+# --- aggregation ---------------------------------------------------------------------
+
+class Moments:
+    """Running mean/variance (Welford) plus min/max."""
+    __slots__ = ("n", "mean", "m2", "lo", "hi")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.lo: Optional[float] = None
+        self.hi: Optional[float] = None
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        self.lo = x if self.lo is None or x < self.lo else self.lo
+        self.hi = x if self.hi is None or x > self.hi else self.hi
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+    def interval(self, z: float = 1.96) -> tuple[float, float]:
+        """Normal-approximation confidence interval of the mean (95% by default)."""
+        half = z * self.stdev / math.sqrt(self.n) if self.n else 0.0
+        return (self.mean - half, self.mean + half)
+
+    def to_dict(self) -> dict:
+        return {"mean": self.mean, "stdev": self.stdev, "min": self.lo, "max": self.hi}
+
+
+class SimSummary:
+    """Incremental aggregate of RunResults; add() in any order."""
+    FIELDS = ("levels_reached", "levels_cleared", "score", "gold", "farkles", "relics_bought", "turns")
+
+    def __init__(self):
+        self.runs = 0
+        self.survived = 0
+        self.stats = {name: Moments() for name in self.FIELDS}
+        # levels_reached -> number of runs that ended there
+        self.level_histogram: Dict[int, int] = {}
+        self.best: Optional[RunResult] = None
+
+    def add(self, result: RunResult) -> None:
+        self.runs += 1
+        self.survived += bool(result.survived)
+        for name in self.FIELDS:
+            self.stats[name].add(getattr(result, name))
+        self.level_histogram[result.levels_reached] = self.level_histogram.get(result.levels_reached, 0) + 1
+        if self.best is None or (result.levels_reached, result.score, -result.seed) > (self.best.levels_reached, self.best.score, -self.best.seed):
+            self.best = result
+
+    def mean(self, name: str) -> float:
+        return self.stats[name].mean
+
+    def to_dict(self) -> dict:
+        return {
+            "runs": self.runs,
+            "survived": self.survived,
+            **{name: self.stats[name].to_dict() for name in self.FIELDS},
+            "level_histogram": dict(sorted(self.level_histogram.items())),
+            "best": self.best._asdict() if self.best is not None else None,
+        }
+
+
+# --- workers -------------------------------------------------------------------------
+
+_result_queue = None
+
+
+def _init_worker(results) -> None:
+    global _result_queue
+    _result_queue = results
+
+
+def _play_shard(seeds: List[int], policy: Step | Policy, max_levels: int, max_steps: int) -> int:
+    for seed in seeds:
+        _result_queue.put(tuple(play_run(seed, policy, max_levels, max_steps)))
+    return len(seeds)
+
+
+def _shards(seeds: List[int], size: int) -> Iterable[List[int]]:
+    for i in range(0, len(seeds), size):
+        yield seeds[i:i + size]
+
+
+def run_simulation(runs: int, seed: Optional[int] = None, workers: Optional[int] = None, *,
+                   policy: Step | Policy = solver_policy, max_levels: int = 50, max_steps: int = 20000,
+                   shard_size: Optional[int] = None, seeds: Optional[Sequence[int]] = None,
+                   on_result: Optional[Callable[[RunResult], None]] = None) -> SimSummary:
+    """Play ``runs`` runs and return their SimSummary.
+
+    Args:
+        seed: Seeds the RandomSource every run seed is derived from (None: random).
+        workers: Worker processes (None: one per CPU); 1 or less plays in this process.
+        policy: A Policy, or a module-level step callable (workers must unpickle it).
+        shard_size: Runs per worker task (default: about four shards per worker).
+        seeds: Play exactly these run seeds instead of deriving ``runs`` from ``seed``
+            (so several calls can share one seed list even when ``seed`` is None).
+        on_result: Called in this process with each RunResult as it arrives (arrival
+            order); the summary itself is folded in seed order.
+    """
+    seeds = list(seeds) if seeds is not None else RandomSource(seed).derive_seeds(runs)
+    runs = len(seeds)
+    summary = SimSummary()
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or runs <= 1:
+        for s in seeds:
+            result = play_run(s, policy, max_levels, max_steps)
+            summary.add(result)
+            if on_result is not None:
+                on_result(result)
+        return summary
+
+    workers = min(workers, runs)
+    size = shard_size or max(1, math.ceil(runs / (workers * 4)))
+    by_seed: Dict[int, RunResult] = {}
+    results = multiprocessing.Queue()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(results,)) as pool:
+        futures = [pool.submit(_play_shard, shard, policy, max_levels, max_steps) for shard in _shards(seeds, size)]
+        received = 0
+        while received < runs:
+            try:
+                item = results.get(timeout=0.2)
+            except queue.Empty:
+                failed = next((f for f in futures if f.done() and f.exception() is not None), None)
+                if failed is not None:
+                    raise failed.exception()
+                continue
+            received += 1
+            result = RunResult(*item)
+            by_seed[result.seed] = result
+            if on_result is not None:
+                on_result(result)
+    results.close()
+    # Seed order, so the summary does not depend on which shard finished first
+    for s in seeds:
+        summary.add(by_seed[s])
+    return summary
@@ -1,9 +1,12 @@
-from farkle.core.game_event import GameEvent, GameEventType
+from farkle.core.game_event import DICE_DETAIL_EVENTS, GameEvent, GameEventType
+from farkle.core.event_payloads import message
 
 class InputController:
     """Listens for REQUEST_* events, validates state, invokes domain actions, and publishes
     either the resulting domain event (ROLL/LOCK/BANK) or REQUEST_DENIED/MESSAGE.
     """
+    ignored_events = DICE_DETAIL_EVENTS
+
     def __init__(self, game):
         self.game = game
 
@@ -43,7 +46,7 @@ class InputController:
 
     def _deny(self, reason: str):
         self._emit(GameEventType.REQUEST_DENIED, {"reason": reason})
-        self._emit(GameEventType.MESSAGE, {"text": reason})
+        self._emit(GameEventType.MESSAGE, message(reason))
         self.game.set_message(reason)
 
     def _handle_roll_request(self):
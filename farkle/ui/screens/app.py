@@ -6,6 +6,7 @@ from .menu_screen import MenuScreen
 from .game_over_screen import GameOverScreen
 from .statistics_screen import StatisticsScreen
 from farkle.game import Game
+from farkle.core.event_listener import EventPhase
 from farkle.core.game_event import GameEvent, GameEventType
 from farkle.meta.persistence import PersistenceManager
 from farkle.meta.save_manager import SaveManager
@@ -18,10 +19,15 @@ class App:
       - 'game': gameplay loop (delegated to Game class)
       - 'game_over': game over screen with statistics
       - 'statistics': persistent statistics viewer
+
+    App-level event handling (screen transitions) and autosave run in the UI and
+    persistence phases, which the game's listener defers to the end of each frame.
       
     Shop and god selection are rendered as overlay sprites within the game screen
     using the choice window system, not as separate screens.
     """
+    event_phase = EventPhase.UI
+
     def __init__(self, screen: pygame.Surface, font: pygame.font.Font, clock: pygame.time.Clock):
         """Initialize the App with pygame resources.
         
@@ -100,9 +106,10 @@ class App:
             
             # Subscribe to game events for app-level concerns
             if self.game.event_listener:
+                self.game.event_listener.set_deferred_phases((EventPhase.UI, EventPhase.PERSISTENCE))
                 self.game.event_listener.subscribe(self._on_event)
-            # Attach save manager for autosave
-            self.save_manager.attach(self.game)
+            # Attach save manager for autosave (file writes happen off the frame loop)
+            self.save_manager.attach(self.game, background=True)
     
     def _ensure_game_screen(self):
         """Create game screen if not already created."""
@@ -149,6 +156,7 @@ class App:
                 # If transitioning to menu from game/game_over, reset the game
                 if next_screen == 'menu' and self.current_name in ('game', 'game_over'):
                     # Delete save file when returning to menu (game over)
+                    self.save_manager.close()
                     self.save_manager.delete_save()
                     self.game = None  # Clear game state
                     # Remove game and game_over screens to force recreation on next play
@@ -173,7 +181,14 @@ class App:
                     running = False
                     
             active.update(dt)
+            # End of frame: run the UI/persistence deliveries the frame's events queued up
+            if self.game is not None:
+                self.game.event_listener.flush_deferred()
             active.draw(self.screen)
             pygame.display.flip()
+        # Deliver what the last frame queued and let the autosave writer finish
+        if self.game is not None:
+            self.game.event_listener.flush_deferred()
+        self.save_manager.close()
         pygame.quit()
 
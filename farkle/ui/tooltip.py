@@ -202,11 +202,10 @@ def resolve_hover(game, pos: tuple[int,int]) -> Optional[Dict]:
                     if d.held and getattr(d, 'combo_rule_key', None) and getattr(d, 'combo_points', None):
                         fr = friendly_rule_label(getattr(d,'combo_rule_key'))
                         lines.append(f"Locked: {fr} = {d.combo_points}")
-                    elif d.selected and game.selection_is_single_combo() and game.any_scoring_selection():
+                    elif d.selected and game.any_scoring_selection():
                         try:
-                            raw, _, = game.calculate_score_from_dice()
-                            rk = game.dice_container.selection_rule_key()
-                            if rk and raw > 0:
+                            single, rk, raw = game.dice_container.selection_classification()
+                            if single and rk and raw > 0:
                                 fr = friendly_rule_label(rk)
                                 lines.append(f"Selecting: {fr} = {raw}")
                         except Exception:
@@ -119,6 +119,18 @@ class AutosaveTests(unittest.TestCase):
         
         self.assertTrue(self.save_path.exists())
     
+    def test_background_autosave_captures_state_at_publish(self):
+        """Background autosave serializes at the event and writes on the worker thread."""
+        from farkle.core.game_event import GameEvent
+        manager = SaveManager(save_path=str(self.save_path))
+        manager.attach(self.game, background=True)
+        self.game.player.gold = 123
+        self.game.event_listener.publish(GameEvent(GameEventType.TURN_END, payload={"reason": "banked"}))
+        self.game.player.gold = 999
+        self.assertTrue(manager.flush(timeout=5))
+        self.assertEqual(manager.load()['player']['gold'], 123)
+        self.assertTrue(manager.close(timeout=5))
+    
     def test_load_restores_player_state(self):
         """Test that loading restores player state."""
         # Save game with modified player state
@@ -0,0 +1,63 @@
+import json
+
+from benchmarks.harness import Benchmark, BenchResult, Report, compare, measure, registered, run_benchmarks
+
+
+def _report(**samples):
+    return Report({name: BenchResult(name, "micro", 1, 1, value if isinstance(value, list) else [value])
+                   for name, value in samples.items()},
+                  env={"python": "3"})
+
+
+def test_measure_reports_time_per_operation():
+    calls = []
+
+    def factory():
+        return lambda: calls.append(1)
+
+    result = measure(Benchmark("noop", "micro", factory, ops=10), repeat=3, min_time=0.001)
+    assert len(result.samples) == 3 and result.loops >= 1
+    assert len(calls) >= 3 * result.loops
+    assert result.stat("min") <= result.stat("median") <= max(result.samples)
+    assert result.to_dict()["ops"] == 10
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = _report(fast=1.0, slow=1.0, steady=1.0, dropped=1.0)
+    current = _report(fast=0.5, slow=1.5, steady=1.05, added=2.0)
+    comparison = compare(current, baseline, threshold=0.10)
+    status = {d.name: d.status for d in comparison.deltas}
+    # Benchmarks left out of a (filtered) run are not compared
+    assert status == {"fast": "improved", "slow": "regressed", "steady": "same", "added": "new"}
+    assert [d.name for d in comparison.regressions] == ["slow"]
+    assert comparison.to_dict()["deltas"][1]["ratio"] == 1.5
+
+
+def test_compare_ignores_slowdowns_within_the_sample_spread():
+    baseline = _report(noisy=[1.0, 1.3], clear=[1.0, 1.05])
+    current = _report(noisy=[1.2, 1.25], clear=[1.2, 1.25])
+    comparison = compare(current, baseline, threshold=0.10)
+    # noisy's fastest sample is 20% slower, but still within the baseline's own spread
+    assert {d.name: d.status for d in comparison.deltas} == {"noisy": "same", "clear": "regressed"}
+
+
+def test_compare_without_baseline_asks_for_one(tmp_path, capsys):
+    from benchmarks.__main__ import main
+    missing = tmp_path / "baseline.json"
+    assert main(["--compare", str(missing)]) == 2
+    assert "--save-baseline" in capsys.readouterr().err
+
+
+def test_report_json_round_trip_and_smoke_run(tmp_path):
+    names = {b.name for b in registered(["micro"])}
+    assert {"scoring.evaluate[warm]", "scoring.preview[20 modifiers, cold]", "level.advance"} <= names
+    assert all(b.group == "macro" for b in registered(["macro"]))
+
+    report = run_benchmarks(["scoring.evaluate*"], repeat=1, min_time=0.0)
+    assert sorted(report.results) == ["scoring.evaluate[cold]", "scoring.evaluate[warm]"]
+    path = tmp_path / "report.json"
+    report.save(path)
+    assert json.loads(path.read_text())["unit"] == "seconds per operation"
+    loaded = Report.load(path)
+    assert loaded.results["scoring.evaluate[warm]"].samples == report.results["scoring.evaluate[warm]"].samples
+    assert not compare(loaded, report).regressions
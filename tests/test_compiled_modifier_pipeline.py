@@ -0,0 +1,83 @@
+import random
+from types import SimpleNamespace
+
+from farkle.scoring.score_modifiers import (
+    ConditionalScoreModifier,
+    FlatRuleBonus,
+    GlobalPartsMultiplier,
+    MandatoryGoalOnly,
+    OptionalGoalOnly,
+    RuleSpecificMultiplier,
+    ScoreModifierChain,
+)
+from farkle.scoring.score_types import Score, ScorePart
+
+RULE_KEYS = ["SingleValue:1", "SingleValue:5", "ThreeOfAKind:2", "Straight6"]
+
+
+def _score(parts):
+    score = Score()
+    for rk, raw in parts:
+        score.add_part(ScorePart(rule_key=rk, raw=raw))
+    return score
+
+
+def _reference(chain, parts, goal):
+    # Modifier-by-modifier application, as the uncompiled chain does it
+    score = _score(parts)
+    ctx = SimpleNamespace(score_obj=score, goal=goal, pending_raw=score.total_raw)
+    for m in chain.snapshot():
+        m.apply(0, ctx)
+    return [p.adjusted if p.adjusted is not None else p.raw for p in score.parts]
+
+
+def _random_modifier(rng):
+    kind = rng.randrange(5)
+    if kind == 0:
+        return RuleSpecificMultiplier(rng.choice(RULE_KEYS), rng.choice([1.0, 1.5, 2.0, 1.2, 3.0]))
+    if kind == 1:
+        return FlatRuleBonus(rng.choice(RULE_KEYS), rng.choice([0, 50, 100, -25]))
+    if kind == 2:
+        return GlobalPartsMultiplier(rng.choice([1.2, 2.0, 1.0, 0.75]))
+    inner = GlobalPartsMultiplier(rng.choice([1.2, 2.0])) if rng.random() < 0.5 else FlatRuleBonus(rng.choice(RULE_KEYS), 30)
+    if kind == 3:
+        return ConditionalScoreModifier(inner, predicate=lambda ctx: getattr(ctx.goal, 'is_disaster', None) is True,
+                                        goal_condition=('is_disaster', True))
+    return rng.choice([MandatoryGoalOnly, OptionalGoalOnly])(inner)
+
+
+def test_compiled_pipeline_matches_modifier_by_modifier_application():
+    rng = random.Random(7)
+    goals = [None, SimpleNamespace(is_disaster=True, mandatory=True), SimpleNamespace(is_disaster=False, mandatory=False)]
+    for _ in range(300):
+        chain = ScoreModifierChain([_random_modifier(rng) for _ in range(rng.randrange(0, 8))])
+        assert chain.compiled() is not None
+        parts = [(rng.choice(RULE_KEYS), rng.choice([50, 100, 200, 1000, 1500, 333])) for _ in range(rng.randrange(1, 5))]
+        for goal in goals:
+            score = _score(parts)
+            total = chain.apply(score.total_raw, SimpleNamespace(score_obj=score, goal=goal, pending_raw=score.total_raw))
+            expected = _reference(chain, parts, goal)
+            assert [p.adjusted if p.adjusted is not None else p.raw for p in score.parts] == expected
+            assert total == sum(expected)
+
+
+def test_truncation_order_preserved():
+    chain = ScoreModifierChain([RuleSpecificMultiplier("SingleValue:5", 1.5), FlatRuleBonus("SingleValue:5", 1)])
+    chain.add(GlobalPartsMultiplier(1.5))
+    score = _score([("SingleValue:5", 55)])
+    # int(int(55 * 1.5) + 1) * 1.5) = int(83 * 1.5) = 124, not int(55 * 2.25 + 1.5) = 125
+    assert chain.apply(55, SimpleNamespace(score_obj=score, goal=None, pending_raw=55)) == 124
+
+
+def test_recompiles_on_mutation_and_falls_back_for_opaque_predicates():
+    chain = ScoreModifierChain([FlatRuleBonus("SingleValue:1", 100)])
+    first = chain.compiled()
+    assert first is chain.compiled()
+    chain.add(FlatRuleBonus("SingleValue:5", 50))
+    assert chain.compiled() is not first
+    assert chain.remove_by_identity("FlatRuleBonus", {"rule_key": "SingleValue:5"})
+    assert [s[1] for s in chain.compiled().steps] == ["SingleValue:1"]
+    chain.add(ConditionalScoreModifier(GlobalPartsMultiplier(2.0), predicate=lambda ctx: True))
+    assert chain.compiled() is None
+    score = _score([("SingleValue:1", 100)])
+    assert chain.apply(100, SimpleNamespace(score_obj=score, goal=None, pending_raw=100)) == 400
@@ -35,6 +35,11 @@ class DiceEventTests(unittest.TestCase):
         first_post = types.index(GameEventType.POST_ROLL)
         first_die = types.index(GameEventType.DIE_ROLLED)
         self.assertLess(first_die, first_post)
+        # Per-die events are fanned out from a single batch carrying parallel arrays
+        batch = next(e for e in self.collector.events if e.type == GameEventType.ROLL_BATCH)
+        self.assertLess(types.index(GameEventType.ROLL_BATCH), first_die)
+        self.assertEqual(list(batch.get('indices')), [e.get('index') for e in self.collector.events if e.type == GameEventType.DIE_ROLLED])
+        self.assertEqual(len(batch.get('held')), len(self.game.dice))
 
     def test_selection_emits_selected_deselected(self):
         # Transition to rolling and mark a die scoring eligible manually
@@ -61,5 +66,19 @@ class DiceEventTests(unittest.TestCase):
         types = [e.type for e in self.collector.events]
         self.assertIn(GameEventType.DIE_HELD, types)
 
+    def test_unobserved_dice_events_are_skipped(self):
+        self.game.event_listener.unsubscribe(self.collector.on_event)
+        profiler = self.game.event_listener.enable_profiling()
+        self.game.event_listener.publish(GameEvent(GameEventType.REQUEST_ROLL))
+        counts = profiler.publish_counts
+        # The statistics tracker counts dice from the batch; nobody wants per-die events
+        self.assertNotIn('PRE_ROLL', counts)
+        self.assertNotIn('POST_ROLL', counts)
+        self.assertNotIn('DIE_ROLLED', counts)
+        self.assertEqual(counts['ROLL_BATCH'], 1)
+        # ...and no subscriber the batch could fan out to
+        self.assertEqual(self.game.event_listener.dispatch_tuple(GameEventType.DIE_ROLLED), ())
+        self.assertEqual(counts['TURN_ROLL'], 1)
+
 if __name__ == '__main__':
     unittest.main()
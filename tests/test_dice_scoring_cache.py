@@ -0,0 +1,59 @@
+import unittest, pygame
+from farkle.game import Game
+from farkle.ui.settings import WIDTH, HEIGHT
+
+
+class DiceScoringCacheTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        flags = 0
+        if hasattr(pygame, 'HIDDEN'): flags |= pygame.HIDDEN
+        cls.screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
+        cls.font = pygame.font.Font(None, 24)
+        cls.clock = pygame.time.Clock()
+
+    def setUp(self):
+        self.game = Game(self.screen, self.font, self.clock, skip_god_selection=True)
+        self.container = self.game.dice_container
+        self.game.state_manager.transition_to_rolling()
+        for d, v in zip(self.game.dice, [1, 1, 1, 5, 2, 3]):
+            d.value = v
+        self.container.invalidate_scoring_cache()
+
+    def test_repeated_queries_hit_cache(self):
+        self.game.mark_scoring_dice()
+        misses = self.container.cache_misses
+        self.assertFalse(self.game.check_farkle())
+        self.game.mark_scoring_dice()
+        self.assertEqual(self.container.cache_misses, misses)
+        self.assertGreaterEqual(self.container.cache_hits, 2)
+
+    def test_selection_toggle_and_value_change_rescore(self):
+        self.game.mark_scoring_dice()
+        for d in self.game.dice[:3]:
+            d.selected = True
+        self.assertTrue(self.game.selection_is_single_combo())
+        self.assertEqual(self.container.selection_rule_key(), "ThreeOfAKind:1")
+        self.assertEqual(self.game.calculate_score_from_dice()[0], 1000)
+        self.game.dice[3].selected = True
+        self.assertFalse(self.game.selection_is_single_combo())
+        self.assertEqual(self.game.calculate_score_from_dice()[0], 1050)
+        # Faces rewritten without a roll (e.g. abilities) still produce a fresh result
+        self.game.dice[3].selected = False
+        self.game.dice[0].value = 2
+        self.assertFalse(self.game.selection_is_single_combo())
+
+    def test_roll_and_hold_clear_cache(self):
+        self.game.mark_scoring_dice()
+        self.game.dice[3].selected = True
+        self.assertTrue(self.game._auto_lock_selection("Locked"))
+        self.assertEqual(self.game.dice[3].combo_rule_key, "SingleValue:5")
+        counter = self.container.roll_counter
+        self.game.roll_dice()
+        self.assertEqual(self.container.roll_counter, counter + 1)
+        self.assertEqual(self.container.cache_stats()["entries"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
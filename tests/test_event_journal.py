@@ -0,0 +1,83 @@
+import pygame
+import pytest
+
+from farkle.core.actions import autoplay_step
+from farkle.core.event_journal import (
+    EventJournalRecorder, EventJournalReplayer, JournalError, RECORD_EVENT, iter_records, read_journal,
+)
+from farkle.core.game_event import GameEvent, GameEventType
+from farkle.game import Game
+from farkle.ui.settings import WIDTH, HEIGHT
+
+
+def make_game(seed=5, skip_god_selection=True):
+    pygame.init()
+    flags = pygame.HIDDEN if hasattr(pygame, 'HIDDEN') else 0
+    screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
+    return Game(screen, pygame.font.Font(None, 24), pygame.time.Clock(), rng_seed=seed, skip_god_selection=skip_god_selection)
+
+
+def record_session(path, steps=40):
+    game = make_game()
+    recorder = EventJournalRecorder(game, path)
+    game.event_listener.publish(GameEvent(GameEventType.REQUEST_ROLL))
+    for _ in range(steps):
+        if not autoplay_step(game):
+            break
+    recorder.close()
+    return game, recorder
+
+
+def test_replay_reproduces_recorded_session(tmp_path):
+    path = tmp_path / "session.frkj"
+    game, recorder = record_session(path)
+    journal = read_journal(path)
+    assert journal.header['seed'] == 5
+    assert journal.event_count == recorder.events > 0
+    result = EventJournalReplayer(path, game_factory=lambda seed, skip: make_game(seed, skip)).run()
+    assert result.ok, result.mismatches
+    assert result.events_replayed == recorder.events
+    assert result.checkpoints > 1 and result.inputs > 1
+
+
+def test_goal_references_are_stable_ids(tmp_path):
+    path = tmp_path / "goals.frkj"
+    game = make_game()
+    with EventJournalRecorder(game, path):
+        goal = game.level_state.goals[0]
+        game.event_listener.publish(GameEvent(GameEventType.GOAL_PROGRESS, source=goal, payload={"goal": goal, "delta": 50}))
+    events = [body for kind, body in iter_records(path) if kind == RECORD_EVENT]
+    assert events[-1][3] == {"$goal": 0}
+    assert events[-1][4] == {"goal": {"$goal": 0}, "delta": 50}
+
+
+def test_diverging_replay_reports_checkpoint_mismatch(tmp_path):
+    path = tmp_path / "session.frkj"
+    record_session(path)
+    # A different seed rolls different dice, which the first post-roll checkpoint catches
+    result = EventJournalReplayer(path, game_factory=lambda seed, skip: make_game(seed + 1, skip))
+    result.journal.header['rng_state'] = None
+    outcome = result.run()
+    assert not outcome.ok
+    assert any("checkpoint dice" in msg for _, msg in outcome.mismatches)
+
+
+def test_truncated_journal_reads_complete_records(tmp_path):
+    path = tmp_path / "session.frkj"
+    record_session(path, steps=3)
+    complete = len(list(iter_records(path)))
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+    assert len(list(iter_records(path))) == complete - 1
+    bad = tmp_path / "bad.frkj"
+    bad.write_bytes(b"nope")
+    with pytest.raises(JournalError):
+        read_journal(bad)
+
+
+def test_headless_replay_of_rendered_session(tmp_path):
+    path = tmp_path / "session.frkj"
+    _, recorder = record_session(path)
+    result = EventJournalReplayer(path).run()
+    assert result.ok, result.mismatches
+    assert result.events_replayed == recorder.events
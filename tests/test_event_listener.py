@@ -0,0 +1,257 @@
+from dataclasses import dataclass, field
+
+from farkle.core.event_listener import COALESCE_LATEST, EventListener, EventPhase, merge_count
+from farkle.core.game_event import GameEvent, GameEventType
+
+
+@dataclass
+class DataclassSubscriber:
+    # Dataclasses are unhashable; their bound methods must still (un)subscribe
+    seen: list = field(default_factory=list)
+
+    def on_event(self, event):
+        self.seen.append(event.type)
+
+
+def test_dispatch_order_and_cascade_fifo():
+    el = EventListener()
+    calls = []
+    el.subscribe(lambda e: calls.append(("specific", e.type)), [GameEventType.BANK])
+    el.subscribe(lambda e: calls.append(("all", e.type)))
+
+    def cascade(e):
+        if e.type == GameEventType.BANK:
+            el.publish(GameEvent(GameEventType.TURN_END))
+            el.publish(GameEvent(GameEventType.TURN_START))
+    el.subscribe(cascade)
+    el.publish(GameEvent(GameEventType.BANK))
+    assert calls == [
+        ("all", GameEventType.BANK), ("specific", GameEventType.BANK),
+        ("all", GameEventType.TURN_END), ("all", GameEventType.TURN_START),
+    ]
+
+
+def test_unsubscribe_uses_reverse_index_and_dataclass_callbacks():
+    el = EventListener()
+    sub = DataclassSubscriber()
+    el.subscribe(sub.on_event)
+    el.subscribe(sub.on_event, [GameEventType.LOCK, GameEventType.BANK])
+    el.subscribe(sub.on_event)  # duplicate ignored
+    el.publish(GameEvent(GameEventType.LOCK))
+    assert sub.seen == [GameEventType.LOCK, GameEventType.LOCK]
+    el.unsubscribe(sub.on_event)
+    el.publish(GameEvent(GameEventType.LOCK))
+    assert len(sub.seen) == 2
+    assert el.dispatch_tuple(GameEventType.BANK) == ()
+
+
+def test_subscription_during_dispatch_applies_to_next_event():
+    el = EventListener()
+    late = []
+
+    def first(e):
+        el.subscribe(late.append)
+    el.subscribe(first)
+    el.publish(GameEvent(GameEventType.ROLL))
+    assert late == []
+    el.publish(GameEvent(GameEventType.ROLL))
+    assert len(late) == 1
+
+
+def test_profiling_records_counts_timings_and_swallowed_exceptions(tmp_path):
+    import json
+    el = EventListener()
+    sub = DataclassSubscriber()
+    el.subscribe(sub.on_event)
+
+    def broken(e):
+        raise ValueError("boom")
+    el.subscribe(broken, [GameEventType.BANK])
+    el.publish(GameEvent(GameEventType.ROLL))  # not profiled
+    profiler = el.enable_profiling()
+
+    def cascade(e):
+        if e.type == GameEventType.BANK:
+            el.publish(GameEvent(GameEventType.TURN_END))
+            el.publish(GameEvent(GameEventType.TURN_START))
+    el.subscribe(cascade, [GameEventType.BANK])
+    el.publish(GameEvent(GameEventType.BANK))
+    snap = profiler.snapshot()
+    assert snap['publish_counts'] == {'BANK': 1, 'TURN_END': 1, 'TURN_START': 1}
+    assert snap['queue_high_water'] == 2
+    assert snap['subscribers']['DataclassSubscriber.on_event']['calls'] == 3
+    broken_stats = next(v for k, v in snap['subscribers'].items() if k.endswith('broken'))
+    assert broken_stats['exceptions'] == 1 and 'boom' in broken_stats['last_traceback']
+    assert sub.seen[-3:] == [GameEventType.BANK, GameEventType.TURN_END, GameEventType.TURN_START]
+    out = tmp_path / 'profile.json'
+    profiler.dump_json(out)
+    assert json.loads(out.read_text())['exceptions'] == 1
+    assert el.disable_profiling() is profiler and el.profiler is None
+
+
+class QuietSubscriber:
+    ignored_events = frozenset({GameEventType.DIE_ROLLED})
+
+    def __init__(self):
+        self.seen = []
+
+    def on_event(self, event):
+        self.seen.append(event.type)
+
+
+def test_has_subscribers_respects_catch_all_opt_outs():
+    el = EventListener()
+    quiet = QuietSubscriber()
+    el.subscribe(quiet.on_event)
+    assert not el.has_subscribers(GameEventType.DIE_ROLLED)
+    assert el.has_subscribers(GameEventType.BANK)
+    el.publish(GameEvent(GameEventType.DIE_ROLLED))
+    assert quiet.seen == []
+    # An explicit ignore= overrides the declaration
+    seen = []
+    el.subscribe(seen.append, ignore={GameEventType.BANK})
+    assert el.has_subscribers(GameEventType.DIE_ROLLED)
+    el.unsubscribe(seen.append)
+    el.subscribe(lambda e: None, [GameEventType.DIE_ROLLED])
+    assert el.has_subscribers(GameEventType.DIE_ROLLED)
+
+
+def test_taps_count_as_subscribers():
+    el = EventListener()
+    assert not el.has_subscribers(GameEventType.DIE_ROLLED)
+    tap = lambda event, nested: None
+    el.add_tap(tap)
+    assert el.has_subscribers(GameEventType.DIE_ROLLED)
+    el.remove_tap(tap)
+    assert not el.has_subscribers(GameEventType.DIE_ROLLED)
+
+
+def test_roll_batch_fans_out_to_per_die_subscribers():
+    from farkle.core.event_payloads import roll_batch
+    el = EventListener()
+    assert not el.has_subscribers(GameEventType.ROLL_BATCH)
+    rolled = []
+    el.subscribe(lambda e: rolled.append((e.get("index"), e.get("old"), e.get("new"))), [GameEventType.DIE_ROLLED])
+    # Subscribing to the per-die type makes the batch worth publishing
+    assert el.has_subscribers(GameEventType.ROLL_BATCH)
+    order = []
+    el.subscribe(lambda e: order.append(e.type), [GameEventType.ROLL_BATCH, GameEventType.DIE_ROLLED, GameEventType.BANK])
+
+    def cascade(e):
+        el.publish(GameEvent(GameEventType.BANK))
+    el.subscribe(cascade, [GameEventType.ROLL_BATCH])
+    el.publish(GameEvent(GameEventType.ROLL_BATCH, payload=roll_batch([0, 3], [1, 2], [5, 6], [False] * 4)))
+    assert rolled == [(0, 1, 5), (3, 2, 6)]
+    # Fanned-out events follow the batch directly, ahead of events queued by its subscribers
+    assert order == [GameEventType.ROLL_BATCH, GameEventType.DIE_ROLLED, GameEventType.DIE_ROLLED, GameEventType.BANK]
+
+
+def test_phases_and_priorities_order_dispatch():
+    el = EventListener()
+    calls = []
+
+    class Saver:
+        event_phase = EventPhase.PERSISTENCE
+
+        def on_event(self, e):
+            calls.append("save")
+
+    el.subscribe(Saver().on_event)
+    el.subscribe(lambda e: calls.append("ui"), phase=EventPhase.UI)
+    el.subscribe(lambda e: calls.append("scoring"), [GameEventType.BANK], phase=EventPhase.SCORING)
+    el.subscribe(lambda e: calls.append("model"))
+    el.subscribe(lambda e: calls.append("model-first"), priority=10)
+    el.publish(GameEvent(GameEventType.BANK))
+    assert calls == ["model-first", "model", "scoring", "ui", "save"]
+
+
+def test_deferred_phases_run_on_flush_after_cascade():
+    el = EventListener()
+    el.set_deferred_phases({EventPhase.UI})
+    calls = []
+    el.subscribe(lambda e: calls.append(("ui", e.type)), phase=EventPhase.UI)
+
+    def model(e):
+        calls.append(("model", e.type))
+        if e.type == GameEventType.BANK:
+            el.publish(GameEvent(GameEventType.TURN_END))
+    el.subscribe(model)
+    el.publish(GameEvent(GameEventType.BANK))
+    assert calls == [("model", GameEventType.BANK), ("model", GameEventType.TURN_END)]
+    assert el.pending_deferred() == 2
+    assert el.flush_deferred() == 2
+    assert calls[2:] == [("ui", GameEventType.BANK), ("ui", GameEventType.TURN_END)]
+    assert el.flush_deferred() == 0
+
+
+def test_async_sink_handles_snapshots_off_thread():
+    import threading
+    el = EventListener()
+    seen = []
+    sink = el.subscribe_async(lambda snap: seen.append((snap.type, dict(snap.payload), threading.current_thread())),
+                              [GameEventType.TURN_END])
+    payload = {"reason": "banked"}
+    el.publish(GameEvent(GameEventType.TURN_END, payload=payload))
+    payload["reason"] = "mutated after publish"
+    el.publish(GameEvent(GameEventType.BANK))
+    assert el.flush_sinks(timeout=5)
+    assert [(t, p) for t, p, _ in seen] == [(GameEventType.TURN_END, {"reason": "banked"})]
+    assert seen[0][2] is not threading.current_thread()
+    assert el.unsubscribe_async(sink, timeout=5)
+    el.publish(GameEvent(GameEventType.TURN_END))
+    assert len(seen) == 1
+
+
+def test_async_sink_drops_oldest_when_full():
+    import threading
+    from farkle.core.event_sink import AsyncEventSink
+    gate = threading.Event()
+    handled = []
+
+    def slow(item):
+        gate.wait(5)
+        handled.append(item)
+    sink = AsyncEventSink(slow, snapshot=lambda e: e.get("n"), maxsize=2)
+    for n in range(5):
+        sink(GameEvent(GameEventType.TURN_END, payload={"n": n}))
+    gate.set()
+    assert sink.flush(timeout=5)
+    # The worker may already hold the first item; everything else beyond two queued is dropped
+    assert handled[-2:] == [3, 4]
+    assert sink.dropped == 5 - len(handled)
+    sink.close(timeout=5)
+
+
+def test_coalesced_subscriber_gets_one_delivery_per_drain():
+    el = EventListener()
+    latest, counted, plain = [], [], []
+    el.subscribe(lambda e: latest.append((e.type, e.coalesced)), coalesce=COALESCE_LATEST)
+    el.subscribe(lambda e: counted.append((e.type, e.coalesced)), coalesce=merge_count)
+    el.subscribe(lambda e: plain.append(e.coalesced), phase=EventPhase.PERSISTENCE)
+
+    def bank(e):
+        if e.type == GameEventType.BANK:
+            for _ in range(3):
+                el.publish(GameEvent(GameEventType.GOAL_FULFILLED))
+            el.publish(GameEvent(GameEventType.TURN_END))
+    el.subscribe(bank)
+    el.publish(GameEvent(GameEventType.BANK))
+    assert latest == [(GameEventType.TURN_END, 5)]
+    assert counted == [(GameEventType.BANK, 1), (GameEventType.GOAL_FULFILLED, 3), (GameEventType.TURN_END, 1)]
+    # Merging copies the event: non-coalescing subscribers still see every event, once
+    assert plain == [1] * 5
+    el.publish(GameEvent(GameEventType.BANK))
+    assert len(latest) == 2
+
+
+def test_unmergeable_events_are_not_lost_and_deferred_coalesce_per_frame():
+    el = EventListener()
+    el.set_deferred_phases({EventPhase.UI})
+    seen, ui = [], []
+    el.subscribe(lambda e: seen.append(e.get("n")), coalesce=lambda held, new: None)
+    el.subscribe(lambda e: ui.append(e.coalesced), phase=EventPhase.UI, coalesce=COALESCE_LATEST)
+    for n in range(3):
+        el.publish(GameEvent(GameEventType.MESSAGE, payload={"n": n}))
+    assert seen == [0, 1, 2] and ui == []
+    assert el.flush_deferred() == 1
+    assert ui == [3]
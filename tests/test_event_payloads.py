@@ -0,0 +1,31 @@
+from farkle.core.event_payloads import DieRolled, PAYLOAD_TYPES, Reward, die_rolled, empty, lock, reward
+from farkle.core.game_event import GameEvent, GameEventType
+
+
+def test_payloads_are_plain_dicts():
+    p = die_rolled(2, 4, 6)
+    ev = GameEvent(GameEventType.DIE_ROLLED, payload=p)
+    assert type(p) is dict
+    assert ev.get("index") == 2 and ev.get("new") == 6
+    assert ev.get("ability") is None and ev.get("missing", 7) == 7
+    assert p == {"index": 2, "old": 4, "new": 6}
+
+
+def test_optional_keys_present_only_when_given():
+    assert die_rolled(0, 1, 5, "reroll")["ability"] == "reroll"
+    assert "rule_key" not in lock(0, 100)
+    assert lock(1, 100, "SingleValue:1")["rule_key"] == "SingleValue:1"
+    assert reward(50, "goal_reward", "Goal", None) == {"amount": 50, "source": "goal_reward", "goal_name": "Goal"}
+    assert empty() == {} and GameEvent(GameEventType.PRE_ROLL, payload=empty()).get("x", 1) == 1
+
+
+def test_payload_types_cover_dice_events():
+    assert PAYLOAD_TYPES[GameEventType.DIE_ROLLED] is DieRolled
+    assert PAYLOAD_TYPES[GameEventType.GOLD_GAINED] is Reward
+
+
+def test_typed_dicts_declare_optional_keys_at_runtime():
+    import typing
+    assert DieRolled.__optional_keys__ == {"ability"}
+    assert DieRolled.__required_keys__ == {"index", "old", "new"}
+    assert typing.get_type_hints(Reward)["amount"] is int
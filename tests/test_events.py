@@ -3,7 +3,7 @@ from farkle.game import Game
 from farkle.ui.settings import WIDTH, HEIGHT
 from farkle.core.game_object import GameObject
 from farkle.core.game_event import GameEventType
-from farkle.core.actions import handle_bank
+from farkle.core.actions import handle_bank, handle_roll
 
 class Collector(GameObject):
     def __init__(self):
@@ -51,5 +51,23 @@ class EventTests(unittest.TestCase):
         self.assertIn(GameEventType.GOAL_FULFILLED, self.collector.events)
         self.assertIn(GameEventType.GOLD_GAINED, self.collector.events)
 
+    def _roll_sequence(self, types):
+        seen = []
+        self.game.event_listener.unsubscribe(self.collector.on_event)
+        self.game.event_listener.subscribe(lambda e: seen.append(e.type), types)
+        handle_roll(self.game)
+        return seen
+
+    def test_roll_batch_fans_out_to_die_rolled_subscribers(self):
+        seen = self._roll_sequence([GameEventType.ROLL_BATCH, GameEventType.DIE_ROLLED,
+                                    GameEventType.POST_ROLL, GameEventType.TURN_ROLL])
+        rolled = len(self.game.dice)
+        self.assertEqual(seen, [GameEventType.ROLL_BATCH] + [GameEventType.DIE_ROLLED] * rolled
+                         + [GameEventType.POST_ROLL, GameEventType.TURN_ROLL])
+
+    def test_roll_without_die_rolled_subscriber_has_no_per_die_events(self):
+        seen = self._roll_sequence([GameEventType.ROLL_BATCH, GameEventType.POST_ROLL, GameEventType.TURN_ROLL])
+        self.assertEqual(seen, [GameEventType.ROLL_BATCH, GameEventType.POST_ROLL, GameEventType.TURN_ROLL])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
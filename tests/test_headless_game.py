@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import pygame
+
+from farkle.core.actions import autoplay_step
+from farkle.core.game_event import GameEvent, GameEventType
+from farkle.game import Game
+from farkle.ui.settings import WIDTH, HEIGHT
+
+
+def test_headless_game_builds_model_without_ui():
+    game = Game.headless(seed=7)
+    assert game.is_headless and game.renderer is None and game.screen is None
+    assert game.ui_buttons == [] and game.choice_window_sprite is None
+    assert all(d.sprite is None for d in game.dice)
+    assert game.level_state.goals and game.ability_manager.abilities
+    game.event_listener.publish(GameEvent(GameEventType.REQUEST_ROLL))
+    steps = 0
+    while steps < 30 and autoplay_step(game):
+        steps += 1
+    assert steps > 0
+
+
+def test_headless_and_rendered_games_deal_the_same_dice():
+    pygame.init()
+    flags = pygame.HIDDEN if hasattr(pygame, 'HIDDEN') else 0
+    screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
+    rendered = Game(screen, pygame.font.Font(None, 24), pygame.time.Clock(), rng_seed=11, skip_god_selection=True)
+    headless = Game.headless(seed=11)
+    for game in (rendered, headless):
+        game.event_listener.publish(GameEvent(GameEventType.REQUEST_ROLL))
+    assert [d.value for d in headless.dice] == [d.value for d in rendered.dice]
+
+
+def test_dice_container_does_not_load_sprites():
+    code = "import sys, farkle.dice.dice_container; print('farkle.ui.sprites.die_sprite' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip().splitlines()[-1] == "False"
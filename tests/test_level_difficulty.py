@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from farkle.level.level import DEFAULT_PROGRESSION, Level, Progression
+from farkle.sim.difficulty import TurnModel, clear_table, difficulty_curve
+
+
+def test_progression_curve_follows_level_advance():
+    rng = random.Random(3)
+    level = Level.single("", DEFAULT_PROGRESSION.first_target, DEFAULT_PROGRESSION.first_turns, rng=rng)
+    expected = []
+    for index in range(1, 9):
+        if index > 1:
+            level = Level.advance(level, index, rng=rng)
+        target = next(t for _, t, disaster, *_ in level.goals if disaster)
+        expected.append((target, level.max_turns))
+    assert DEFAULT_PROGRESSION.curve(8) == expected
+
+
+def test_clear_table_matches_single_turn_distribution():
+    model = TurnModel()
+    table = clear_table(model, 20, 2)
+    # One turn at 300 remaining (6 buckets) clears with the distribution's last entry
+    assert table[1][6] == pytest.approx(model.distribution(6)[-1])
+    assert table[0][0] == table[2][0] == 1.0 and table[0][1] == 0.0
+    # More turns never hurt, more points to score never help
+    assert all(table[2][r] >= table[1][r] for r in range(21))
+    assert all(table[2][r] >= table[2][r + 1] for r in range(20))
+
+
+def test_curve_reacts_to_progression_constants():
+    curve = difficulty_curve(12)
+    assert len(curve) == 12 and curve[0].target == 300
+    assert curve[0].clear_probability > 0.99
+    runs = [level.run_probability for level in curve]
+    assert runs == sorted(runs, reverse=True)
+    easier = difficulty_curve(12, Progression(target_step=200, target_step_per_level=25))
+    assert easier[5].clear_probability > curve[5].clear_probability
+    banker = difficulty_curve(6, policy=400)
+    assert banker[3].clear_probability < curve[3].clear_probability
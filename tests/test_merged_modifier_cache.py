@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from farkle.core.game_event import GameEvent, GameEventType
+from farkle.relics.relic import CharmOfFivesRelic
+from farkle.scoring.score_modifiers import GlobalPartsMultiplier, ScoreModifierChain
+from farkle.scoring.scoring_manager import ScoringManager
+
+
+class DummyGame:
+    def __init__(self):
+        self.relic_manager = Mock()
+        self.relic_manager.active_relics = []
+        self.gods = SimpleNamespace(worshipped=[])
+        self.scoring_manager = ScoringManager(self)
+
+
+def test_merged_chain_reused_until_sources_change():
+    game = DummyGame()
+    sm = game.scoring_manager
+    assert sm.preview([("SingleValue:5", 50)])['adjusted_total'] == 50
+    chain = sm.merged_modifier_chain()
+    sm.preview([("SingleValue:5", 50)])
+    assert sm.merged_modifier_chain() is chain
+    epoch = sm.modifier_epoch
+
+    # Relic appended directly (no events) and activated
+    relic = CharmOfFivesRelic()
+    relic.active = True
+    game.relic_manager.active_relics.append(relic)
+    assert sm.preview([("SingleValue:5", 50)])['adjusted_total'] == 100
+    assert sm.modifier_epoch == epoch + 1
+
+    relic.active = False
+    assert sm.preview([("SingleValue:5", 50)])['adjusted_total'] == 50
+
+
+def test_events_and_god_chains_invalidate():
+    game = DummyGame()
+    sm = game.scoring_manager
+    sm.preview([("SingleValue:1", 100)])
+    epoch = sm.modifier_epoch
+    sm.on_event(GameEvent(GameEventType.SCORE_MODIFIER_ADDED, payload={
+        "modifier_type": "FlatRuleBonus", "data": {"rule_key": "SingleValue:1", "amount": 100}}))
+    assert sm.preview([("SingleValue:1", 100)])['adjusted_total'] == 200
+    assert sm.modifier_epoch > epoch
+
+    god = SimpleNamespace(active=True, modifier_chain=ScoreModifierChain())
+    game.gods.worshipped.append(god)
+    god.modifier_chain.add(GlobalPartsMultiplier(2.0))
+    assert sm.preview([("SingleValue:1", 100)])['adjusted_total'] == 400
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from farkle.relics.relic import DisasterGoalScoreBonusRelic
+from farkle.scoring.score_modifiers import ConditionalScoreModifier, GlobalPartsMultiplier
+from farkle.scoring.scoring_manager import ScoringManager
+
+
+class DummyGame:
+    def __init__(self):
+        self.relic_manager = Mock()
+        self.relic_manager.active_relics = []
+        self.scoring_manager = ScoringManager(self)
+
+
+def test_preview_hits_cache_per_goal_flags():
+    game = DummyGame()
+    sm = game.scoring_manager
+    relic = DisasterGoalScoreBonusRelic()
+    relic.active = True
+    game.relic_manager.active_relics.append(relic)
+    disaster = SimpleNamespace(is_disaster=True)
+    other_disaster = SimpleNamespace(is_disaster=True)
+    petition = SimpleNamespace(is_disaster=False)
+    parts = [("ThreeOfAKind:2", 200), ("SingleValue:5", 50)]
+    first = sm.preview(parts, goal=disaster)
+    assert first['adjusted_total'] == 300
+    assert sm.preview(parts, goal=other_disaster) is first
+    assert sm.preview(parts, goal=petition)['adjusted_total'] == 250
+    stats = sm.preview_stats()
+    assert (stats['hits'], stats['misses']) == (1, 2)
+    with pytest.raises(TypeError):
+        first['adjusted_total'] = 0
+
+
+def test_preview_cache_dropped_on_modifier_change_and_bypassed_for_opaque_predicates():
+    game = DummyGame()
+    sm = game.scoring_manager
+    assert sm.preview([("SingleValue:1", 100)])['adjusted_total'] == 100
+    sm.modifier_chain.add(GlobalPartsMultiplier(2.0))
+    assert sm.preview([("SingleValue:1", 100)])['adjusted_total'] == 200
+    sm.modifier_chain.add(ConditionalScoreModifier(GlobalPartsMultiplier(1.5), predicate=lambda ctx: True))
+    assert sm.preview([("SingleValue:1", 100)])['adjusted_total'] == 300
+    assert sm.preview_stats()['uncached'] == 1
+
+
+def test_compute_from_dice_is_read_only_on_every_path():
+    from farkle.scoring.scoring import create_default_rules
+    game = DummyGame()
+    game.rules = create_default_rules()
+    sm = game.scoring_manager
+    scoring, empty = sm.compute_from_dice([1, 5]), sm.compute_from_dice([2, 3])
+    assert scoring['adjusted_total'] == 150 and empty['adjusted_total'] == 0 and empty['parts'] == ()
+    for result in (scoring, empty):
+        with pytest.raises(TypeError):
+            result['score'] = None
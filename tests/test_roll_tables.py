@@ -0,0 +1,54 @@
+import itertools
+
+import pytest
+
+from farkle.scoring import roll_tables
+from farkle.scoring.roll_tables import compute_roll_tables, load_roll_tables, rules_fingerprint
+from farkle.scoring.scoring import create_default_rules, SingleValue
+
+
+def test_single_die_stats():
+    tables = compute_roll_tables(create_default_rules(), max_dice=1)
+    assert tables.farkle_probability(1) == pytest.approx(4 / 6)
+    assert tables.expected_score(1) == pytest.approx((100 + 50) / 6)
+    assert tables.score_distribution(1) == pytest.approx({0: 4 / 6, 50: 1 / 6, 100: 1 / 6})
+
+
+def test_matches_brute_force_enumeration():
+    rules = create_default_rules()
+    tables = compute_roll_tables(rules, max_dice=4)
+    for n in range(1, 5):
+        scores = [rules.evaluate(list(d))[0] for d in itertools.product(range(1, 7), repeat=n)]
+        assert tables.farkle_probability(n) == pytest.approx(scores.count(0) / len(scores))
+        assert tables.expected_score(n) == pytest.approx(sum(scores) / len(scores))
+        assert sum(tables.score_distribution(n).values()) == pytest.approx(1.0)
+
+
+def test_six_dice_farkle_probability():
+    tables = compute_roll_tables(create_default_rules())
+    # Farkles are rolls of only 2/3/4/6 with no triple: 1440 of 6**6 (three pairs do not score here)
+    assert tables.farkle_probability(6) == pytest.approx(1440 / 6 ** 6)
+
+
+def test_disk_cache_round_trip(tmp_path, monkeypatch):
+    roll_tables.clear_memory_cache()
+    rules = create_default_rules()
+    first = load_roll_tables(rules, max_dice=3, cache_dir=tmp_path)
+    assert list(tmp_path.iterdir())
+    roll_tables.clear_memory_cache()
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("tables should come from disk")
+
+    monkeypatch.setattr(roll_tables, "compute_roll_tables", _fail)
+    second = load_roll_tables(rules, max_dice=3, cache_dir=tmp_path)
+    assert second == first
+    roll_tables.clear_memory_cache()
+
+
+def test_fingerprint_tracks_rule_changes():
+    rules = create_default_rules()
+    before = rules_fingerprint(rules)
+    assert rules_fingerprint(create_default_rules()) == before
+    rules.add_rule(SingleValue(2, 20))
+    assert rules_fingerprint(rules) != before
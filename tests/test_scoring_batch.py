@@ -0,0 +1,65 @@
+import itertools
+
+import pytest
+
+from farkle.scoring.scoring import create_default_rules, ScoringRule, SingleValue
+
+np = pytest.importorskip("numpy")
+
+
+def _assert_batch_matches(rules, rolls):
+    totals, used, rule_ids = rules.evaluate_batch(rolls)
+    assert totals.shape == (len(rolls),)
+    assert used.shape == rolls.shape
+    for row, total, mask, ids in zip(rolls, totals, used, rule_ids):
+        exp_total, exp_used, exp_breakdown = rules.evaluate([int(v) for v in row])
+        assert int(total) == exp_total
+        assert list(np.flatnonzero(mask)) == exp_used
+        keys = [rules.rules[i].rule_key for i in ids if i >= 0]
+        assert keys == [rk for rk, _ in exp_breakdown]
+
+
+@pytest.mark.parametrize("k", [1, 2, 3, 4, 5])
+def test_batch_matches_evaluate_exhaustive(k):
+    rules = create_default_rules()
+    rolls = np.array(list(itertools.product(range(1, 7), repeat=k)))
+    _assert_batch_matches(rules, rolls)
+
+
+def test_batch_matches_evaluate_six_dice_including_straights():
+    rules = create_default_rules()
+    rng = np.random.default_rng(7)
+    rolls = rng.integers(1, 7, size=(4000, 6))
+    rolls[:3] = [[6, 5, 4, 3, 2, 1], [1, 1, 1, 1, 1, 1], [2, 3, 4, 6, 6, 2]]
+    _assert_batch_matches(rules, rolls)
+    # 5-dice partial straights in any order
+    five = np.array([[5, 3, 1, 2, 4], [6, 2, 5, 3, 4], [1, 2, 3, 4, 6]])
+    totals, _, _ = rules.evaluate_batch(five)
+    assert list(totals) == [1000, 1000, 100]
+
+
+def test_batch_large_pool_and_rule_changes():
+    rules = create_default_rules()
+    rng = np.random.default_rng(3)
+    _assert_batch_matches(rules, rng.integers(1, 7, size=(300, 10)))
+    before, _, _ = rules.evaluate_batch(np.array([[2, 2, 3]]))
+    rules.add_rule(SingleValue(2, 20))
+    after, _, _ = rules.evaluate_batch(np.array([[2, 2, 3]]))
+    assert int(before[0]) == 0 and int(after[0]) == 40
+
+
+def test_batch_falls_back_for_positional_rules():
+    class FirstDieSix(ScoringRule):
+        combo_size = 1
+
+        def match(self, dice):
+            return (60, [0]) if dice and dice[0] == 6 else (0, [])
+
+    rules = create_default_rules()
+    rules.add_rule(FirstDieSix())
+    _assert_batch_matches(rules, np.array([[6, 2, 2], [2, 6, 2], [1, 6, 5]]))
+
+
+def test_batch_rejects_invalid_faces():
+    with pytest.raises(ValueError):
+        create_default_rules().evaluate_batch(np.array([[0, 1, 2]]))
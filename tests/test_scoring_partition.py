@@ -0,0 +1,47 @@
+from farkle.scoring.scoring import create_default_rules, ScoringRules, SingleValue, ThreeOfAKind
+
+
+def test_larger_pool_uses_repeated_combos():
+    rules = create_default_rules()
+    total, used, breakdown = rules.evaluate([1] * 9)
+    # Greedy ordering would stop at six-of-a-kind plus three singles (4300)
+    assert total == 5000
+    assert used == list(range(9))
+    assert breakdown == [("SixOfAKind:1", 4000), ("ThreeOfAKind:1", 1000)]
+
+
+def test_two_triples_of_same_face_in_large_pool():
+    rules = create_default_rules()
+    total, used, breakdown = rules.evaluate([2, 2, 2, 3, 2, 2, 2, 4])
+    assert total == 800  # six 2s beat two separate triples (400)
+    assert breakdown == [("SixOfAKind:2", 800)]
+    assert used == [0, 1, 2, 4, 5, 6]
+
+
+def test_best_partition_beats_bigger_combo():
+    rules = ScoringRules()
+    rules.add_rule(ThreeOfAKind(1, 250))
+    rules.add_rule(SingleValue(1, 100))
+    total, used, breakdown = rules.evaluate([1, 1, 1])
+    assert total == 300
+    assert breakdown == [("SingleValue:1", 300)]
+    assert used == [0, 1, 2]
+
+
+def test_straights_only_count_as_whole_roll():
+    rules = create_default_rules()
+    # Partial straight inside a longer roll is not a straight (matches Straight*.match semantics)
+    total, _, breakdown = rules.evaluate([1, 2, 3, 4, 5, 5])
+    assert total == 200
+    assert [k for k, _ in breakdown] == ["SingleValue:1", "SingleValue:5"]
+    total, _, breakdown = rules.evaluate([6, 1, 5, 2, 4, 3])
+    assert (total, breakdown) == (1500, [("Straight6", 1500)])
+
+
+def test_partition_memo_reset_on_rule_change():
+    rules = create_default_rules()
+    rules.evaluate([1] * 8)
+    assert rules._partition_memo
+    rules.add_rule(SingleValue(2, 20))
+    assert not rules._partition_memo
+    assert rules.evaluate([2, 2, 1])[0] == 140
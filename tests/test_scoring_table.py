@@ -0,0 +1,60 @@
+import itertools
+import random
+
+from farkle.scoring.scoring import create_default_rules, ScoringRule, SingleValue, Straight6
+
+
+def test_table_matches_reference_for_all_small_rolls():
+    rules = create_default_rules()
+    for n in range(0, 6):
+        for dice in itertools.product(range(1, 7), repeat=n):
+            dice = list(dice)
+            assert rules.evaluate(dice) == rules._evaluate_greedy(dice), dice
+
+
+def test_table_matches_reference_for_six_dice_sample():
+    rules = create_default_rules()
+    rng = random.Random(1234)
+    for _ in range(3000):
+        dice = [rng.randint(1, 6) for _ in range(6)]
+        assert rules.evaluate(dice) == rules._evaluate_greedy(dice), dice
+    # 462 multisets of six dice at most, regardless of how many orderings were scored
+    assert len(rules._table) <= 462 + 1
+
+
+def test_table_invalidated_on_rule_changes():
+    rules = create_default_rules()
+    assert rules.evaluate([2, 2, 3]) == (0, [], [])
+    version = rules.version
+    rules.add_rule(SingleValue(2, 20))
+    assert rules.version > version
+    assert rules.evaluate([2, 2, 3]) == (40, [0, 1], [("SingleValue:2", 40)])
+    rules.remove_rule(Straight6)
+    assert rules.evaluate([6, 5, 4, 3, 2, 1])[0] != 1500
+
+
+def test_non_order_invariant_rule_bypasses_table():
+    class FirstDieSix(ScoringRule):
+        combo_size = 1
+
+        def match(self, dice):
+            return (60, [0]) if dice and dice[0] == 6 else (0, [])
+
+    rules = create_default_rules()
+    rules.add_rule(FirstDieSix())
+    assert rules.evaluate([6, 2])[0] == 60
+    assert rules.evaluate([2, 6])[0] == 0
+
+
+def test_classify_selection_matches_separate_queries_and_caches():
+    rules = create_default_rules()
+    assert rules.classify_selection([1, 1, 1]) == (True, "ThreeOfAKind:1", 1000)
+    assert rules.classify_selection([5, 1]) == (False, None, 150)
+    assert rules.classify_selection([]) == (False, None, 0)
+    single, rule_key, raw = rules.classify_selection([6, 5, 4, 3, 2])
+    assert (single, rule_key) == (True, "Straight2to6") and raw == rules.evaluate([2, 3, 4, 5, 6])[0]
+    assert (6, 5, 4, 3, 2) not in rules._selection_lru
+    assert (2, 3, 4, 5, 6) in rules._selection_lru
+    rules.add_rule(SingleValue(2, 20))
+    assert not rules._selection_lru
+    assert rules.classify_selection([2]) == (True, "SingleValue:2", 20)
@@ -0,0 +1,40 @@
+from farkle.game import Game
+from farkle.relics.relic_manager import offer_pool
+from farkle.sim.balance import GODS, Loadout, analyze_balance, loadouts
+
+
+def test_loadouts_cover_offer_pool_and_gods():
+    singles = loadouts()
+    assert singles[0] == Loadout() and singles[0].label == "baseline"
+    assert len(singles) == 1 + len(offer_pool()) + len(GODS)
+    grid = loadouts(grid=True)
+    assert len(grid) == len(singles) + len(offer_pool()) * len(GODS)
+    assert Loadout(god="Ares", relic="CharmOfOnesRelic").label == "Ares + CharmOfOnesRelic"
+
+
+def test_loadout_grants_god_and_relic():
+    game = Game.headless(seed=2)
+    Loadout(god="Hermes", relic="CharmOfFivesRelic")(game)
+    assert [g.name for g in game.gods.worshipped] == ["Hermes"]
+    assert [r.name for r in game.relic_manager.active_relics] == ["Charm of Fives"]
+
+
+def test_paired_report_ranks_every_loadout():
+    report = analyze_balance(runs=2, seed=3, workers=1, max_levels=2)
+    assert report.baseline.loadout == Loadout() and report.baseline.runs == 2
+    assert len(report.effects) == len(loadouts()) - 1
+    ranked = report.ranked()
+    assert [e.d_levels.mean for e in ranked] == sorted((e.d_levels.mean for e in ranked), reverse=True)
+    assert all(e.d_score_per_turn.n == 2 for e in ranked)
+    data = report.to_dict(by="score_per_turn")
+    assert data["ranked"][0]["delta_score_per_turn"]["mean"] >= data["ranked"][-1]["delta_score_per_turn"]["mean"]
+    assert "baseline" in report.format()
+
+
+def test_cli_modules_are_not_imported_with_the_package():
+    import subprocess
+    import sys
+    # Eager imports from farkle.sim made runpy warn and execute the module twice
+    for module in ("farkle.sim.balance", "farkle.sim.difficulty"):
+        done = subprocess.run([sys.executable, "-W", "error", "-m", module, "--help"], capture_output=True, text=True)
+        assert done.returncode == 0, done.stderr
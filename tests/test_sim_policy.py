@@ -0,0 +1,59 @@
+from farkle.core.game_event import GameEventType
+from farkle.game import Game
+from farkle.sim import Action, Policy, SolverPolicy, ThresholdPolicy, apply_action, observe, run_tournament, wilson_interval
+
+
+def test_observation_and_actions_drive_the_request_path():
+    game = Game.headless(seed=3, skip_god_selection=False)
+    obs = observe(game)
+    assert obs.window is not None and obs.window.window_type == 'god_selection'
+    assert apply_action(game, Action.choose(0))
+    assert len(game.gods.worshipped) == 1
+    seen = []
+    game.event_listener.subscribe(lambda e: seen.append(e.type))
+    assert apply_action(game, Action.roll())
+    assert GameEventType.REQUEST_ROLL in seen
+    obs = observe(game)
+    assert obs.state == 'ROLLING' and obs.window is None
+    assert len(obs.dice) == len(obs.held) == 6 and not any(obs.held)
+    hint = obs.hint()
+    assert hint["action"] == "lock"
+    assert apply_action(game, Action.lock(hint["combos"][0]))
+    assert observe(game).turn_score > 0
+    # A refused action reports False and leaves the game untouched
+    assert not apply_action(game, Action.lock([7]))
+    assert not apply_action(game, Action.switch_goal(99))
+
+
+class _Stubborn(Policy):
+    name = "stubborn"
+
+    def act(self, obs):
+        if obs.window is not None:
+            return Action.skip() if obs.window.allow_skip else Action.choose(0)
+        return Action.bank()
+
+
+def test_tournament_plays_the_same_seeds_and_ranks_by_wins():
+    result = run_tournament([SolverPolicy(), ThresholdPolicy(300), _Stubborn()], runs=3, seed=4, workers=1, max_levels=2)
+    assert [s.runs for s in result.standings] == [3, 3, 3]
+    assert abs(sum(s.wins for s in result.standings) - 3) < 1e-9
+    # The bot that never rolls cannot score, so it cannot win
+    stubborn = next(s for s in result.standings if s.name == "stubborn")
+    assert stubborn.wins == 0 and stubborn.summary.mean('score') == 0
+    assert result.standings[0].win_rate >= result.standings[-1].win_rate
+    lo, hi = result.standings[0].win_interval
+    assert 0 <= lo <= result.standings[0].win_rate <= hi <= 1
+
+
+def test_tournament_without_seed_shares_one_random_seed_list():
+    result = run_tournament([ThresholdPolicy(300), ThresholdPolicy(500)], runs=2, seed=None, workers=1, max_levels=2)
+    assert result.seed is None
+    assert [s.runs for s in result.standings] == [2, 2]
+    assert abs(sum(s.wins for s in result.standings) - 2) < 1e-9
+
+
+def test_wilson_interval():
+    assert wilson_interval(0, 0) == (0.0, 0.0)
+    lo, hi = wilson_interval(50, 100)
+    assert abs((lo + hi) / 2 - 0.5) < 1e-9 and 0.40 < lo < 0.41
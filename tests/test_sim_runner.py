@@ -0,0 +1,44 @@
+from farkle.core.random_source import RandomSource
+from farkle.sim import RunResult, SimSummary, play_run, run_simulation
+
+
+def test_play_run_goes_through_god_selection_levels_and_shop():
+    result = play_run(RandomSource(4).derive_seeds(1)[0], max_levels=3)
+    assert result.steps > 0 and result.turns > 0
+    assert result.levels_reached >= 1 and result.score > 0
+    # Survivors count one past the horizon, so they never tie a loss on the last level
+    assert result.levels_reached == result.levels_cleared + 1
+    assert result.survived == (result.levels_reached == 4)
+    # Same seed, same run
+    assert play_run(result.seed, max_levels=3) == result
+
+
+def test_simulation_results_do_not_depend_on_worker_count():
+    inline: list[RunResult] = []
+    summary = run_simulation(4, seed=9, workers=1, max_levels=2, on_result=inline.append)
+    sharded: list[RunResult] = []
+    parallel = run_simulation(4, seed=9, workers=2, max_levels=2, shard_size=1, on_result=sharded.append)
+    assert sorted(inline) == sorted(sharded)
+    assert [r.seed for r in inline] == RandomSource(9).derive_seeds(4)
+    assert summary.runs == parallel.runs == 4
+    # Folded in seed order: identical down to float sums and the "best" tie-break
+    assert summary.to_dict() == parallel.to_dict()
+
+
+def test_headless_runs_through_shops_print_nothing(capsys):
+    import farkle.game  # noqa: F401  (pygame prints its banner on first import)
+    capsys.readouterr()
+    result = play_run(RandomSource(4).derive_seeds(1)[0], max_levels=3)
+    assert result.levels_cleared >= 1
+    assert capsys.readouterr().out == ""
+
+
+def test_summary_aggregates_incrementally():
+    summary = SimSummary()
+    summary.add(RunResult(1, 2, 1, 500, 10, 1, 0, 4, 30, False))
+    summary.add(RunResult(2, 4, 3, 1500, 30, 3, 2, 8, 60, True))
+    data = summary.to_dict()
+    assert data["runs"] == 2 and data["survived"] == 1
+    assert data["score"]["mean"] == 1000 and data["score"]["min"] == 500 and data["score"]["max"] == 1500
+    assert data["level_histogram"] == {2: 1, 4: 1}
+    assert data["best"]["seed"] == 2
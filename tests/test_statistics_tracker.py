@@ -92,12 +92,15 @@ class StatisticsTrackerTests(unittest.TestCase):
         
     def test_dice_rolled_counting(self):
         """Statistics tracker should count dice rolled."""
-        # Emit die rolled events (6 dice)
-        for _ in range(6):
-            self.game.event_listener.publish(GameEvent(GameEventType.DIE_ROLLED))
+        from farkle.core.event_payloads import roll_batch
+        # A full roll (6 dice), then a reroll of two
+        self.game.event_listener.publish(GameEvent(GameEventType.ROLL_BATCH, payload=roll_batch(
+            [0, 1, 2, 3, 4, 5], [1] * 6, [2] * 6, [False] * 6)))
+        self.game.event_listener.publish(GameEvent(GameEventType.ROLL_BATCH, payload=roll_batch(
+            [4, 5], [2, 2], [3, 3], [True] * 4 + [False] * 2)))
         
         stats = self.game.statistics_tracker.get_statistics()
-        self.assertGreaterEqual(stats.dice_rolled, 6)
+        self.assertEqual(stats.dice_rolled, 8)
         
     def test_relic_purchase_counting(self):
         """Statistics tracker should count relics purchased."""
@@ -162,6 +165,15 @@ class StatisticsTrackerTests(unittest.TestCase):
         self.assertEqual(stats.total_gold_gained, 0)
         self.assertEqual(len(stats.gold_events), 0)
 
+    def test_roll_is_counted_from_one_batch_without_per_die_events(self):
+        """A roll reaches the tracker once, as ROLL_BATCH, and counts every die."""
+        from farkle.core.event_payloads import roll_batch
+        profiler = self.game.event_listener.enable_profiling()
+        self.game.event_listener.publish(GameEvent(GameEventType.ROLL_BATCH, payload=roll_batch(
+            [0, 1, 2, 3, 4, 5], [1] * 6, [2] * 6, [False] * 6)))
+        self.assertEqual(self.game.statistics_tracker.get_statistics().dice_rolled, 6)
+        self.assertEqual(profiler.snapshot()['subscribers']['StatisticsTracker.on_event']['calls'], 1)
+        self.assertNotIn('DIE_ROLLED', profiler.publish_counts)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,93 @@
+import pygame
+import pytest
+
+from farkle.core.actions import autoplay_step, turn_hint, turn_solver
+from farkle.core.game_event import GameEventType
+from farkle.game import Game
+from farkle.scoring.scoring import SingleValue, create_default_rules
+from farkle.scoring.turn_solver import TurnSolver
+from farkle.ui.settings import WIDTH, HEIGHT
+
+
+def test_single_die_values_match_hand_computation():
+    solver = TurnSolver(create_default_rules(), dice_count=1, first_roll_rescue=False)
+    policy = solver.solve(target=100)
+    # From 50: rolling reaches the target with a 1 or 5 (2/6 * 100) < banking 50
+    assert policy.should_bank(1, 50)
+    assert policy.expected(1, 50) == pytest.approx(50)
+    # From 0: a 1 reaches 100, a 5 banks 50
+    assert policy.expected(1, 0) == pytest.approx(100 / 6 + 50 / 6)
+
+
+def test_target_policy_banks_once_target_reached():
+    solver = TurnSolver(create_default_rules())
+    policy = solver.solve(target=500)
+    for dice in range(1, 7):
+        assert policy.should_bank(dice, 500)
+    assert not policy.should_bank(6, 100)
+    assert not policy.should_bank(3, 0)
+
+
+def test_distribution_matches_expected_value():
+    solver = TurnSolver(create_default_rules())
+    for target in (None, 300, 1000):
+        policy = solver.solve(target=target)
+        dist = solver.distribution(policy)
+        assert len(dist) == policy.top + 1
+        assert sum(dist) == pytest.approx(1.0)
+        mean = sum(policy.reward(i * policy.bucket) * p for i, p in enumerate(dist))
+        assert mean == pytest.approx(policy.expected(6, 0), rel=1e-3)
+    # Single die, no rescue: a 1 reaches the 100 target, a 5 banks 50 and the rest farkle
+    single = TurnSolver(create_default_rules(), dice_count=1, first_roll_rescue=False)
+    assert single.distribution(single.solve(target=100)) == pytest.approx([4 / 6, 1 / 6, 1 / 6])
+
+
+def test_choose_lock_prefers_big_combos_and_straights():
+    solver = TurnSolver(create_default_rules())
+    policy = solver.solve()
+    assert sorted(solver.choose_lock(policy, [1, 2, 3, 4, 5, 6], 0).values) == [1, 2, 3, 4, 5, 6]
+    choice = solver.choose_lock(policy, [1, 1, 1, 2, 3, 4], 0)
+    assert choice.values == [1, 1, 1]
+    assert solver.choose_lock(policy, [2, 3, 4, 6, 6, 2], 0) is None
+
+
+def test_policies_cached_and_resolved_on_modifier_or_rule_change():
+    rules = create_default_rules()
+    solver = TurnSolver(rules)
+    base = solver.solve()
+    assert solver.solve() is base
+    assert solver.solves == 1
+    boosted = solver.solve(lambda rule_key, raw: raw * 2 if rule_key == "SingleValue:5" else raw)
+    assert solver.solves == 2
+    assert boosted.expected(6, 0) > base.expected(6, 0)
+    rules.add_rule(SingleValue(2, 50))
+    again = solver.solve()
+    assert solver.solves == 3
+    assert again.expected(3, 0) > base.expected(3, 0)
+
+
+def test_solve_many_serial_matches_solve():
+    solver = TurnSolver(create_default_rules())
+    results = solver.solve_many([300, 1000])
+    assert results[1000].expected(6, 0) == pytest.approx(solver.solve(target=1000).expected(6, 0))
+    assert results[300].expected(6, 0) < results[1000].expected(6, 0)
+
+
+def test_autoplay_drives_turns_through_actions():
+    pygame.init()
+    flags = pygame.HIDDEN if hasattr(pygame, 'HIDDEN') else 0
+    screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
+    game = Game(screen, pygame.font.Font(None, 24), pygame.time.Clock(), rng_seed=3, skip_god_selection=True)
+    seen = []
+    game.event_listener.subscribe(lambda e: seen.append(e.type))
+    hint = turn_hint(game)
+    assert hint["action"] == "roll"
+    # Six dice farkle 5/162 of the time under the default rules (no three-pairs rule)
+    assert hint["farkle_risk"] == pytest.approx(5 / 162)
+    assert hint["farkle_risk"] == turn_solver(game).roll_tables().farkle_probability(6)
+    for _ in range(60):
+        if not autoplay_step(game):
+            break
+    assert GameEventType.LOCK in seen
+    assert GameEventType.BANK in seen or GameEventType.FARKLE in seen
+    assert turn_solver(game) is game.turn_solver